@@ -0,0 +1,74 @@
+"""
+Measures the peak memory (tracemalloc) of the analysis of a synthetic project, and the memory retained by the
+project model (frameworks, submodules and parsed files) once the analysis is completed.
+
+Usage: python3 benchmarks/memory_benchmark.py [n_of_files] [--counts-only] [--stream]
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from swift_code_metrics._analyzer import Inspector  # noqa: E402
+
+FRAMEWORKS = 40
+FOLDERS_PER_FRAMEWORK = 25
+
+
+def swift_file(i: int) -> str:
+    declarations = '\n'.join(f'    func method{i}_{m}(value: Int) -> Int {{\n        return value\n    }}'
+                             for m in range(8))
+    return f"""import Foundation
+import UIKit
+import Framework{i % FRAMEWORKS}
+
+// Synthetic file {i}
+protocol Protocol{i} {{
+    func method{i}()
+}}
+
+struct Struct{i} {{
+    let value: Int
+}}
+
+class Class{i}: Protocol{i} {{
+{declarations}
+    func testMethod{i}() {{
+    }}
+}}
+"""
+
+
+def generate_project(directory: str, n_of_files: int):
+    for i in range(n_of_files):
+        framework = f'Framework{i % FRAMEWORKS}'
+        folder = os.path.join(directory, framework, f'Folder{(i // FRAMEWORKS) % FOLDERS_PER_FRAMEWORK}')
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f'File{i}.swift'), 'w') as f:
+            f.write(swift_file(i))
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    n_of_files = int(args[0]) if len(args) > 0 else 20000
+    options = {'counts_only': '--counts-only' in sys.argv, 'stream': '--stream' in sys.argv}
+
+    with tempfile.TemporaryDirectory() as directory:
+        generate_project(os.path.join(directory, 'project'), n_of_files)
+        tracemalloc.start()
+        inspector = Inspector(os.path.join(directory, 'project'), os.path.join(directory, 'artifacts'),
+                              ['Test', 'Tests'], [], jobs=1, **options)
+        inspector.analyze()
+        inspector.report = None
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f'Files analyzed:  {n_of_files}')
+    print(f'Peak memory:     {peak / 1024 / 1024:,.1f} MB')
+    print(f'Retained model:  {retained / 1024 / 1024:,.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
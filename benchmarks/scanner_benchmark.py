@@ -0,0 +1,87 @@
+"""
+Compares the throughput (lines/sec) of the single-pass `LineScanner` with the
+original per-pattern parsing loop of `SwiftFileParser.parse`.
+
+Usage: python3 benchmarks/scanner_benchmark.py [repetitions]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from swift_code_metrics._helpers import ParsingHelpers  # noqa: E402
+from swift_code_metrics._scanner import LineScanner, ScannedContent  # noqa: E402
+
+RESOURCES = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..',
+                         'swift_code_metrics', 'tests', 'test_resources')
+
+
+def legacy_scan(lines):
+    content = ScannedContent()
+    attributes_regex_map = {
+        ParsingHelpers.IMPORTS: content.imports,
+        ParsingHelpers.PROTOCOLS: content.interfaces,
+        ParsingHelpers.STRUCTS: content.structs,
+        ParsingHelpers.CLASSES: content.classes,
+        ParsingHelpers.FUNCS: content.methods,
+    }
+    commented_line = False
+    for line in lines:
+        trimmed = line.strip()
+        if len(trimmed) == 0:
+            continue
+        if ParsingHelpers.check_existence(ParsingHelpers.SINGLE_COMMENT, trimmed):
+            content.n_of_comments += 1
+            continue
+        if ParsingHelpers.check_existence(ParsingHelpers.BEGIN_COMMENT, trimmed):
+            commented_line = True
+            content.n_of_comments += 1
+        if ParsingHelpers.check_existence(ParsingHelpers.END_COMMENT, trimmed):
+            if not commented_line:
+                content.n_of_comments += 1
+            commented_line = False
+            continue
+        if commented_line:
+            content.n_of_comments += 1
+            continue
+        content.loc += 1
+        for key, value in attributes_regex_map.items():
+            extracted_value = ParsingHelpers.extract_substring_with_pattern(key, trimmed)
+            if len(extracted_value) > 0:
+                value.append(extracted_value)
+    return content
+
+
+def load_lines():
+    lines = []
+    for subdir, _, files in os.walk(RESOURCES):
+        for file in sorted(files):
+            if file.endswith('.swift'):
+                with open(os.path.join(subdir, file), encoding='utf-8') as f:
+                    lines.extend(f.readlines())
+    return lines
+
+
+def measure(scan, lines):
+    start = time.perf_counter()
+    result = scan(lines)
+    return len(lines) / (time.perf_counter() - start), result
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    lines = load_lines() * repetitions
+
+    legacy_speed, legacy_result = measure(legacy_scan, lines)
+    scanner_speed, scanner_result = measure(LineScanner.scan, lines)
+    assert legacy_result == scanner_result, 'The scanner results differ from the legacy parser'
+
+    print(f'Lines scanned:  {len(lines)}')
+    print(f'Legacy parser:  {legacy_speed:,.0f} lines/sec')
+    print(f'LineScanner:    {scanner_speed:,.0f} lines/sec')
+    print(f'Speedup:        {scanner_speed / legacy_speed:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,7 @@ with open("README.md", "r") as fh:
 
 install_requires = [
     "matplotlib > 2",
-    "adjustText",
+    "adjustText>=1.0",
     "pygraphviz > 1.5",
     "pyfunctional > 1.2",
     "numpy > 1.22.0",
@@ -1,66 +1,238 @@
 import os
-import json
+import sys
 
-from ._helpers import AnalyzerHelpers
+from ._cache import ParseCache
+from ._flat_export import FlatExport
+from ._helpers import AnalyzerHelpers, ParsingHelpers
+from ._parallel import ParallelParser
+from ._incremental import IncrementalAnalysis, ProjectModel
 from ._parser import SwiftFileParser, SwiftFile
 from ._metrics import Framework, SubModule
 from ._report import ReportProcessor
+from ._report_writer import ReportWriter
+from ._snapshot import MetricsSnapshot
+from ._walker import SwiftFilesWalker
 from functional import seq
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 
 class Inspector:
-    def __init__(self, directory: str, artifacts: str, tests_default_suffixes: List[str], exclude_paths: List[str]):
+    def __init__(self,
+                 directory: str,
+                 artifacts: str,
+                 tests_default_suffixes: List[str],
+                 exclude_paths: List[str],
+                 jobs: int = 1,
+                 cache_dir: Optional[str] = None,
+                 cache_size_mb: int = ParseCache.DEFAULT_MAX_SIZE_MB,
+                 model_path: Optional[str] = None,
+                 since: Optional[str] = None,
+                 keep_model: bool = False,
+                 include_hidden: bool = False,
+                 walk_threads: int = 1,
+                 counts_only: bool = False,
+                 stream: bool = False,
+                 compact_json: bool = False,
+                 gzip_json: bool = False,
+                 output_formats: Optional[List[str]] = None,
+                 flat_export: Optional[str] = None,
+                 json_index: bool = False):
         self.exclude_paths = exclude_paths
         self.directory = directory
         self.artifacts = artifacts
         self.tests_default_suffixes = tests_default_suffixes
+        self.jobs = jobs
+        self.cache_dir = cache_dir
+        self.cache_size_mb = cache_size_mb
+        self.model_path = model_path
+        self.since = since
+        self.keep_model = keep_model or model_path is not None
+        self.model = None
         self.frameworks = []
+        # Index of `frameworks` by name
+        self.__frameworks_by_name = {}
         self.shared_code = {}
+        self.snapshot = None
         self.report = None
+        self.__parsed_files = {}
+        self.include_hidden = include_hidden
+        # In streaming mode the parsed files are folded in the submodules and dropped, so their names are never needed
+        self.stream = stream
+        self.counts_only = counts_only or stream
+        self.__report_writers = [ReportWriter.create(f,
+                                                     compact_json=compact_json,
+                                                     gzip_json=gzip_json,
+                                                     json_index=json_index)
+                                 for f in (output_formats or [ReportWriter.JSON])]
+        # Format of the flat export of the files and submodules (None to disable it)
+        self.flat_export = flat_export
+        self.__flat_export = None
+        self.__walker = SwiftFilesWalker(exclude_paths, include_hidden=include_hidden, threads=walk_threads)
 
     def analyze(self) -> bool:
         if self.directory is not None:
             # Initialize report
-            self.__analyze_directory(self.directory, self.exclude_paths, self.tests_default_suffixes)
-            if len(self.frameworks) > 0:
-                self.report = ReportProcessor.generate_report(self.frameworks, self.shared_code)
-                self._save_report(self.artifacts)
-                return True
+            self.__open_flat_export()
+            try:
+                self.__analyze_directory(self.directory, self.exclude_paths, self.tests_default_suffixes)
+                return self.__generate_report()
+            finally:
+                self.__abort_flat_export()
         return False
 
+    def update(self, paths: Iterable[str]) -> bool:
+        """
+        Updates the model of the previous analysis (requires `keep_model`) with the changed paths.
+        Only the swift files added or modified are parsed again.
+        :param paths: The changed paths: swift files, project paths overrides or directories (created or removed)
+        :return: True if the report has been updated
+        """
+        directory = self.directory
+        updated_paths = set()
+        deleted_paths = set()
+        for path in paths:
+            relative_path = os.path.relpath(path, directory)
+            if relative_path.endswith(AnalyzerHelpers.SWIFT_FILE_EXTENSION):
+                (updated_paths if os.path.isfile(path) else deleted_paths).add(relative_path)
+            elif os.path.basename(path) == ParsingHelpers.FRAMEWORK_STRUCTURE_OVERRIDE_FILE:
+                # The frameworks of all the files have to be inferred again
+                self.__parsed_files.clear()
+            else:
+                # Directory created or removed
+                prefix = '' if relative_path == '.' else relative_path + '/'
+                deleted_paths.update(p for p in self.model.files.keys() if p.startswith(prefix))
+                updated_paths.update(os.path.relpath(f, directory) for f, _ in self.__walker.files(path))
+
+        for path in deleted_paths | updated_paths:
+            self.model.files.pop(path, None)
+            self.__parsed_files.pop(path, None)
+        files = [Inspector.__source_file(directory, p)
+                 for p in sorted(updated_paths, key=AnalyzerHelpers.walk_order_key)]
+        self.__parse_files(directory,
+                           [f for f in files if self.__walker.includes(directory, f[1])],
+                           self.tests_default_suffixes)
+
+        self.frameworks = []
+        self.__frameworks_by_name = {}
+        self.shared_code = {}
+        self.__open_flat_export()
+        try:
+            self.__analyze_model(directory, self.tests_default_suffixes)
+            self.__cleanup_external_dependencies()
+            return self.__generate_report()
+        finally:
+            self.__abort_flat_export()
+
     def filtered_frameworks(self, is_test=False) -> List['Framework']:
         return seq(self.frameworks) \
             .filter(lambda f: f.is_test_framework == is_test) \
             .list()
 
     def _save_report(self, directory: str):
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-        with open(os.path.join(directory, 'output.json'), 'w') as fp:
-            json.dump(self.report.as_dict, fp, indent=4)
+        for writer in self.__report_writers:
+            writer.write(self.report, directory)
+
+    def __open_flat_export(self):
+        if self.flat_export is not None:
+            self.__flat_export = FlatExport(self.artifacts, self.flat_export)
+
+    def __abort_flat_export(self):
+        # The export is still open only if the analysis was interrupted
+        if self.__flat_export is not None:
+            self.__flat_export.abort()
+            self.__flat_export = None
+
+    def __generate_report(self) -> bool:
+        if self.__flat_export is not None:
+            self.__flat_export.close(self.frameworks)
+            self.__flat_export = None
+        if len(self.frameworks) > 0:
+            self.snapshot = MetricsSnapshot.build(self.frameworks)
+            self.report = ReportProcessor.generate_report(self.frameworks, self.shared_code, self.snapshot)
+            self._save_report(self.artifacts)
+            return True
+        return False
 
     # Directory inspection
 
     def __analyze_directory(self, directory: str, exclude_paths: List[str], tests_default_paths: List[str]):
-        for subdir, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(AnalyzerHelpers.SWIFT_FILE_EXTENSION) and \
-                        not AnalyzerHelpers.is_path_in_list(subdir, exclude_paths):
-                    full_path = os.path.join(subdir, file)
-                    swift_files = SwiftFileParser(file=full_path,
-                                                  base_path=directory,
-                                                  current_subdir=subdir,
-                                                  tests_default_paths=tests_default_paths).parse()
-                    for swift_file in swift_files:
-                        self.__append_dependency(swift_file)
-                        self.__process_shared_file(swift_file, full_path)
+        base_model = None
+        if self.since is not None:
+            base_model = IncrementalAnalysis.load_base_model(directory, self.model_path, self.since)
+
+        if base_model is None:
+            self.model = ProjectModel() if self.keep_model else None
+            files = self.__walker.iter_files(directory) if self.stream else self.__walker.files(directory)
+        else:
+            self.model, updated_paths = base_model
+            files = [Inspector.__source_file(directory, p)
+                     for p in sorted(updated_paths, key=AnalyzerHelpers.walk_order_key)]
+            files = [f for f in files if self.__walker.includes(directory, f[1])]
+
+        self.__parse_files(directory, files, tests_default_paths)
+
+        if self.model is not None:
+            self.__analyze_model(directory, tests_default_paths)
+            if self.model_path is not None and self.since is None:
+                self.model.revision = IncrementalAnalysis.current_revision(directory)
+                self.model.save(self.model_path)
 
         self.__cleanup_external_dependencies()
 
+    def __parse_files(self, directory: str, files: Iterable[Tuple[str, str]], tests_default_paths: List[str]):
+        """
+        Parses the files, adding them to the model (if any) or directly to the frameworks.
+        """
+        cache = None if self.cache_dir is None else ParseCache(self.cache_dir, max_size_mb=self.cache_size_mb)
+        try:
+            parser = ParallelParser(base_path=directory,
+                                    tests_default_paths=tests_default_paths,
+                                    jobs=self.jobs,
+                                    cache=cache,
+                                    counts_only=self.counts_only)
+            results = parser.stream(files) if self.stream else parser.parse(files)
+            for full_path, content, swift_files in results:
+                if self.model is None:
+                    self.__append_swift_files(full_path, swift_files)
+                else:
+                    relative_path = os.path.relpath(full_path, directory)
+                    self.model.files[relative_path] = content
+                    self.__parsed_files[relative_path] = swift_files
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def __analyze_model(self, directory: str, tests_default_paths: List[str]):
+        for path in self.model.sorted_paths:
+            full_path, subdir = Inspector.__source_file(directory, path)
+            if not self.__walker.includes(directory, subdir):
+                continue
+            swift_files = self.__parsed_files.get(path)
+            if swift_files is None:
+                swift_files = SwiftFileParser(file=full_path,
+                                              base_path=directory,
+                                              current_subdir=subdir,
+                                              tests_default_paths=tests_default_paths,
+                                              counts_only=self.counts_only).parse(self.model.files[path])
+                self.__parsed_files[path] = swift_files
+            self.__append_swift_files(full_path, swift_files)
+
+    def __append_swift_files(self, full_path: str, swift_files: List['SwiftFile']):
+        for swift_file in swift_files:
+            if self.__flat_export is not None:
+                self.__flat_export.append_file(swift_file)
+            self.__append_dependency(swift_file)
+            self.__process_shared_file(swift_file, full_path)
+
+    @staticmethod
+    def __source_file(directory: str, relative_path: str) -> Tuple[str, str]:
+        relative_subdir = os.path.dirname(relative_path)
+        subdir = os.path.join(directory, relative_subdir) if relative_subdir else directory
+        return os.path.join(directory, relative_path), subdir
+
     def __append_dependency(self, swift_file: 'SwiftFile'):
         framework = self.__get_or_create_framework(swift_file.framework_name)
-        Inspector.__populate_submodule(framework=framework, swift_file=swift_file)
+        Inspector.__populate_submodule(framework=framework, swift_file=swift_file, fold=self.stream)
         # This covers the scenario where a test framework might contain no tests
         framework.is_test_framework = swift_file.is_test
 
@@ -71,23 +243,26 @@ class Inspector:
             framework.append_import(imported_framework)
 
     @staticmethod
-    def __populate_submodule(framework: 'Framework', swift_file: 'SwiftFile'):
-        current_paths = str(swift_file.path).split('/')
-        paths = list(reversed(current_paths))
+    def __populate_submodule(framework: 'Framework', swift_file: 'SwiftFile', fold: bool = False):
+        # Folder names are shared by the submodules of many frameworks (the file name is not interned, the interned
+        # strings would grow with the number of files)
+        folders = swift_file.path.split('/')[:-1]
 
         submodule = framework.submodule
-        while len(paths) > 1:
-            path = paths.pop()
-            submodules = [s for s in submodule.submodules]
-            existing_submodule = seq(submodules).filter(lambda sm: sm.name == path)
-            if len(list(existing_submodule)) > 0:
-                submodule = existing_submodule.first()
+        for folder in folders:
+            path = sys.intern(folder)
+            existing_submodule = submodule.child(path)
+            if existing_submodule is not None:
+                submodule = existing_submodule
             else:
                 new_submodule = SubModule(name=path, files=[], submodules=[], parent=submodule)
-                submodule.submodules.append(new_submodule)
+                submodule.add_submodule(new_submodule)
                 submodule = new_submodule
 
-        submodule.files.append(swift_file)
+        if fold:
+            submodule.fold_file(swift_file)
+        else:
+            submodule.append_file(swift_file)
 
     def __process_shared_file(self, swift_file: 'SwiftFile', directory: str):
         if not swift_file.is_shared:
@@ -103,6 +278,7 @@ class Inspector:
         self.frameworks = seq(self.frameworks) \
             .filter(lambda f: f.number_of_files > 0) \
             .list()
+        self.__frameworks_by_name = {f.name: f for f in self.frameworks}
 
     def __get_or_create_framework(self, framework_name: str) -> 'Framework':
         framework = self.__get_framework(framework_name)
@@ -110,10 +286,8 @@ class Inspector:
             # not found, create a new one
             framework = Framework(framework_name)
             self.frameworks.append(framework)
+            self.__frameworks_by_name[framework_name] = framework
         return framework
 
     def __get_framework(self, name: str) -> Optional['Framework']:
-        for f in self.frameworks:
-            if f.name == name:
-                return f
-        return None
+        return self.__frameworks_by_name.get(name)
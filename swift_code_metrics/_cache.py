@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import asdict
+from typing import Optional, Tuple
+
+from ._helpers import Log
+from ._scanner import LineScanner, ScannedContent
+from .version import VERSION
+
+# (size, modification time in ns, content hash) of the bytes read from a file
+FileVersion = Tuple[int, int, str]
+
+
+class ParseCache:
+    """
+    Persistent cache of the content scanned from the swift files.
+    Entries are keyed by path and validated with size and modification time of the file. When only the modification
+    time differs, the content hash of the file is compared before discarding the entry.
+    The cache is invalidated when the parser version or the parsing patterns change, and the least recently used entries
+    are evicted when the cache exceeds its maximum size.
+    """
+
+    DATABASE_NAME = 'parse_cache.sqlite'
+    DEFAULT_MAX_SIZE_MB = 512
+    # Bump when the format of the stored entries changes
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: str, max_size_mb: int = DEFAULT_MAX_SIZE_MB):
+        """
+        Opens (or creates) the cache stored in the provided directory.
+        :param directory: The directory that contains the cache
+        :param max_size_mb: Maximum size of the cached entries (in MB)
+        """
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.max_size = max_size_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self.__connection = sqlite3.connect(os.path.join(directory, ParseCache.DATABASE_NAME))
+        self.__connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS entries (
+                path TEXT PRIMARY KEY,
+                size INTEGER,
+                mtime_ns INTEGER,
+                digest TEXT,
+                payload TEXT,
+                n_of_bytes INTEGER,
+                last_used INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+        """)
+        self.__validate_fingerprint()
+        self.__clock = int(self.__meta('clock') or 0) + 1
+        self.__set_meta('clock', str(self.__clock))
+
+    def __enter__(self) -> 'ParseCache':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def fingerprint() -> str:
+        """
+        :return: The signature of the parser that produced the cached entries
+        """
+        signature = [VERSION, str(ParseCache.FORMAT_VERSION), LineScanner.KEYWORDS.pattern] + \
+                    [pattern.pattern for pattern, _ in LineScanner.DECLARATIONS.values()]
+        return hashlib.sha1('\n'.join(signature).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """
+        :param data: The content of a swift file
+        :return: The content hash stored with the entry of the file
+        """
+        return hashlib.sha1(data).hexdigest()
+
+    @staticmethod
+    def read(path: str) -> Tuple[bytes, 'FileVersion']:
+        """
+        :param path: The path of a swift file
+        :return: The content of the file, and the version of the file stored with its entry. The size and the
+        modification time are taken before reading, so a file changed while it is read is not reused as is.
+        """
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        return data, (stat.st_size, stat.st_mtime_ns, ParseCache.digest(data))
+
+    def lookup(self, path: str) -> Optional['ScannedContent']:
+        """
+        :param path: The path of the swift file
+        :return: The cached content of the file, or None if the file changed since it was stored
+        """
+        key = os.path.abspath(path)
+        row = self.__connection.execute('SELECT size, mtime_ns, digest, payload FROM entries WHERE path = ?',
+                                        (key,)).fetchone()
+        if row is not None:
+            size, mtime_ns, digest, payload = row
+            stat = os.stat(path)
+            is_valid = stat.st_size == size and \
+                (stat.st_mtime_ns == mtime_ns or ParseCache.__file_digest(path) == digest)
+            if is_valid:
+                self.hits += 1
+                self.__connection.execute('UPDATE entries SET mtime_ns = ?, last_used = ? WHERE path = ?',
+                                          (stat.st_mtime_ns, self.__clock, key))
+                return ScannedContent(**json.loads(payload))
+
+        self.misses += 1
+        return None
+
+    def store(self, path: str, content: 'ScannedContent', version: Optional['FileVersion'] = None):
+        """
+        Stores the content scanned from the swift file.
+        :param path: The path of the swift file
+        :param content: The result of the scan of the file
+        :param version: The version of the scanned bytes of the file, from `read` (read again from the file if missing)
+        """
+        size, mtime_ns, digest = ParseCache.read(path)[1] if version is None else version
+        payload = json.dumps(asdict(content))
+        self.__connection.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                  (os.path.abspath(path),
+                                   size,
+                                   mtime_ns,
+                                   digest,
+                                   payload,
+                                   len(payload),
+                                   self.__clock))
+
+    def close(self):
+        """
+        Evicts the least recently used entries exceeding the maximum size and persists the cache.
+        """
+        self.__evict()
+        self.__connection.commit()
+        self.__connection.close()
+        Log.info(f'Parse cache: {self.hits} hits, {self.misses} misses.')
+
+    # Private
+
+    def __validate_fingerprint(self):
+        fingerprint = ParseCache.fingerprint()
+        if self.__meta('fingerprint') != fingerprint:
+            self.__connection.execute('DELETE FROM entries')
+            self.__set_meta('fingerprint', fingerprint)
+
+    def __evict(self):
+        total_size = self.__connection.execute('SELECT COALESCE(SUM(n_of_bytes), 0) FROM entries').fetchone()[0]
+        if total_size <= self.max_size:
+            return
+        evicted = []
+        for path, n_of_bytes in self.__connection.execute('SELECT path, n_of_bytes FROM entries '
+                                                          'ORDER BY last_used ASC'):
+            if total_size <= self.max_size:
+                break
+            evicted.append((path,))
+            total_size -= n_of_bytes
+        self.__connection.executemany('DELETE FROM entries WHERE path = ?', evicted)
+
+    def __meta(self, key: str) -> Optional[str]:
+        row = self.__connection.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def __set_meta(self, key: str, value: str):
+        self.__connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+    @staticmethod
+    def __file_digest(path: str) -> str:
+        with open(path, 'rb') as f:
+            return ParseCache.digest(f.read())
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+import matplotlib
+import pygraphviz as pgv
+
+from ._graph_helpers import ChartSpec, Graph
+from .version import VERSION
+
+
+class ChartCache:
+    """
+    Content hashes of the rendered charts, stored next to each chart (`<chart file>.hash`).
+    The hash covers the kind, title and arguments of the chart, the signature of its shared layout and the version of
+    the tools that draw it, so a chart is rendered again only when its data, its layout or its styling changed since the
+    existing file was written.
+    """
+
+    HASH_EXTENSION = '.hash'
+    # Bump when the styling of the charts changes
+    STYLE_VERSION = 1
+
+    def __init__(self, path: str):
+        """
+        :param path: The directory of the charts
+        """
+        self.graph = Graph(path)
+        self.reused = 0
+        self.rendered = 0
+
+    @staticmethod
+    def digest(spec: 'ChartSpec') -> str:
+        """
+        :param spec: The chart
+        :return: The hash of the chart content
+        """
+        signature = {
+            'version': [VERSION, ChartCache.STYLE_VERSION, matplotlib.__version__, pgv.__version__],
+            'kind': spec.kind,
+            'title': spec.title,
+            'arguments': spec.arguments,
+            'layout_key': spec.layout_key
+        }
+        payload = json.dumps(signature, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def lookup(self, spec: 'ChartSpec') -> Optional[str]:
+        """
+        Looks for the existing file of the chart. The stale hashes are removed, so a chart whose rendering is
+        interrupted is never reused.
+        :param spec: The chart
+        :return: The path of the chart file, or None if the chart has to be rendered
+        """
+        digest = ChartCache.digest(spec)
+        for extension in Graph.EXTENSIONS:
+            chart_path = self.graph.file_path(spec.title, extension=extension)
+            hash_path = chart_path + ChartCache.HASH_EXTENSION
+            if not os.path.exists(hash_path):
+                continue
+            with open(hash_path, 'r') as fp:
+                stored_digest = fp.read().strip()
+            if stored_digest == digest and os.path.exists(chart_path):
+                self.reused += 1
+                return chart_path
+            os.remove(hash_path)
+        return None
+
+    def store(self, spec: 'ChartSpec', chart_path: str):
+        """
+        :param spec: The rendered chart
+        :param chart_path: The path of the written file
+        """
+        with open(chart_path + ChartCache.HASH_EXTENSION, 'w') as fp:
+            fp.write(ChartCache.digest(spec))
+        self.rendered += 1
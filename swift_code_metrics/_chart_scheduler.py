@@ -0,0 +1,67 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional
+
+from ._chart_cache import ChartCache
+from ._graph_helpers import ChartSpec, Graph
+
+
+class ChartScheduler:
+    """
+    Collects the charts to render and draws them in a pool of processes, each chart on its own figure.
+    """
+
+    # Below this number of charts the cost of spawning the workers is higher than the rendering itself
+    MIN_CHARTS_PER_WORKER = 4
+    # Number of chunks scheduled for each worker, to balance the load at the end of the run
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, path: Optional[str], jobs: int = 1, cache: Optional['ChartCache'] = None):
+        """
+        :param path: The directory of the charts (None to show them instead)
+        :param jobs: Maximum number of processes used to render the charts
+        :param cache: The hashes of the existing charts, to skip the unchanged ones (None to render all the charts)
+        """
+        self.path = path
+        self.jobs = jobs
+        self.cache = cache
+        self.__specs: List['ChartSpec'] = []
+
+    def submit(self, spec: 'ChartSpec'):
+        """
+        Schedules a chart, rendered by `run`.
+        """
+        self.__specs.append(spec)
+
+    def run(self) -> List[Optional[str]]:
+        """
+        Renders the scheduled charts.
+        :return: The paths of the written files, in the order of submission
+        """
+        specs, self.__specs = self.__specs, []
+        paths = [None if self.cache is None else self.cache.lookup(spec) for spec in specs]
+        pending = [i for i, path in enumerate(paths) if path is None]
+        for i, path in zip(pending, self.__render([specs[i] for i in pending])):
+            paths[i] = path
+            if self.cache is not None and path is not None:
+                self.cache.store(specs[i], path)
+        return paths
+
+    # Private
+
+    def __render(self, specs: List['ChartSpec']) -> List[Optional[str]]:
+        # Each Graphviz graph is worth its own worker, the other charts are grouped
+        n_of_graphs = sum(1 for spec in specs if spec.kind == ChartSpec.DIRECTED_GRAPH)
+        workers = min(self.jobs, n_of_graphs + (len(specs) - n_of_graphs) // ChartScheduler.MIN_CHARTS_PER_WORKER)
+        if workers <= 1 or self.path is None:
+            return [_render_chart(self.path, spec) for spec in specs]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_size = max(1, len(specs) // (workers * ChartScheduler.CHUNKS_PER_WORKER))
+            return list(executor.map(_render_chart, repeat(self.path), specs, chunksize=chunk_size))
+
+
+# Workers
+
+def _render_chart(path: Optional[str], spec: 'ChartSpec') -> Optional[str]:
+    return Graph(path).render(spec)
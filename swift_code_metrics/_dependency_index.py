@@ -0,0 +1,110 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from ._metrics import Framework, Metrics
+
+
+class DependencyIndex:
+    """
+    Forward and reverse adjacency of the imports of a list of frameworks, built once.
+    Fan-in, fan-out, instability (I), abstractness (A) and distance from the main sequence (D³) of every framework
+    are available in O(V+E), instead of scanning all the frameworks for each of them.
+    """
+
+    # Number of frameworks above which the metrics are computed with array operations
+    MATRIX_THRESHOLD = 500
+
+    def __init__(self, frameworks: List['Framework']):
+        """
+        :param frameworks: All the frameworks of the project
+        """
+        self.frameworks = frameworks
+        # Reverse adjacency and fan-in, built on first use (`MatrixDependencyIndex` computes the fan-in without them)
+        self.__dependents: Optional[Dict['Framework', Dict['Framework', int]]] = None
+        self.__fan_in: Optional[Dict['Framework', int]] = None
+        self.__instability: Dict['Framework', float] = {}
+
+    @staticmethod
+    def create(frameworks: List['Framework'], matrix_threshold: Optional[int] = None) -> 'DependencyIndex':
+        """
+        :param frameworks: All the frameworks of the project
+        :param matrix_threshold: Number of frameworks above which the vectorized index is used
+        (default: `MATRIX_THRESHOLD`)
+        :return: The dependency index of the frameworks
+        """
+        if matrix_threshold is None:
+            matrix_threshold = DependencyIndex.MATRIX_THRESHOLD
+        if len(frameworks) > matrix_threshold:
+            from ._dependency_matrix import MatrixDependencyIndex
+            return MatrixDependencyIndex(frameworks)
+        return DependencyIndex(frameworks)
+
+    def dependencies(self, framework: 'Framework') -> Dict['Framework', int]:
+        """
+        :param framework: The framework to inspect
+        :return: The frameworks imported by the framework (without Apple libraries), with the number of imports
+        """
+        return framework.imports
+
+    def dependents(self, framework: 'Framework') -> Dict['Framework', int]:
+        """
+        :param framework: The framework to inspect
+        :return: The frameworks that import the framework, with the number of imports
+        """
+        self.__build_reverse_adjacency()
+        return self.__dependents.get(framework, {})
+
+    def fan_in(self, framework: 'Framework') -> int:
+        """
+        :param framework: The framework to analyze
+        :return: The Fan-In value (int), as `Metrics.fan_in`
+        """
+        self.__build_reverse_adjacency()
+        return self.__fan_in.get(framework, 0)
+
+    def fan_out(self, framework: 'Framework') -> int:
+        """
+        :param framework: The framework to analyze
+        :return: The Fan-Out value (int), as `Metrics.fan_out`
+        """
+        return Metrics.fan_out(framework)
+
+    def instability(self, framework: 'Framework') -> float:
+        """
+        :param framework: The framework to analyze
+        :return: the instability value (float), as `Metrics.instability`
+        """
+        instability = self.__instability.get(framework)
+        if instability is None:
+            instability = Metrics.instability_from_fans(framework, self.fan_in(framework), self.fan_out(framework))
+            self.__instability[framework] = instability
+        return instability
+
+    def abstractness(self, framework: 'Framework') -> float:
+        """
+        :param framework: The framework to analyze
+        :return: The abstractness value (float), as `Metrics.abstractness`
+        """
+        return Metrics.abstractness(framework)
+
+    def distance_main_sequence(self, framework: 'Framework') -> float:
+        """
+        :param framework: The framework to analyze
+        :return: the D³ value (from 0 to 1), as `Metrics.distance_main_sequence`
+        """
+        return abs(self.abstractness(framework) + self.instability(framework) - 1)
+
+    # Private
+
+    def __build_reverse_adjacency(self):
+        if self.__dependents is not None:
+            return
+        # Imported framework -> number of imports, for each importing framework
+        self.__dependents = defaultdict(dict)
+        self.__fan_in = defaultdict(int)
+        for framework in self.frameworks:
+            for imported_framework, n_of_imports in framework.imports.items():
+                self.__dependents[imported_framework][framework] = n_of_imports
+                # Same definition of `Metrics.fan_in`: only the other non-test frameworks are counted
+                if imported_framework is not framework and not framework.is_test_framework:
+                    self.__fan_in[imported_framework] += n_of_imports
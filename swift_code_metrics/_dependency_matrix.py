@@ -0,0 +1,94 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ._dependency_index import DependencyIndex
+from ._helpers import Log
+from ._metrics import Framework
+
+
+class MatrixDependencyIndex(DependencyIndex):
+    """
+    Dependency index that computes the metrics of all the frameworks with array operations.
+    The import counts are stored as a sparse framework × framework matrix (coordinate format), so the memory grows with
+    the number of imports rather than with the square of the number of frameworks.
+    """
+
+    def __init__(self, frameworks: List['Framework']):
+        """
+        :param frameworks: All the frameworks of the project
+        """
+        super().__init__(frameworks)
+        n_of_frameworks = len(frameworks)
+        # Imported frameworks that are not part of the list (e.g. external dependencies) are added as extra columns
+        self.__positions: Dict['Framework', int] = {f: i for i, f in enumerate(frameworks)}
+        rows, columns, counts = [], [], []
+        for row, framework in enumerate(frameworks):
+            for imported_framework, n_of_imports in framework.imports.items():
+                rows.append(row)
+                columns.append(self.__positions.setdefault(imported_framework, len(self.__positions)))
+                counts.append(n_of_imports)
+        rows = np.array(rows, dtype=np.intp)
+        columns = np.array(columns, dtype=np.intp)
+        counts = np.array(counts, dtype=np.float64)
+        n_of_nodes = len(self.__positions)
+
+        # Fan-out: row sums
+        fan_out = np.bincount(rows, weights=counts, minlength=n_of_nodes)[:n_of_frameworks]
+        # Fan-in: column sums, without the rows of the test frameworks and the self imports
+        is_test = np.array([f.is_test_framework for f in frameworks], dtype=bool)
+        incoming = ~is_test[rows] & (rows != columns)
+        fan_in = np.bincount(columns[incoming], weights=counts[incoming], minlength=n_of_nodes)
+
+        fans = fan_in[:n_of_frameworks] + fan_out
+        self.__is_linked = fans > 0
+        instability = np.divide(fan_out, fans, out=np.zeros(n_of_frameworks), where=self.__is_linked)
+
+        n_a = np.array([f.data.number_of_interfaces for f in frameworks], dtype=np.float64)
+        n_c = np.array([f.data.number_of_concrete_data_structures for f in frameworks], dtype=np.float64)
+        self.__is_concrete = n_c > 0
+        abstractness = np.divide(n_a, n_c, out=np.zeros(n_of_frameworks), where=self.__is_concrete)
+
+        self.__fan_in = fan_in.astype(np.int64)
+        self.__fan_out = fan_out.astype(np.int64)
+        self.__instability = instability
+        self.__abstractness = abstractness
+        self.__distance = np.abs(abstractness + instability - 1)
+
+    def fan_in(self, framework: 'Framework') -> int:
+        # Also the imported frameworks that are not part of the list have a column
+        i = self.__positions.get(framework)
+        return 0 if i is None else int(self.__fan_in[i])
+
+    def fan_out(self, framework: 'Framework') -> int:
+        i = self.__position(framework)
+        return super().fan_out(framework) if i is None else int(self.__fan_out[i])
+
+    def instability(self, framework: 'Framework') -> float:
+        i = self.__position(framework)
+        if i is None:
+            return super().instability(framework)
+        if not self.__is_linked[i]:
+            Log.warn(f'{framework.name} is not linked with the rest of the project.')
+        return float(self.__instability[i])
+
+    def abstractness(self, framework: 'Framework') -> float:
+        i = self.__position(framework)
+        if i is None:
+            return super().abstractness(framework)
+        if not self.__is_concrete[i]:
+            Log.warn(f'{framework.name} is an external dependency.')
+        return float(self.__abstractness[i])
+
+    def distance_main_sequence(self, framework: 'Framework') -> float:
+        i = self.__position(framework)
+        return super().distance_main_sequence(framework) if i is None else float(self.__distance[i])
+
+    # Private
+
+    def __position(self, framework: 'Framework') -> Optional[int]:
+        """
+        :return: The row of the framework, None if the framework is not part of the list
+        """
+        i = self.__positions.get(framework)
+        return i if i is not None and i < len(self.frameworks) else None
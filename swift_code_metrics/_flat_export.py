@@ -0,0 +1,155 @@
+import csv
+import json
+import os
+from typing import Dict, List, Optional, TextIO
+
+from ._helpers import ReportingHelpers
+from ._metrics import Framework, SubModule, SyntheticData
+from ._parser import SwiftFile
+
+
+class FlatExport:
+    """
+    Line oriented export of the metrics: one record per parsed file (`files.<format>`), written while the files are
+    analyzed, and one record per submodule (`submodules.<format>`), written at the end of the analysis.
+    The files are flushed every `FLUSH_INTERVAL` records, so the consumers can read them before the end of the run.
+    """
+
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+    FORMATS = [NDJSON, CSV]
+
+    FILES_NAME = 'files'
+    SUBMODULES_NAME = 'submodules'
+    FILE_FIELDS = ['path', 'framework', 'loc', 'noc', 'n_a', 'n_c', 'nom', 'not', 'imports', 'is_test', 'is_shared']
+    SUBMODULE_FIELDS = ['path', 'framework', 'name', 'parent', 'depth', 'n_of_files',
+                        'loc', 'noc', 'n_a', 'n_c', 'nom', 'not', 'poc']
+    # Separator of the imports in the CSV records
+    CSV_LIST_SEPARATOR = ' '
+    FLUSH_INTERVAL = 1024
+
+    def __init__(self, directory: str, export_format: str):
+        """
+        Creates (or truncates) the export of the files in the provided directory.
+        :param directory: The directory of the export (created if missing)
+        :param export_format: One of `FORMATS`
+        """
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.export_format = export_format
+        self.n_of_files = 0
+        self.__files_fp = self.__open(FlatExport.FILES_NAME)
+        self.__files_writer = self.__writer(self.__files_fp, FlatExport.FILE_FIELDS)
+
+    @property
+    def files_path(self) -> str:
+        return self.__path(FlatExport.FILES_NAME)
+
+    @property
+    def submodules_path(self) -> str:
+        return self.__path(FlatExport.SUBMODULES_NAME)
+
+    def append_file(self, swift_file: 'SwiftFile'):
+        """
+        Writes the record of a parsed file.
+        :param swift_file: The parsed file
+        """
+        data = SyntheticData.from_swift_file(swift_file=swift_file)
+        self.__files_writer({
+            'path': swift_file.path,
+            'framework': swift_file.framework_name,
+            **FlatExport.__data_record(data),
+            'imports': swift_file.imports,
+            'is_test': swift_file.is_test,
+            'is_shared': swift_file.is_shared
+        })
+        self.n_of_files += 1
+        if self.n_of_files % FlatExport.FLUSH_INTERVAL == 0:
+            self.__files_fp.flush()
+
+    def close(self, frameworks: List['Framework']):
+        """
+        Completes the export of the files and writes the records of the submodules.
+        :param frameworks: The analyzed frameworks
+        """
+        self.__files_fp.close()
+        with self.__open(FlatExport.SUBMODULES_NAME) as fp:
+            writer = self.__writer(fp, FlatExport.SUBMODULE_FIELDS)
+            for framework in frameworks:
+                # Path and depth of the submodules, the parents are visited first
+                paths = {}
+                for submodule in framework.submodule.preorder():
+                    parent = paths.get(id(submodule.parent))
+                    path, depth = (submodule.name, 0) if parent is None \
+                        else (f'{parent[0]}/{submodule.name}', parent[1] + 1)
+                    paths[id(submodule)] = (path, depth)
+                    writer(FlatExport.__submodule_record(framework, submodule, path, depth,
+                                                         None if parent is None else parent[0]))
+
+    def abort(self):
+        """
+        Closes the export of the files of an interrupted analysis, without the records of the submodules.
+        """
+        self.__files_fp.close()
+
+    # Private
+
+    def __path(self, name: str) -> str:
+        return os.path.join(self.directory, f'{name}.{self.export_format}')
+
+    def __open(self, name: str) -> TextIO:
+        # Paths and names are written as they are, whatever the locale
+        return open(self.__path(name), 'w', encoding='utf-8', newline='')
+
+    def __writer(self, fp: TextIO, fields: List[str]):
+        """
+        :return: function that writes a record (dictionary of the fields) in the file
+        """
+        if self.export_format == FlatExport.CSV:
+            csv_writer = csv.DictWriter(fp, fieldnames=fields)
+            csv_writer.writeheader()
+
+            def write_csv(record: Dict):
+                csv_writer.writerow({k: FlatExport.CSV_LIST_SEPARATOR.join(v) if isinstance(v, list) else v
+                                     for k, v in record.items()})
+            return write_csv
+
+        def write_ndjson(record: Dict):
+            fp.write(json.dumps(record, separators=(',', ':')))
+            fp.write('\n')
+        return write_ndjson
+
+    @staticmethod
+    def __submodule_record(framework: 'Framework',
+                           submodule: 'SubModule',
+                           path: str,
+                           depth: int,
+                           parent_path: Optional[str]) -> Dict:
+        """
+        :param path: The path of the submodule, with the names joined by `/` (as in the SQLite report)
+        :param depth: The depth of the submodule (0 for the root of the framework)
+        :param parent_path: The path of the parent submodule, None for the root of the framework
+        """
+        data = submodule.data
+        return {
+            'path': path,
+            'framework': framework.name,
+            'name': submodule.name,
+            'parent': parent_path,
+            'depth': depth,
+            'n_of_files': submodule.n_of_files,
+            **FlatExport.__data_record(data),
+            'poc': ReportingHelpers.decimal_format(data.poc)
+        }
+
+    @staticmethod
+    def __data_record(data: 'SyntheticData') -> Dict:
+        return {
+            'loc': data.loc,
+            'noc': data.noc,
+            'n_a': data.number_of_interfaces,
+            'n_c': data.number_of_concrete_data_structures,
+            'nom': data.number_of_methods,
+            'not': data.number_of_tests
+        }
@@ -1,42 +1,84 @@
 import string
 
-import matplotlib.pyplot as plt
 import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 from functional import seq
 from adjustText import adjust_text
 from math import ceil
+from matplotlib.figure import Figure
 import pygraphviz as pgv
 import numpy as np
 
 
+@dataclass(frozen=True)
+class ChartSpec:
+    """
+    Picklable description of a chart: the `Graph` method that draws it, the title and the other arguments of the
+    method (plain lists of numbers and strings).
+    """
+    kind: str
+    title: str
+    arguments: Dict = field(default_factory=dict)
+    # Precomputed layout of the chart (see `Graph.directed_graph_layout`), derived from `layout_key`
+    layout: Optional[Dict] = None
+    # Signature of the graph the layout is computed from, when it is shared with other charts
+    layout_key: Optional[str] = None
+
+    BAR = 'bar_plot'
+    PIE = 'pie_plot'
+    SCATTER = 'scattered_plot'
+    DIRECTED_GRAPH = 'directed_graph'
+
+
 class Graph:
+    # Extensions of the written files (the dependency graphs fall back to svg)
+    EXTENSIONS = ['.pdf', '.svg']
+    # Number of points above which the density of the points is shaded, instead of drawing each of them
+    SCATTER_DENSITY_THRESHOLD = 400
+    # Budget (in seconds) to resolve the overlaps of the labels of the scattered plot
+    LABELS_TIME_LIMIT = 1.0
+
     def __init__(self, path=None):
         self.path = path
-        plt.rc('legend', fontsize='small')
+
+    def render(self, spec: 'ChartSpec') -> Optional[str]:
+        """
+        :param spec: The chart to draw
+        :return: The path of the written file (None if the chart is shown)
+        """
+        arguments = spec.arguments if spec.layout is None else {**spec.arguments, 'layout': spec.layout}
+        return getattr(self, spec.kind)(spec.title, **arguments)
 
     def bar_plot(self, title, data):
-        plt.title(title)
-        plt.ylabel(title)
+        figure, ax = self.__figure()
+        ax.set_title(title)
+        ax.set_ylabel(title)
         opacity = 0.8
-        _ = plt.barh(data[1], data[0], color='blue', alpha=opacity)
+        _ = ax.barh(data[1], data[0], color='blue', alpha=opacity)
         index = np.arange(len(data[1]))
-        plt.yticks(index, data[1], fontsize=5, rotation=30)
-        self.__render(plt, title)
+        ax.set_yticks(index)
+        ax.set_yticklabels(data[1], fontsize=5, rotation=30)
+        return self.__render(figure, title)
 
     def pie_plot(self, title, sizes, labels, legend):
-        plt.title(title)
-        patches, _, _ = plt.pie(sizes, labels=labels, autopct='%1.1f%%', shadow=True, startangle=90)
-        plt.legend(patches, legend, loc='best')
-        plt.axis('equal')
-        plt.tight_layout()
+        figure, ax = self.__figure()
+        ax.set_title(title)
+        patches, _, _ = ax.pie(sizes, labels=labels, autopct='%1.1f%%', shadow=True, startangle=90)
+        ax.legend(patches, legend, loc='best', fontsize='small')
+        ax.axis('equal')
+        figure.tight_layout()
 
-        self.__render(plt, title)
+        return self.__render(figure, title)
 
     def scattered_plot(self, title, x_label, y_label, data, bands):
-        plt.title(title)
-        plt.axis([0, 1, 0, 1])
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
+        """
+        :param data: (x values, y values, labels), the points with an empty label are not labelled
+        """
+        figure, ax = self.__figure()
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
 
         # Data
         x = data[0]
@@ -45,19 +87,76 @@ class Graph:
 
         # Bands
         for band in bands:
-            plt.plot(band[0], band[1])
+            ax.plot(band[0], band[1])
 
-        # Plot
-        texts = []
-        for i, label in enumerate(labels):
-            plt.plot(x, y, 'ko', label=label)
-            texts.append(plt.text(x[i], y[i], label, size=8))
+        # Plot (all the points at once)
+        if len(x) > Graph.SCATTER_DENSITY_THRESHOLD:
+            ax.hexbin(x, y, gridsize=30, extent=(0, 1, 0, 1), cmap='Greys', mincnt=1)
+        else:
+            ax.plot(x, y, 'ko')
+        ax.axis([0, 1, 0, 1])
+
+        texts = [ax.text(x[i], y[i], label, size=8) for i, label in enumerate(labels) if label]
+        if len(texts) > 0:
+            adjust_text(texts,
+                        ax=ax,
+                        time_lim=Graph.LABELS_TIME_LIMIT,
+                        arrowprops=dict(arrowstyle="-", color='k', lw=0.5))
+
+        return self.__render(figure, title)
+
+    def directed_graph(self, title, list_of_nodes, list_of_edges, layout=None):
+        """
+        :param layout: The positions of the nodes and edges (see `directed_graph_layout`), None to lay out the graph
+        """
+        dir_graph = Graph.__make_directed_graph(title, list_of_nodes, list_of_edges)
+        if layout is None:
+            dir_graph.layout('dot')
+        else:
+            dir_graph.graph_attr['bb'] = layout['bb']
+            for node in dir_graph.nodes():
+                node.attr['pos'] = layout['nodes'][node]
+            for edge in dir_graph.edges():
+                edge.attr.update(layout['edges'][(edge[0], edge[1])])
+            # Same as `neato -n2`: the nodes and edges are drawn at the given positions
+            dir_graph.layout('nop2')
+
+        save_file = self.file_path(title)
+        try:
+            dir_graph.draw(save_file)
+        except (OSError, ValueError):
+            # Fallback for minimal graphviz setup
+            save_file = self.file_path(title, extension='.svg')
+            dir_graph.draw(save_file)
+        return save_file
 
-        adjust_text(texts, arrowprops=dict(arrowstyle="-", color='k', lw=0.5))
+    @staticmethod
+    def directed_graph_layout(list_of_nodes, list_of_edges) -> Dict:
+        """
+        Lays out the graph with `dot`, so the subgraphs with the same nodes and a subset of the edges can be drawn with
+        the same positions, without laying them out again.
+        :return: The bounding box and the positions of the nodes and edges (with their labels)
+        """
+        dir_graph = Graph.__make_directed_graph('layout', list_of_nodes, list_of_edges)
+        dir_graph.layout('dot')
+        return {
+            'bb': dir_graph.graph_attr['bb'],
+            'nodes': {str(node): node.attr['pos'] for node in dir_graph.nodes()},
+            'edges': {(str(edge[0]), str(edge[1])): {key: edge.attr[key] for key in ['pos', 'lp'] if edge.attr.get(key)}
+                      for edge in dir_graph.edges()}
+        }
+
+    def file_path(self, name, extension='.pdf'):
+        """
+        :return: The path of the file of the chart with the provided name
+        """
+        filename = Graph.format_filename(name) + extension
+        return os.path.join(self.path, filename)
 
-        self.__render(plt, title)
+    # Private
 
-    def directed_graph(self, title, list_of_nodes, list_of_edges):
+    @staticmethod
+    def __make_directed_graph(title, list_of_nodes, list_of_edges) -> 'pgv.AGraph':
         dir_graph = pgv.AGraph(directed=True, strict=True, rankdir='TD', name=title)
         dir_graph.node_attr['shape'] = 'rectangle'
 
@@ -69,27 +168,31 @@ class Graph:
                                          penwidth=ceil((e[3] + 1) / 2),
                                          color=e[4],
                                          fontcolor=e[4]))
+        return dir_graph
 
-        dir_graph.layout('dot')
-        try:
-            dir_graph.draw(self.__file_path(title))
-        except OSError:
-            # Fallback for minimal graphviz setup
-            dir_graph.draw(self.__file_path(title, extension='.svg'))
-
-    # Private
-
-    def __render(self, plt, name):
+    def __figure(self):
+        """
+        :return: A new figure with its axes. The figures to save are not registered in the global pyplot state, so
+        they are released as soon as they are rendered.
+        """
         if self.path is None:
-            plt.show()
+            import matplotlib.pyplot as plt
+            figure = plt.figure()
         else:
-            save_file = self.__file_path(name)
-            plt.savefig(save_file, bbox_inches='tight')
-            plt.close()
+            figure = Figure()
+        return figure, figure.subplots()
 
-    def __file_path(self, name, extension='.pdf'):
-        filename = Graph.format_filename(name) + extension
-        return os.path.join(self.path, filename)
+    def __render(self, figure, name) -> Optional[str]:
+        if self.path is None:
+            import matplotlib.pyplot as plt
+            plt.show()
+            return None
+        save_file = self.file_path(name)
+        try:
+            figure.savefig(save_file, bbox_inches='tight')
+        finally:
+            figure.clear()
+        return save_file
 
     @staticmethod
     def format_filename(s):
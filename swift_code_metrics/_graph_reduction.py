@@ -0,0 +1,217 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from ._helpers import Log
+from ._snapshot import FrameworkMetrics
+
+# (name, loc)
+Node = Tuple[str, int]
+# (framework, imported framework, number of imports, color)
+Edge = Tuple[str, str, int, str]
+
+
+@dataclass
+class GraphReduction:
+    """
+    Simplifications of the dependency graph, applied before its layout. The steps run in this order: pruning of the
+    edges with few imports, clustering of the frameworks by folder, collapse of the cycles, transitive reduction and
+    finally the node and edge budget.
+    """
+    # The edges with fewer imports are removed
+    min_imports: int = 1
+    # Groups the frameworks by the first `cluster_depth` folders of their sources (None to keep every framework)
+    cluster_depth: Optional[int] = None
+    # Collapses the frameworks that depend on each other (strongly connected components) in single nodes
+    collapse_cycles: bool = False
+    # Removes the edges between frameworks that are also connected through other frameworks
+    transitive_reduction: bool = False
+    # Maximum number of nodes (including the external frameworks) and edges of the graph (None for no limit)
+    max_nodes: Optional[int] = None
+    max_edges: Optional[int] = None
+
+    # Maximum number of names in the label of a collapsed cycle
+    CYCLE_LABEL_NAMES = 3
+
+    def reduce(self,
+               nodes: List[Node],
+               edges: List[Edge],
+               frameworks: List['FrameworkMetrics']) -> Tuple[List[Node], List[Edge]]:
+        """
+        :param nodes: The analyzed frameworks
+        :param edges: The dependencies of the analyzed frameworks (also on the external ones)
+        :param frameworks: The analyzed frameworks, to find the folders of their sources
+        :return: The reduced nodes and edges
+        """
+        n_of_nodes, n_of_edges = len(GraphReduction.__node_names(nodes, edges)), len(edges)
+        edges = [e for e in edges if e[2] >= self.min_imports]
+
+        if self.cluster_depth is not None:
+            folders = {f.name: GraphReduction.framework_folder(f, self.cluster_depth) for f in frameworks}
+            groups: Dict[str, List[str]] = {}
+            for name, _ in nodes:
+                groups.setdefault(folders.get(name, name), []).append(name)
+            if all(len(members) == 1 for members in groups.values()):
+                # Without a project paths override every framework is a top-level folder of its own
+                Log.warn(f'No frameworks share their first {self.cluster_depth} folders: clustering by folder needs '
+                         f'frameworks declared in the same folder by a scm.json file.')
+            nodes, edges = GraphReduction.__merge(nodes, edges, {
+                name: name if len(members) == 1 else f'{folder}/'
+                for folder, members in groups.items() for name in members
+            })
+
+        if self.collapse_cycles:
+            components = GraphReduction.__strongly_connected_components(GraphReduction.__node_names(nodes, edges),
+                                                                        edges)
+            nodes, edges = GraphReduction.__merge(nodes, edges, {
+                name: GraphReduction.__cycle_label(component) for component in components for name in component
+            })
+
+        if self.transitive_reduction:
+            edges = GraphReduction.__transitive_reduction(GraphReduction.__node_names(nodes, edges), edges)
+
+        nodes, edges = self.__apply_budget(nodes, edges)
+        Log.info(f'Dependency graph reduced from {n_of_nodes} nodes and {n_of_edges} edges '
+                 f'to {len(GraphReduction.__node_names(nodes, edges))} nodes and {len(edges)} edges.')
+        return nodes, edges
+
+    @staticmethod
+    def framework_folder(framework: 'FrameworkMetrics', depth: int) -> str:
+        """
+        :param framework: The metrics of the analyzed framework
+        :param depth: The number of folders
+        :return: The path of the first `depth` folders of the sources of the framework (following the folders with more
+        lines of code), or the name of the framework if its sources are not in a folder
+        """
+        folders = framework.source_folders[:depth]
+        return '/'.join(folders) if len(folders) > 0 else framework.name
+
+    # Private
+
+    @staticmethod
+    def __node_names(nodes: List[Node], edges: List[Edge]) -> List[str]:
+        """
+        :return: The names of the nodes, including the ones only referenced by the edges (e.g. external frameworks)
+        """
+        names = dict.fromkeys(n[0] for n in nodes)
+        for e in edges:
+            names.setdefault(e[0])
+            names.setdefault(e[1])
+        return list(names.keys())
+
+    @staticmethod
+    def __merge(nodes: List[Node], edges: List[Edge], groups: Dict[str, str]) -> Tuple[List[Node], List[Edge]]:
+        """
+        :param groups: The name of the merged node for each node (the missing nodes are kept)
+        :return: The merged nodes, with the sum of their lines of code, and the merged edges, with the sum of their
+        imports (without the edges between nodes of the same group)
+        """
+        merged_nodes: Dict[str, int] = {}
+        for name, loc in nodes:
+            group = groups.get(name, name)
+            merged_nodes[group] = merged_nodes.get(group, 0) + loc
+        merged_edges: Dict[Tuple[str, str, str], int] = {}
+        for source, target, n_of_imports, color in edges:
+            key = (groups.get(source, source), groups.get(target, target), color)
+            if key[0] != key[1]:
+                merged_edges[key] = merged_edges.get(key, 0) + n_of_imports
+        return list(merged_nodes.items()), [(s, t, n, c) for (s, t, c), n in merged_edges.items()]
+
+    @staticmethod
+    def __cycle_label(component: List[str]) -> str:
+        if len(component) <= GraphReduction.CYCLE_LABEL_NAMES:
+            return ' + '.join(component)
+        shown = component[:GraphReduction.CYCLE_LABEL_NAMES]
+        return f'{" + ".join(shown)} + {len(component) - len(shown)} more'
+
+    @staticmethod
+    def __strongly_connected_components(names: List[str], edges: List[Edge]) -> List[List[str]]:
+        """
+        Tarjan's algorithm, without recursion.
+        :return: The strongly connected components, in reverse topological order (the dependencies first)
+        """
+        successors: Dict[str, List[str]] = {name: [] for name in names}
+        for e in edges:
+            successors[e[0]].append(e[1])
+
+        index: Dict[str, int] = {}
+        low_link: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack = set()
+        components = []
+        for root in names:
+            if root in index:
+                continue
+            work = [(root, 0)]
+            while work:
+                name, i = work.pop()
+                if i == 0:
+                    index[name] = low_link[name] = len(index)
+                    stack.append(name)
+                    on_stack.add(name)
+                if i < len(successors[name]):
+                    work.append((name, i + 1))
+                    successor = successors[name][i]
+                    if successor not in index:
+                        work.append((successor, 0))
+                    elif successor in on_stack:
+                        low_link[name] = min(low_link[name], index[successor])
+                    continue
+                if low_link[name] == index[name]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == name:
+                            break
+                    components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[name])
+        return components
+
+    @staticmethod
+    def __transitive_reduction(names: List[str], edges: List[Edge]) -> List[Edge]:
+        """
+        Removes the edges between components of the graph that are also connected through another component.
+        The edges inside the cycles are kept.
+        """
+        components = GraphReduction.__strongly_connected_components(names, edges)
+        component_of = {name: i for i, component in enumerate(components) for name in component}
+        children: List[set] = [set() for _ in components]
+        for e in edges:
+            source, target = component_of[e[0]], component_of[e[1]]
+            if source != target:
+                children[source].add(target)
+
+        # Bitsets of the components reachable from each component (the dependencies come first)
+        descendants = [0] * len(components)
+        for i, component_children in enumerate(children):
+            for child in component_children:
+                descendants[i] |= (1 << child) | descendants[child]
+
+        def is_redundant(source: int, target: int) -> bool:
+            return any(child != target and descendants[child] >> target & 1 for child in children[source])
+
+        return [e for e in edges
+                if component_of[e[0]] == component_of[e[1]]
+                or not is_redundant(component_of[e[0]], component_of[e[1]])]
+
+    def __apply_budget(self, nodes: List[Node], edges: List[Edge]) -> Tuple[List[Node], List[Edge]]:
+        """
+        Keeps the nodes with more lines of code and imports, then the edges with more imports.
+        """
+        names = GraphReduction.__node_names(nodes, edges)
+        if self.max_nodes is not None and len(names) > self.max_nodes:
+            weights = {name: (loc, 0) for name, loc in nodes}
+            for e in edges:
+                for name in e[:2]:
+                    loc, n_of_imports = weights.get(name, (0, 0))
+                    weights[name] = (loc, n_of_imports + e[2])
+            kept = set(sorted(names, key=lambda n: weights.get(n, (0, 0)), reverse=True)[:self.max_nodes])
+            nodes = [n for n in nodes if n[0] in kept]
+            edges = [e for e in edges if e[0] in kept and e[1] in kept]
+        if self.max_edges is not None and len(edges) > self.max_edges:
+            kept_edges = set(sorted(range(len(edges)), key=lambda i: edges[i][2], reverse=True)[:self.max_edges])
+            edges = [e for i, e in enumerate(edges) if i in kept_edges]
+        return nodes, edges
@@ -1,12 +1,35 @@
-from swift_code_metrics._metrics import Metrics
-from ._graph_helpers import Graph
+from ._chart_cache import ChartCache
+from ._chart_scheduler import ChartScheduler
+from ._graph_helpers import ChartSpec, Graph
+from ._graph_reduction import GraphReduction
+from ._snapshot import FrameworkMetrics
+from dataclasses import replace
 from functional import seq
 from math import ceil
+from typing import List, Optional, Set, Tuple
 
 
 class GraphPresenter:
-    def __init__(self, artifacts_path):
+    # Colors of the dependencies between the analyzed frameworks and on the external ones
+    INTERNAL_COLOR = 'forestgreen'
+    EXTERNAL_COLOR = 'orangered'
+
+    def __init__(self, artifacts_path, jobs: int = 1, use_cache: bool = True):
+        """
+        :param artifacts_path: The directory of the graphs
+        :param jobs: Maximum number of processes used to render the charts
+        :param use_cache: Whether the charts unchanged since the previous run are reused
+        """
         self.graph = Graph(artifacts_path)
+        self.cache = ChartCache(artifacts_path) if use_cache and artifacts_path is not None else None
+        self.scheduler = ChartScheduler(artifacts_path, jobs=jobs, cache=self.cache)
+
+    def render_charts(self) -> List[Optional[str]]:
+        """
+        Renders the charts scheduled by the plot methods.
+        :return: The paths of the written files
+        """
+        return self.scheduler.run()
 
     def sorted_data_plot(self, title, list_of_frameworks, f_of_framework):
         """
@@ -18,7 +41,7 @@ class GraphPresenter:
         plot_data = (list(map(lambda f: f[0], sorted_data)),
                      list(map(lambda f: f[1], sorted_data)))
 
-        self.graph.bar_plot(title, plot_data)
+        self.scheduler.submit(ChartSpec(ChartSpec.BAR, title, {'data': plot_data}))
 
     def frameworks_pie_plot(self, title, list_of_frameworks, f_of_framework):
         """
@@ -38,7 +61,9 @@ class GraphPresenter:
                      list(map(lambda f: f[2], sorted_data)),
                      )
 
-        self.graph.pie_plot(title, plot_data[0], plot_data[1], plot_data[2])
+        self.scheduler.submit(ChartSpec(ChartSpec.PIE, title, {'sizes': plot_data[0],
+                                                               'labels': plot_data[1],
+                                                               'legend': plot_data[2]}))
 
     def submodules_pie_plot(self, title, list_of_submodules, f_of_submodules):
         sorted_data = sorted(list(map(lambda s: (f_of_submodules(s),
@@ -48,15 +73,27 @@ class GraphPresenter:
         plot_data = (list(map(lambda f: f[0], sorted_data)),
                      list(map(lambda f: f[1], sorted_data)))
 
-        self.graph.pie_plot(title, plot_data[0], plot_data[1], plot_data[1])
+        self.scheduler.submit(ChartSpec(ChartSpec.PIE, title, {'sizes': plot_data[0],
+                                                               'labels': plot_data[1],
+                                                               'legend': plot_data[1]}))
 
-    def distance_from_main_sequence_plot(self, list_of_frameworks, x_ax_f_framework, y_ax_f_framework):
+    def distance_from_main_sequence_plot(self,
+                                         list_of_frameworks,
+                                         x_ax_f_framework,
+                                         y_ax_f_framework,
+                                         max_labels: Optional[int] = None):
         """
         Renders framework related data to a scattered plot
+        :param max_labels: Maximum number of labelled frameworks, the farthest from the main sequence (None for all)
         """
-        scattered_data = (list(map(lambda f: x_ax_f_framework(f), list_of_frameworks)),
-                          list(map(lambda f: y_ax_f_framework(f), list_of_frameworks)),
-                          list(map(lambda f: f.name, list_of_frameworks)))
+        x = list(map(lambda f: x_ax_f_framework(f), list_of_frameworks))
+        y = list(map(lambda f: y_ax_f_framework(f), list_of_frameworks))
+        labels = list(map(lambda f: f.name, list_of_frameworks))
+        if max_labels is not None and max_labels < len(labels):
+            # D³ = abs( A + I - 1 )
+            labelled = set(sorted(range(len(labels)), key=lambda i: abs(x[i] + y[i] - 1), reverse=True)[:max_labels])
+            labels = [label if i in labelled else '' for i, label in enumerate(labels)]
+        scattered_data = (x, y, labels)
 
         bands = [
             ([1, 0], 'g'),
@@ -66,40 +103,70 @@ class GraphPresenter:
             ([1.66, 0.66], 'r--')
         ]
 
-        self.graph.scattered_plot('Deviation from the main sequence',
-                                  'I = Instability',
-                                  'A = Abstractness',
-                                  scattered_data,
-                                  bands)
-
-    def dependency_graph(self, list_of_frameworks, total_code, total_imports):
+        self.scheduler.submit(ChartSpec(ChartSpec.SCATTER, 'Deviation from the main sequence', {
+            'x_label': 'I = Instability',
+            'y_label': 'A = Abstractness',
+            'data': scattered_data,
+            'bands': bands
+        }))
+
+    def dependency_graph(self,
+                         list_of_frameworks: List['FrameworkMetrics'],
+                         total_code,
+                         total_imports,
+                         reduction: Optional['GraphReduction'] = None):
         """
         Renders the Frameworks dependency graph.
+        :param list_of_frameworks: The metrics of the frameworks to draw
+        :param reduction: The simplifications of the graph applied before its layout (None to draw the whole graph)
         """
 
-        nodes = seq(list_of_frameworks).map(lambda fr: (fr.name, ceil(10 * fr.data.loc / total_code))).list()
+        nodes = seq(list_of_frameworks).map(lambda fm: (fm.name, fm.loc)).list()
+        names = {fm.name for fm in list_of_frameworks}
 
         internal_edges = seq(list_of_frameworks) \
-            .flat_map(lambda fr: Metrics.internal_dependencies(fr, list_of_frameworks)) \
-            .map(lambda ind: GraphPresenter.__make_edge(ind, total_imports, 'forestgreen'))
+            .flat_map(lambda fm: GraphPresenter.__edges(fm, names, is_internal=True)) \
+            .map(lambda e: e + (GraphPresenter.INTERNAL_COLOR,))
 
         external_edges = seq(list_of_frameworks) \
-            .flat_map(lambda fr: Metrics.external_dependencies(fr, list_of_frameworks)) \
-            .map(lambda ed: GraphPresenter.__make_edge(ed, total_imports, 'orangered'))
-
-        self.__render_directed_graph('Internal dependencies graph', nodes, internal_edges)
-        self.__render_directed_graph('External dependencies graph', nodes, external_edges)
-
-        # Total
-        self.__render_directed_graph('Dependencies graph', nodes, internal_edges + external_edges)
-
-    @staticmethod
-    def __make_edge(dep, total_imports, color):
-        return (dep.name, dep.dependent_framework, dep.number_of_imports,
-                ceil(10 * dep.number_of_imports / total_imports), color)
-
-    def __render_directed_graph(self, title, nodes, edges):
+            .flat_map(lambda fm: GraphPresenter.__edges(fm, names, is_internal=False)) \
+            .map(lambda e: e + (GraphPresenter.EXTERNAL_COLOR,))
+
+        all_edges = (internal_edges + external_edges).list()
+        if reduction is not None:
+            nodes, all_edges = reduction.reduce(nodes, all_edges, list_of_frameworks)
+
+        nodes = [(name, ceil(10 * loc / total_code)) for name, loc in nodes]
+        all_edges = [(source, target, n_of_imports, ceil(10 * n_of_imports / total_imports), color)
+                     for source, target, n_of_imports, color in all_edges]
+        # The views share the layout of the total graph: all of them are rendered again when it changes
+        layout_key = ChartCache.digest(ChartSpec(ChartSpec.DIRECTED_GRAPH, 'layout', {'list_of_nodes': nodes,
+                                                                                      'list_of_edges': all_edges}))
+        specs = [ChartSpec(ChartSpec.DIRECTED_GRAPH, title, {'list_of_nodes': nodes, 'list_of_edges': edges},
+                           layout_key=layout_key)
+                 for title, edges in [
+                     ('Internal dependencies graph', [e for e in all_edges if e[4] == GraphPresenter.INTERNAL_COLOR]),
+                     ('External dependencies graph', [e for e in all_edges if e[4] == GraphPresenter.EXTERNAL_COLOR]),
+                     ('Dependencies graph', all_edges)
+                 ]]
+        pending_specs = [spec for spec in specs if self.cache is None or self.cache.lookup(spec) is None]
+        if len(pending_specs) == 0:
+            return
+
+        # The total graph is laid out once, the views are drawn with the same positions by the scheduler
         try:
-            self.graph.directed_graph(title, nodes, edges)
+            layout = Graph.directed_graph_layout(nodes, all_edges)
         except ValueError:
             print('Please ensure that you have Graphviz (https://www.graphviz.org/download) installed.')
+            return
+        for spec in pending_specs:
+            self.scheduler.submit(replace(spec, layout=layout))
+
+    @staticmethod
+    def __edges(framework: 'FrameworkMetrics', names: Set[str], is_internal: bool) -> List[Tuple[str, str, int]]:
+        """
+        :param names: The names of the drawn frameworks, the other imported frameworks are external
+        :return: The (framework, imported framework, number of imports) of the internal or external dependencies
+        """
+        return [(framework.name, name, n_of_imports) for name, n_of_imports in framework.imports
+                if (name in names) == is_internal]
@@ -1,7 +1,11 @@
-from ._metrics import Metrics, SubModule
-from ._report import ReportingHelpers
+from ._helpers import Log
+from ._metrics import Framework, SubModule
+from ._report import Report, ReportingHelpers
+from ._snapshot import MetricsSnapshot
 from dataclasses import dataclass
-from typing import List
+from itertools import islice
+from typing import List, Optional
+from ._graph_reduction import GraphReduction
 from ._graphs_presenter import GraphPresenter
 
 
@@ -12,9 +16,22 @@ class GraphsRender:
     test_frameworks: List['Framework']
     non_test_frameworks: List['Framework']
     report: 'Report'
+    snapshot: Optional['MetricsSnapshot'] = None
+    # Maximum number of processes used to render the charts
+    jobs: int = 1
+    # Maximum number of labelled frameworks in the main sequence chart (None for all)
+    scatter_labels: Optional[int] = None
+    # Whether the charts unchanged since the previous run are reused
+    use_cache: bool = True
+    # Simplifications of the dependency graph (None to draw the whole graph)
+    graph_reduction: Optional['GraphReduction'] = None
+
+    def __post_init__(self):
+        if self.snapshot is None:
+            self.snapshot = MetricsSnapshot.build(self.test_frameworks + self.non_test_frameworks)
 
     def render_graphs(self):
-        graph_presenter = GraphPresenter(self.artifacts_path)
+        graph_presenter = GraphPresenter(self.artifacts_path, jobs=self.jobs, use_cache=self.use_cache)
 
         # Project graphs
         self.__project_graphs(graph_presenter=graph_presenter)
@@ -22,43 +39,54 @@ class GraphsRender:
         # Submodules graphs
         self.__submodules_graphs(graph_presenter=graph_presenter)
 
+        # Charts scheduled by the presenter
+        graph_presenter.render_charts()
+
+        cache = graph_presenter.cache
+        if cache is not None:
+            Log.info(f'Charts: {cache.reused} reused, {cache.rendered} rendered.')
+
     def __project_graphs(self, graph_presenter: 'GraphPresenter'):
+        non_test_metrics = [self.snapshot[f.name] for f in self.non_test_frameworks]
+        test_metrics = [self.snapshot[f.name] for f in self.test_frameworks]
+
         # Sorted data plots
         non_test_reports_sorted_data = {
-            'N. of classes and structs': lambda fr: fr.data.number_of_concrete_data_structures,
-            'Lines Of Code - LOC': lambda fr: fr.data.loc,
-            'Number Of Comments - NOC': lambda fr: fr.data.noc,
-            'N. of imports - NOI': lambda fr: fr.number_of_imports
+            'N. of classes and structs': lambda fm: fm.n_c,
+            'Lines Of Code - LOC': lambda fm: fm.loc,
+            'Number Of Comments - NOC': lambda fm: fm.noc,
+            'N. of imports - NOI': lambda fm: fm.noi
         }
 
         tests_reports_sorted_data = {
-            'Number of tests - NOT': lambda fr: fr.data.number_of_tests
+            'Number of tests - NOT': lambda fm: fm.n_of_tests
         }
 
         # Non-test graphs
-        for title, framework_function in non_test_reports_sorted_data.items():
-            graph_presenter.sorted_data_plot(title, self.non_test_frameworks, framework_function)
+        for title, metrics_function in non_test_reports_sorted_data.items():
+            graph_presenter.sorted_data_plot(title, non_test_metrics, metrics_function)
 
         # Distance from the main sequence
-        all_frameworks = self.test_frameworks + self.non_test_frameworks
-        graph_presenter.distance_from_main_sequence_plot(self.non_test_frameworks,
-                                                         lambda fr: Metrics.instability(fr, all_frameworks),
-                                                         lambda fr: Metrics.abstractness(fr))
+        graph_presenter.distance_from_main_sequence_plot(non_test_metrics,
+                                                         lambda fm: fm.instability,
+                                                         lambda fm: fm.abstractness,
+                                                         max_labels=self.scatter_labels)
 
         # Dependency graph
-        graph_presenter.dependency_graph(self.non_test_frameworks,
+        graph_presenter.dependency_graph(non_test_metrics,
                                          self.report.non_test_framework_aggregate.loc,
-                                         self.report.non_test_framework_aggregate.n_o_i)
+                                         self.report.non_test_framework_aggregate.n_o_i,
+                                         reduction=self.graph_reduction)
 
         # Code distribution
-        graph_presenter.frameworks_pie_plot('Code distribution', self.non_test_frameworks,
-                                            lambda fr:
-                                            ReportingHelpers.decimal_format(fr.data.loc
+        graph_presenter.frameworks_pie_plot('Code distribution', non_test_metrics,
+                                            lambda fm:
+                                            ReportingHelpers.decimal_format(fm.loc
                                                                             / self.report.non_test_framework_aggregate.loc))
 
         # Test graphs
-        for title, framework_function in tests_reports_sorted_data.items():
-            graph_presenter.sorted_data_plot(title, self.test_frameworks, framework_function)
+        for title, metrics_function in tests_reports_sorted_data.items():
+            graph_presenter.sorted_data_plot(title, test_metrics, metrics_function)
 
     def __submodules_graphs(self, graph_presenter: 'GraphPresenter'):
         for framework in self.non_test_frameworks:
@@ -68,12 +96,11 @@ class GraphsRender:
 
     @staticmethod
     def __render_submodules(parent: str, root_submodule: 'SubModule', graph_presenter: 'GraphPresenter'):
-        current_submodule = root_submodule.next
-        while current_submodule != root_submodule:
+        # All the descendants of the root submodule
+        for submodule in islice(root_submodule.preorder(), 1, None):
             GraphsRender.__render_submodule_loc(parent=parent,
-                                                submodule=current_submodule,
+                                                submodule=submodule,
                                                 graph_presenter=graph_presenter)
-            current_submodule = current_submodule.next
 
     @staticmethod
     def __render_submodule_loc(parent: str, submodule: 'SubModule', graph_presenter: 'GraphPresenter'):
@@ -84,12 +111,9 @@ class GraphsRender:
         if total_loc == submodules[0].data.loc:
             # Single submodule folder - not useful
             return
-        if len(submodule.files) > 0:
+        if submodule.n_of_own_files > 0:
             # Add a submodule to represent the root slice
-            submodules = submodules + [SubModule(name='(root)',
-                                                 files=submodule.files,
-                                                 submodules=[],
-                                                 parent=submodule)]
+            submodules = submodules + [submodule.own_files_submodule(name='(root)')]
 
         chart_name = f'{parent} {submodule.path}'
         graph_presenter.submodules_pie_plot(chart_name, submodules,
@@ -1,17 +1,58 @@
+import functools
+import os
 import re
+import sys
 import logging
+import gzip
 import json
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
 from functional import seq
 
 
+class _StderrHandler(logging.StreamHandler):
+    """
+    Handler that writes to the current `sys.stderr`, also when it is replaced after the creation of the handler.
+    """
+
+    def __init__(self):
+        super().__init__(sys.stderr)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, _):
+        pass
+
+
 class Log:
     __logger = logging.getLogger(__name__)
+    # Logger of the package, configured by `configure` without changing the logging of the other libraries
+    __package_logger = logging.getLogger(__name__.split('.')[0])
+    __handler = None
+
+    @classmethod
+    def configure(cls, level: int = logging.INFO):
+        """
+        Prints the messages of the package with the provided level (or higher) on stderr.
+        :param level: The minimum level of the printed messages
+        """
+        if Log.__handler is None:
+            Log.__handler = _StderrHandler()
+            Log.__handler.setFormatter(logging.Formatter('%(message)s'))
+            Log.__package_logger.addHandler(Log.__handler)
+            Log.__package_logger.propagate = False
+        Log.__package_logger.setLevel(level)
 
     @classmethod
     def warn(cls, message: str):
         Log.__logger.warning(message)
 
+    @classmethod
+    def info(cls, message: str):
+        Log.__logger.info(message)
+
 
 class AnalyzerHelpers:
     # Constants
@@ -22,7 +63,7 @@ class AnalyzerHelpers:
     # This list is manually updated and references the content available from
     # https://developer.apple.com/documentation/technologies?changes=latest_major,
     # https://developer.apple.com/ios/whats-new/ and https://developer.apple.com/macos/whats-new/
-    APPLE_FRAMEWORKS = [
+    APPLE_FRAMEWORKS = frozenset([
         'Accelerate',
         'Accessibility',
         'Accounts',
@@ -257,7 +298,7 @@ class AnalyzerHelpers:
         'WorkoutKit',
         'XCTest',
         'XPC'
-    ]
+    ])
 
     @staticmethod
     def is_path_in_list(subdir, exclude_paths):
@@ -266,6 +307,102 @@ class AnalyzerHelpers:
                 return True
         return False
 
+    @staticmethod
+    def walk_order_key(relative_path: str) -> List[Tuple[int, str]]:
+        """
+        Sorting key equivalent to a top-down walk of the directories in alphabetical order
+        (the files of a folder come before the content of its subfolders).
+        :param relative_path: The path of a file, relative to the root of the walk
+        :return: the sorting key
+        """
+        components = relative_path.split('/')
+        return [(1, c) for c in components[:-1]] + [(0, components[-1])]
+
+    @staticmethod
+    def usable_cpu_count() -> int:
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:
+            # `sched_getaffinity` is not available on macOS
+            return os.cpu_count() or 1
+
+
+class PathMatcher:
+    """
+    Matcher of a list of path patterns, compiled once in a single regular expression.
+    A path matches if it contains any of the patterns (same semantics of `AnalyzerHelpers.is_path_in_list`).
+    Patterns with wildcards are matched as globs: `*` and `?` don't match the path separator, `**` matches
+    across folders and `[...]` matches a set of characters (e.g. `Pods/*/Tests`).
+    """
+
+    GLOB_CHARACTERS = frozenset('*?[')
+    # Maximum number of paths whose result is kept, the matchers live as long as the process (e.g. in watch mode)
+    MEMO_SIZE = 8192
+
+    __matchers: Dict[Tuple[str, ...], 'PathMatcher'] = {}
+
+    def __init__(self, patterns: Iterable[str]):
+        regexes = [PathMatcher.__glob_regex(p) if PathMatcher.is_glob(p) else re.escape(p) for p in patterns]
+        self.__search = re.compile('|'.join(regexes)).search if len(regexes) > 0 else None
+        # Results of the most recent paths (paths are directories, classified once per walk)
+        self.__memoized_match = functools.lru_cache(maxsize=PathMatcher.MEMO_SIZE)(self.__match)
+
+    @staticmethod
+    def for_patterns(patterns: Iterable[str]) -> 'PathMatcher':
+        """
+        :param patterns: The list of patterns
+        :return: The matcher of the patterns, shared by all the callers of the current process
+        """
+        key = tuple(patterns)
+        matcher = PathMatcher.__matchers.get(key)
+        if matcher is None:
+            matcher = PathMatcher(key)
+            PathMatcher.__matchers[key] = matcher
+        return matcher
+
+    @staticmethod
+    def is_glob(pattern: str) -> bool:
+        return not PathMatcher.GLOB_CHARACTERS.isdisjoint(pattern)
+
+    def matches(self, path: str) -> bool:
+        """
+        :param path: The path to classify
+        :return: True if the path matches any of the patterns
+        """
+        return self.__memoized_match(path)
+
+    # Private
+
+    def __match(self, path: str) -> bool:
+        return self.__search is not None and self.__search(path) is not None
+
+    @staticmethod
+    def __glob_regex(pattern: str) -> str:
+        regex = ''
+        i = 0
+        while i < len(pattern):
+            c = pattern[i]
+            if pattern.startswith('**', i):
+                regex += '.*'
+                i += 2
+                continue
+            if c == '*':
+                regex += '[^/]*'
+            elif c == '?':
+                regex += '[^/]'
+            elif c == '[' and pattern.find(']', i + 2) > 0:
+                end = pattern.find(']', i + 2)
+                characters = pattern[i + 1:end]
+                negation = characters.startswith('!')
+                regex += '[' + ('^' if negation else '') + \
+                         re.escape(characters[1:] if negation else characters).replace('\\-', '-') + ']'
+                i = end + 1
+                continue
+            else:
+                regex += re.escape(c)
+            i += 1
+        return regex
+
 
 class ParsingHelpers:
     # Constants
@@ -292,11 +429,8 @@ class ParsingHelpers:
 
     @staticmethod
     def check_existence(regex_pattern, trimmed_string):
-        regex = re.compile(regex_pattern)
-        if re.search(regex, trimmed_string.strip()) is not None:
-            return True
-        else:
-            return False
+        # `re` caches the compiled patterns
+        return re.search(regex_pattern, trimmed_string.strip()) is not None
 
     @staticmethod
     def extract_substring_with_pattern(regex_pattern, trimmed_string):
@@ -325,5 +459,8 @@ class JSONReader:
 
     @staticmethod
     def read_json_file(path: str) -> Dict:
-        with open(path, 'r') as fp:
+        """
+        :param path: The path of the JSON file, compressed with gzip if the extension is `.gz`
+        """
+        with (gzip.open(path, 'rt') if path.endswith('.gz') else open(path, 'r')) as fp:
             return json.load(fp)
@@ -0,0 +1,158 @@
+import json
+import os
+import subprocess
+from dataclasses import asdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from ._helpers import AnalyzerHelpers, Log
+from ._scanner import ScannedContent
+
+
+class ProjectModel:
+    """
+    Stored representation of the scanned content of every swift file of a project, keyed by the path relative to the
+    project root. It lets a following run patch only the files changed since the revision the model was built from.
+    """
+
+    def __init__(self, revision: Optional[str] = None, files: Optional[Dict[str, 'ScannedContent']] = None):
+        """
+        :param revision: The git revision the model was built from (None if it doesn't match any revision)
+        :param files: The scanned content of every file, keyed by relative path
+        """
+        self.revision = revision
+        self.files = {} if files is None else files
+
+    @property
+    def sorted_paths(self) -> List[str]:
+        """
+        :return: The paths of the files in the same order of the directory walk
+        """
+        return sorted(self.files.keys(), key=AnalyzerHelpers.walk_order_key)
+
+    def save(self, path: str):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(path, 'w') as fp:
+            json.dump({
+                "revision": self.revision,
+                "files": {p: asdict(c) for p, c in self.files.items()}
+            }, fp)
+
+    @staticmethod
+    def load(path: str) -> 'ProjectModel':
+        with open(path, 'r') as fp:
+            data = json.load(fp)
+        return ProjectModel(revision=data['revision'],
+                            files={p: ScannedContent(**c) for p, c in data['files'].items()})
+
+
+class GitRepository:
+    """
+    Minimal wrapper of the git command line, scoped to a directory of the working tree.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def resolve(self, revision: str) -> str:
+        """
+        :param revision: Any git revision (e.g. `origin/main`)
+        :return: The hash of the commit
+        """
+        return self.__git('rev-parse', '--verify', f'{revision}^{{commit}}').strip()
+
+    def has_local_changes(self) -> bool:
+        """
+        :return: True if any swift file of the directory differs from HEAD (including untracked files)
+        """
+        return len(self.__git('status', '--porcelain', '--', f'*{AnalyzerHelpers.SWIFT_FILE_EXTENSION}').strip()) > 0
+
+    def changed_files(self, revision: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Swift files changed in the working tree since the provided revision, relative to the directory.
+        Renamed files are reported as the deletion of the old path and the addition of the new one.
+        :param revision: The base revision
+        :return: (added or modified paths, deleted paths)
+        """
+        updated = set()
+        deleted = set()
+        fields = self.__git('diff', '--name-status', '-M', '--relative', '-z', revision, '--').split('\0')
+        i = 0
+        while i < len(fields) - 1:
+            status = fields[i]
+            if status.startswith(('R', 'C')):
+                old_path, new_path = fields[i + 1], fields[i + 2]
+                if status.startswith('R'):
+                    deleted.add(old_path)
+                updated.add(new_path)
+                i += 3
+            else:
+                (deleted if status == 'D' else updated).add(fields[i + 1])
+                i += 2
+        untracked = self.__git('ls-files', '--others', '--exclude-standard', '-z').split('\0')
+        updated.update(p for p in untracked if p)
+
+        def is_swift(path: str) -> bool:
+            return path.endswith(AnalyzerHelpers.SWIFT_FILE_EXTENSION)
+
+        return set(filter(is_swift, updated)), set(filter(is_swift, deleted - updated))
+
+    # Private
+
+    def __git(self, *args: str) -> str:
+        return subprocess.run(['git', '-C', self.directory] + list(args),
+                              check=True,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE,
+                              universal_newlines=True).stdout
+
+
+class IncrementalAnalysis:
+    """
+    Computes the files to parse again to update a stored model to the current working tree.
+    """
+
+    @staticmethod
+    def load_base_model(directory: str, model_path: str, since: str) -> Optional[Tuple['ProjectModel', Set[str]]]:
+        """
+        :param directory: The root path of the project
+        :param model_path: The path of the model built at the `since` revision
+        :param since: The base revision
+        :return: The base model without the deleted files and the set of relative paths to parse again,
+        or None if the model can't be used (a full analysis is required)
+        """
+        if not os.path.exists(model_path):
+            Log.warn(f'{model_path} not found, running a full analysis.')
+            return None
+        repository = GitRepository(directory)
+        try:
+            revision = repository.resolve(since)
+            model = ProjectModel.load(model_path)
+            if model.revision != revision:
+                Log.warn(f'The model in {model_path} was not built from {since} ({revision}), '
+                         f'running a full analysis.')
+                return None
+            updated, deleted = repository.changed_files(revision)
+        except (OSError, subprocess.CalledProcessError) as e:
+            Log.warn(f'Unable to compare {directory} with {since} ({e}), running a full analysis.')
+            return None
+
+        for path in deleted | updated:
+            model.files.pop(path, None)
+        return model, updated
+
+    @staticmethod
+    def current_revision(directory: str) -> Optional[str]:
+        """
+        :param directory: The root path of the project
+        :return: The HEAD revision, or None if the swift files have local changes or the directory isn't a git repository
+        """
+        repository = GitRepository(directory)
+        try:
+            if repository.has_local_changes():
+                Log.warn(f'{directory} has local changes, the model can\'t be used as base of an incremental analysis.')
+                return None
+            return repository.resolve('HEAD')
+        except (OSError, subprocess.CalledProcessError):
+            return None
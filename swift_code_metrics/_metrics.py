@@ -2,7 +2,10 @@ from ._helpers import AnalyzerHelpers, Log, ParsingHelpers, ReportingHelpers
 from ._parser import SwiftFile
 from dataclasses import dataclass
 from functional import seq
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, ItemsView, Iterator, List, Optional, Set
+
+if TYPE_CHECKING:
+    from ._snapshot import FrameworkMetrics
 
 
 class Metrics:
@@ -30,8 +33,19 @@ class Metrics:
         :param frameworks: The other frameworks in the project
         :return: the instability value (float)
         """
-        fan_in = Metrics.fan_in(framework, frameworks)
-        fan_out = Metrics.fan_out(framework)
+        return Metrics.instability_from_fans(framework,
+                                             fan_in=Metrics.fan_in(framework, frameworks),
+                                             fan_out=Metrics.fan_out(framework))
+
+    @staticmethod
+    def instability_from_fans(framework: 'Framework', fan_in: int, fan_out: int) -> float:
+        """
+        Instability: I = fan-out / (fan-in + fan-out)
+        :param framework: The framework to analyze
+        :param fan_in: The Fan-In value of the framework
+        :param fan_out: The Fan-Out value of the framework
+        :return: the instability value (float)
+        """
         sum_in_out = fan_in + fan_out
         if sum_in_out == 0:
             Log.warn(f'{framework.name} is not linked with the rest of the project.')
@@ -80,23 +94,39 @@ class Metrics:
         return fan_out
 
     @staticmethod
-    def external_dependencies(framework: 'Framework', frameworks: List['Framework']) -> List['Dependency']:
+    def external_dependencies(framework: 'Framework',
+                              frameworks: List['Framework'],
+                              framework_names: Optional[Set[str]] = None) -> List['Dependency']:
         """
         :param framework: The framework to inspect for imports
         :param frameworks: The other frameworks in the project
+        :param framework_names: The names of the frameworks (see `framework_names`), to build them once for all the
+        frameworks of the project
         :return: List of imported frameworks that are external to the project (e.g third party libraries).
         System libraries excluded.
         """
-        return Metrics.__filtered_imports(framework, frameworks, is_internal=False)
+        return Metrics.__filtered_imports(framework, frameworks, framework_names, is_internal=False)
 
     @staticmethod
-    def internal_dependencies(framework: 'Framework', frameworks: List['Framework']) -> List['Dependency']:
+    def internal_dependencies(framework: 'Framework',
+                              frameworks: List['Framework'],
+                              framework_names: Optional[Set[str]] = None) -> List['Dependency']:
         """
         :param framework: The framework to inspect for imports
         :param frameworks: The other frameworks in the project
+        :param framework_names: The names of the frameworks (see `framework_names`), to build them once for all the
+        frameworks of the project
         :return: List of imported frameworks that are internal to the project
         """
-        return Metrics.__filtered_imports(framework, frameworks, is_internal=True)
+        return Metrics.__filtered_imports(framework, frameworks, framework_names, is_internal=True)
+
+    @staticmethod
+    def framework_names(frameworks: List['Framework']) -> Set[str]:
+        """
+        :param frameworks: The frameworks in the project
+        :return: The names of the frameworks
+        """
+        return {f.name for f in frameworks}
 
     @staticmethod
     def total_dependencies(framework: 'Framework') -> List[str]:
@@ -177,43 +207,57 @@ class Metrics:
     @staticmethod
     def __filtered_imports(framework: 'Framework',
                            frameworks: List['Framework'],
+                           names: Optional[Set[str]],
                            is_internal: bool) -> List['Dependency']:
+        if names is None:
+            names = Metrics.framework_names(frameworks)
         return seq(framework.imports.items()) \
-            .filter(lambda f: (Metrics.__is_name_contained_in_list(f[0], frameworks)) == is_internal) \
+            .filter(lambda f: (f[0].name in names) == is_internal) \
             .map(lambda imp: Dependency(name=framework.name,
                                         dependent_framework=imp[0].name,
                                         number_of_imports=imp[1])) \
             .list()
 
-    @staticmethod
-    def __is_name_contained_in_list(framework: 'Framework', frameworks: List['Framework']) -> bool:
-        return len(seq(frameworks)
-                   .filter(lambda f: f.name == framework.name)
-                   .list()) > 0
-
 
-@dataclass
+@dataclass(init=False)
 class SyntheticData:
     """
     Representation of synthetic code metric data
     """
-    loc: int = 0
-    noc: int = 0
-    number_of_interfaces: int = 0
-    number_of_concrete_data_structures: int = 0
-    number_of_methods: int = 0
-    number_of_tests: int = 0
+    __slots__ = ('loc', 'noc', 'number_of_interfaces', 'number_of_concrete_data_structures', 'number_of_methods',
+                 'number_of_tests')
+
+    loc: int
+    noc: int
+    number_of_interfaces: int
+    number_of_concrete_data_structures: int
+    number_of_methods: int
+    number_of_tests: int
+
+    def __init__(self,
+                 loc: int = 0,
+                 noc: int = 0,
+                 number_of_interfaces: int = 0,
+                 number_of_concrete_data_structures: int = 0,
+                 number_of_methods: int = 0,
+                 number_of_tests: int = 0):
+        self.loc = loc
+        self.noc = noc
+        self.number_of_interfaces = number_of_interfaces
+        self.number_of_concrete_data_structures = number_of_concrete_data_structures
+        self.number_of_methods = number_of_methods
+        self.number_of_tests = number_of_tests
 
     @classmethod
     def from_swift_file(cls, swift_file: Optional['SwiftFile'] = None) -> 'SyntheticData':
         return SyntheticData(
             loc=0 if swift_file is None else swift_file.loc,
             noc=0 if swift_file is None else swift_file.n_of_comments,
-            number_of_interfaces=0 if swift_file is None else len(swift_file.interfaces),
+            number_of_interfaces=0 if swift_file is None else swift_file.n_of_interfaces,
             number_of_concrete_data_structures=0 if swift_file is None else \
-                len(swift_file.structs + swift_file.classes),
-            number_of_methods=0 if swift_file is None else len(swift_file.methods),
-            number_of_tests=0 if swift_file is None else len(swift_file.tests)
+                swift_file.n_of_concrete_data_structures,
+            number_of_methods=0 if swift_file is None else swift_file.n_of_methods,
+            number_of_tests=0 if swift_file is None else swift_file.n_of_tests
         )
 
     def __add__(self, data):
@@ -248,6 +292,18 @@ class SyntheticData:
             number_of_tests=self.number_of_tests - data.number_of_tests
         )
 
+    def append_data(self, data: 'SyntheticData'):
+        """
+        In place implementation of the `+` operator
+        :param data: An instance of SyntheticData
+        """
+        self.loc += data.loc
+        self.noc += data.noc
+        self.number_of_interfaces += data.number_of_interfaces
+        self.number_of_concrete_data_structures += data.number_of_concrete_data_structures
+        self.number_of_methods += data.number_of_methods
+        self.number_of_tests += data.number_of_tests
+
     @property
     def poc(self) -> float:
         return Metrics.percentage_of_comments(self.noc, self.loc)
@@ -265,12 +321,30 @@ class SyntheticData:
         }
 
 
-@dataclass()
+@dataclass(init=False)
 class FrameworkData(SyntheticData):
     """
     Enriched synthetic data
     """
-    n_o_i: int = 0
+    __slots__ = ('n_o_i',)
+
+    n_o_i: int
+
+    def __init__(self,
+                 loc: int = 0,
+                 noc: int = 0,
+                 number_of_interfaces: int = 0,
+                 number_of_concrete_data_structures: int = 0,
+                 number_of_methods: int = 0,
+                 number_of_tests: int = 0,
+                 n_o_i: int = 0):
+        super().__init__(loc=loc,
+                         noc=noc,
+                         number_of_interfaces=number_of_interfaces,
+                         number_of_concrete_data_structures=number_of_concrete_data_structures,
+                         number_of_methods=number_of_methods,
+                         number_of_tests=number_of_tests)
+        self.n_o_i = n_o_i
 
     @classmethod
     def from_swift_file(cls, swift_file: Optional['SwiftFile'] = None) -> 'FrameworkData':
@@ -308,6 +382,15 @@ class FrameworkData(SyntheticData):
         self.number_of_tests += sd.number_of_tests
         self.n_o_i += f.number_of_imports
 
+    def append_metrics(self, metrics: 'FrameworkMetrics'):
+        self.loc += metrics.loc
+        self.noc += metrics.noc
+        self.number_of_interfaces += metrics.n_a
+        self.number_of_concrete_data_structures += metrics.n_c
+        self.number_of_methods += metrics.nom
+        self.number_of_tests += metrics.n_of_tests
+        self.n_o_i += metrics.noi
+
     @property
     def as_dict(self) -> Dict:
         return {**super().as_dict, **{"noi": self.n_o_i}}
@@ -341,6 +424,8 @@ class Framework:
     def __init__(self, name: str, is_test_framework: bool = False):
         self.name = name
         self.__total_imports = {}
+        # Imports without Apple libraries, filtered once and invalidated by `append_import`
+        self.__imports = None
         self.submodule = SubModule(
             name=self.name,
             files=[],
@@ -363,6 +448,7 @@ class Framework:
             self.__total_imports[framework_import] = 1
         else:
             self.__total_imports[framework_import] += 1
+        self.__imports = None
 
     @property
     def data(self) -> SyntheticData:
@@ -384,9 +470,11 @@ class Framework:
     def imports(self) -> Dict[str, int]:
         """
         Returns the list of framework imports without Apple libraries
-        :return: list of filtered imports
+        :return: list of filtered imports (shared, not to be modified)
         """
-        return Framework.__filtered_imports(self.__total_imports.items())
+        if self.__imports is None:
+            self.__imports = Framework.__filtered_imports(self.__total_imports.items())
+        return self.__imports
 
     @property
     def number_of_imports(self) -> int:
@@ -421,11 +509,86 @@ class SubModule:
     """
     Representation of a submodule inside a Framework
     """
+    __slots__ = ('name', 'files', 'submodules', 'parent',
+                 '__children_by_name', '__positions', '__n_of_indexed_children',
+                 '__data', '__n_of_files', '__folded_data', '__n_of_folded_files')
+
     name: str
     files: List['SwiftFile']
     submodules: List['SubModule']
     parent: Optional['SubModule']
 
+    def __post_init__(self):
+        self.__reset_index()
+        # Totals of the subtree, computed by `__aggregate` and invalidated by `append_file`, `fold_file` and
+        # `add_submodule`
+        self.__data: Optional['SyntheticData'] = None
+        self.__n_of_files = 0
+        # Totals of the files folded in the submodule (not stored in `files`)
+        self.__folded_data = SyntheticData()
+        self.__n_of_folded_files = 0
+
+    def append_file(self, swift_file: 'SwiftFile'):
+        """
+        Adds a file to the submodule, invalidating the totals of the submodule and of its ancestors
+        :param swift_file: The file to add
+        """
+        self.files.append(swift_file)
+        self.__invalidate()
+
+    def add_submodule(self, submodule: 'SubModule'):
+        """
+        Adds a child to the submodule, invalidating the totals of the submodule and of its ancestors
+        :param submodule: The child to add (with this submodule as parent)
+        """
+        self.submodules.append(submodule)
+        self.__invalidate()
+
+    def fold_file(self, swift_file: 'SwiftFile'):
+        """
+        Adds the metrics of a file to the submodule without keeping a reference to the file
+        :param swift_file: The file to add
+        """
+        self.__folded_data.append_data(SyntheticData.from_swift_file(swift_file=swift_file))
+        self.__n_of_folded_files += 1
+        self.__invalidate()
+
+    @property
+    def n_of_own_files(self) -> int:
+        """
+        :return: The number of files of the submodule, without the files of its descendants
+        """
+        return len(self.files) + self.__n_of_folded_files
+
+    def own_files_submodule(self, name: str) -> 'SubModule':
+        """
+        :param name: The name of the new submodule
+        :return: A child submodule (not added to `submodules`) with the files of this submodule, folded files included
+        """
+        submodule = SubModule(name=name, files=list(self.files), submodules=[], parent=self)
+        submodule.__folded_data.append_data(self.__folded_data)
+        submodule.__n_of_folded_files = self.__n_of_folded_files
+        return submodule
+
+    def child(self, name: str) -> Optional['SubModule']:
+        """
+        :param name: The name of the child submodule
+        :return: The first child with the provided name, None if there isn't any
+        """
+        self.__index_children()
+        return self.__children_by_name.get(name)
+
+    def preorder(self) -> Iterator['SubModule']:
+        """
+        Depth-first traversal of the tree.
+        :return: iterator of the submodule followed by all its descendants, in the same order of `next`
+        """
+        stack = [self]
+        while len(stack) > 0:
+            submodule = stack.pop()
+            yield submodule
+            stack.extend(reversed(submodule.submodules))
+
     @property
     def next(self) -> 'SubModule':
         if len(self.submodules) == 0:
@@ -437,7 +600,7 @@ class SubModule:
         next_level = self.parent
         current_level = self
         while next_level is not None:
-            next_i = next_level.submodules.index(current_level) + 1
+            next_i = next_level.__position(current_level) + 1
             if next_i < len(next_level.submodules):
                 return next_level.submodules[next_i]
             else:
@@ -448,9 +611,8 @@ class SubModule:
 
     @property
     def n_of_files(self) -> int:
-        sub_files = 0 if (len(self.submodules) == 0) else \
-            seq([s.n_of_files for s in self.submodules]).reduce(lambda a, b: a + b)
-        return len(self.files) + sub_files
+        self.__aggregate()
+        return self.__n_of_files
 
     @property
     def path(self) -> str:
@@ -459,11 +621,11 @@ class SubModule:
 
     @property
     def data(self) -> 'SyntheticData':
-        root_module_files = [SyntheticData()] if (len(self.files) == 0) else \
-            [SyntheticData.from_swift_file(swift_file=f) for f in self.files]
-        submodules_files = SyntheticData() if (len(self.submodules) == 0) else \
-            seq([s.data for s in self.submodules]).reduce(lambda a, b: a + b)
-        return seq(root_module_files).reduce(lambda a, b: a + b) + submodules_files
+        """
+        :return: The totals of the files of the subtree (shared, not to be modified)
+        """
+        self.__aggregate()
+        return self.__data
 
     @property
     def as_dict(self) -> Dict:
@@ -475,12 +637,71 @@ class SubModule:
             }
         }
 
+    # Private
+
+    def __position(self, submodule: 'SubModule') -> int:
+        self.__index_children()
+        position = self.__positions.get(id(submodule))
+        if position is None or self.submodules[position] is not submodule:
+            return self.submodules.index(submodule)
+        return position
+
+    def __aggregate(self):
+        """
+        Computes the totals of the stale submodules of the subtree in a single post-order pass.
+        """
+        stale_submodules = []
+        stack = [self]
+        while len(stack) > 0:
+            submodule = stack.pop()
+            if submodule.__data is None:
+                stale_submodules.append(submodule)
+                stack.extend(submodule.submodules)
+
+        # The descendants are always aggregated before their ancestors
+        for submodule in reversed(stale_submodules):
+            data = SyntheticData()
+            data.append_data(submodule.__folded_data)
+            for f in submodule.files:
+                data.append_data(SyntheticData.from_swift_file(swift_file=f))
+            n_of_files = submodule.n_of_own_files
+            for child in submodule.submodules:
+                data.append_data(child.__data)
+                n_of_files += child.__n_of_files
+            submodule.__data = data
+            submodule.__n_of_files = n_of_files
+
+    def __invalidate(self):
+        # The ancestors of a stale submodule are already stale
+        submodule = self
+        while submodule is not None and submodule.__data is not None:
+            submodule.__data = None
+            submodule = submodule.parent
+
+    def __reset_index(self):
+        # Index of the children by name and by position, updated lazily as `submodules` grows
+        self.__children_by_name: Dict[str, 'SubModule'] = {}
+        self.__positions: Dict[int, int] = {}
+        self.__n_of_indexed_children = 0
+
+    def __index_children(self):
+        if self.__n_of_indexed_children > len(self.submodules):
+            # Children removed: the index is built again
+            self.__reset_index()
+        for i in range(self.__n_of_indexed_children, len(self.submodules)):
+            submodule = self.submodules[i]
+            self.__children_by_name.setdefault(submodule.name, submodule)
+            self.__positions.setdefault(id(submodule), i)
+        self.__n_of_indexed_children = len(self.submodules)
+
 
-@dataclass
 class Dependency:
-    name: str
-    dependent_framework: str
-    number_of_imports: int = 0
+    __slots__ = ('name', 'dependent_framework', 'number_of_imports')
+
+    def __init__(self, name: str, dependent_framework: str, number_of_imports: int = 0):
+        self.name = name
+        self.dependent_framework = dependent_framework
+        self.number_of_imports = number_of_imports
 
     def __eq__(self, other):
         return (self.name == other.name) and \
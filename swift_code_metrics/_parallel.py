@@ -0,0 +1,202 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ._cache import FileVersion, ParseCache
+from ._parser import SwiftFileParser, SwiftFile
+from ._scanner import ScannedContent
+
+# (index, full path, subdir)
+ParsingTask = Tuple[int, str, str]
+# (index, scanned content, parsed swift files, version of the scanned file if requested)
+ParsingResult = Tuple[int, 'ScannedContent', List['SwiftFile'], Optional['FileVersion']]
+# (base path, tests default paths, counts only, with file version)
+ParserOptions = Tuple[str, List[str], bool, bool]
+
+
+class ParallelParser:
+    # Below this number of files the cost of spawning the workers is higher than the parsing itself
+    MIN_FILES_PER_WORKER = 16
+    # Number of chunks scheduled for each worker, to balance the load at the end of the run
+    CHUNKS_PER_WORKER = 4
+    # Number of files parsed in each batch by `stream`
+    STREAM_BATCH_SIZE = 1024
+
+    def __init__(self,
+                 base_path: str,
+                 tests_default_paths: List[str],
+                 jobs: int = 1,
+                 cache: Optional['ParseCache'] = None,
+                 counts_only: bool = False):
+        """
+        Parses swift files, distributing the work on a process pool when more than one job is requested.
+        :param base_path: The root path of the project
+        :param tests_default_paths: List of paths that contains test classes
+        :param jobs: Maximum number of worker processes
+        :param cache: Cache of the scanned files (optional). Only the files not available in cache are scanned.
+        :param counts_only: True to parse only the number of declarations of the files, without their names
+        """
+        self.base_path = base_path
+        self.tests_default_paths = tests_default_paths
+        self.jobs = max(1, jobs)
+        self.cache = cache
+        self.counts_only = counts_only
+
+    def parse(self, files: List[Tuple[str, str]]) -> Iterator[Tuple[str, 'ScannedContent', List['SwiftFile']]]:
+        """
+        Parses the provided files.
+        The results are always yielded in the same order of `files`, regardless of the scheduling of the workers.
+        :param files: List of (full path, subdir) of the files to parse
+        :return: iterator of (full path, scanned content, parsed swift files)
+        """
+        executors: List[ProcessPoolExecutor] = []
+        try:
+            yield from self.__parse_batch(files, executors, max_workers=None)
+        finally:
+            for executor in executors:
+                executor.shutdown()
+
+    def stream(self,
+               files: Iterable[Tuple[str, str]],
+               batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Tuple[str, 'ScannedContent', List['SwiftFile']]]:
+        """
+        Parses the provided files in batches: at most `batch_size` files (and their results) are in memory at once.
+        The results are yielded in the same order of `files`, the workers are shared by all the batches.
+        :param files: iterable of (full path, subdir) of the files to parse
+        :param batch_size: Number of files parsed in each batch
+        :return: iterator of (full path, scanned content, parsed swift files)
+        """
+        executors: List[ProcessPoolExecutor] = []
+        try:
+            iterator = iter(files)
+            batch = list(islice(iterator, batch_size))
+            while len(batch) > 0:
+                yield from self.__parse_batch(batch, executors, max_workers=self.jobs)
+                batch = list(islice(iterator, batch_size))
+        finally:
+            for executor in executors:
+                executor.shutdown()
+
+    # Private
+
+    def __parse_batch(self,
+                      files: List[Tuple[str, str]],
+                      executors: List[ProcessPoolExecutor],
+                      max_workers: Optional[int]) -> Iterator[Tuple[str, 'ScannedContent', List['SwiftFile']]]:
+        """
+        :param executors: The process pool (created at the first batch that requires it, then reused)
+        :param max_workers: The size of the process pool, None to size it on the current batch
+        """
+        tasks = [(i, full_path, subdir) for i, (full_path, subdir) in enumerate(files)]
+        cached_contents: Dict[int, 'ScannedContent'] = {}
+        if self.cache is not None:
+            for index, full_path, _ in tasks:
+                content = self.cache.lookup(full_path)
+                if content is not None:
+                    cached_contents[index] = content
+        missing_tasks = [t for t in tasks if t[0] not in cached_contents]
+
+        if self.jobs == 1 or len(missing_tasks) < 2 * ParallelParser.MIN_FILES_PER_WORKER:
+            for index, full_path, subdir in tasks:
+                yield (full_path,) + self.__parse_task(index, full_path, subdir, cached_contents.pop(index, None))
+            return
+
+        workers = min(self.jobs, len(missing_tasks) // ParallelParser.MIN_FILES_PER_WORKER)
+        if len(executors) == 0:
+            executors.append(ProcessPoolExecutor(max_workers=max_workers or workers))
+        chunks = ParallelParser.__size_aware_chunks(missing_tasks, workers * ParallelParser.CHUNKS_PER_WORKER)
+        pending: Dict[int, Tuple['ScannedContent', List['SwiftFile']]] = {}
+        futures = as_completed([executors[0].submit(_parse_chunk, self.__parser_options, chunk) for chunk in chunks])
+        for index, full_path, subdir in tasks:
+            if index in cached_contents:
+                yield (full_path,) + self.__parse_task(index, full_path, subdir, cached_contents.pop(index))
+                continue
+            # Collects the results of the workers until the current file is available
+            while index not in pending:
+                for result_index, content, swift_files, version in next(futures).result():
+                    self.__store(tasks[result_index][1], content, version)
+                    pending[result_index] = (content, swift_files)
+            yield (full_path,) + pending.pop(index)
+
+    def __parse_task(self,
+                     index: int,
+                     full_path: str,
+                     subdir: str,
+                     content: Optional['ScannedContent']) -> Tuple['ScannedContent', List['SwiftFile']]:
+        if content is not None:
+            return content, _parse_file(self.__parser_options, full_path, subdir, content)
+        _, content, swift_files, version = _scan_and_parse_file(self.__parser_options, (index, full_path, subdir))
+        self.__store(full_path, content, version)
+        return content, swift_files
+
+    @property
+    def __parser_options(self) -> 'ParserOptions':
+        # The version of the file stored in the cache is taken from the bytes read for the scan
+        return self.base_path, self.tests_default_paths, self.counts_only, self.cache is not None
+
+    def __store(self, full_path: str, content: 'ScannedContent', version: Optional['FileVersion']):
+        if self.cache is not None:
+            self.cache.store(full_path, content, version)
+
+    @staticmethod
+    def __size_aware_chunks(tasks: List['ParsingTask'], n_of_chunks: int) -> List[List['ParsingTask']]:
+        """
+        Groups the tasks in chunks of similar size (in bytes), starting from the biggest files.
+        Files bigger than the target size of a chunk are scheduled alone and first, so that a single huge file
+        is not left running while the other workers are idle.
+        """
+        sized_tasks = sorted(((ParallelParser.__file_size(t[1]), t) for t in tasks),
+                             key=lambda st: (-st[0], st[1][0]))
+        target_size = max(1, sum(s for s, _ in sized_tasks) // n_of_chunks)
+
+        chunks = []
+        current_chunk = []
+        current_size = 0
+        for size, task in sized_tasks:
+            current_chunk.append(task)
+            current_size += size
+            if current_size >= target_size:
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_size = 0
+        if len(current_chunk) > 0:
+            chunks.append(current_chunk)
+        return chunks
+
+    @staticmethod
+    def __file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+
+# Workers
+
+def _parse_file(options: 'ParserOptions', full_path: str, subdir: str, content: 'ScannedContent') -> List['SwiftFile']:
+    return _parser(options, full_path, subdir).parse(content)
+
+
+def _scan_and_parse_file(options: 'ParserOptions', task: 'ParsingTask') -> 'ParsingResult':
+    index, full_path, subdir = task
+    parser = _parser(options, full_path, subdir)
+    if not options[3]:
+        content = parser.scan()
+        return index, content, parser.parse(content), None
+    data, version = ParseCache.read(full_path)
+    content = parser.scan(data)
+    return index, content, parser.parse(content), version
+
+
+def _parse_chunk(options: 'ParserOptions', chunk: List['ParsingTask']) -> List['ParsingResult']:
+    return [_scan_and_parse_file(options, task) for task in chunk]
+
+
+def _parser(options: 'ParserOptions', full_path: str, subdir: str) -> 'SwiftFileParser':
+    base_path, tests_default_paths, counts_only, _ = options
+    return SwiftFileParser(file=full_path,
+                           base_path=base_path,
+                           current_subdir=subdir,
+                           tests_default_paths=tests_default_paths,
+                           counts_only=counts_only)
@@ -1,11 +1,18 @@
+import io
 import os
+import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
-from ._helpers import AnalyzerHelpers, ParsingHelpers, JSONReader
+from typing import Any, Dict, List, Optional, Tuple
+from ._helpers import AnalyzerHelpers, ParsingHelpers, JSONReader, PathMatcher
 from ._helpers import Log
+from ._scanner import LineScanner, ScannedContent
 
 
 class SwiftFile(object):
+    __slots__ = ('path', 'framework_name', 'loc', 'imports', 'interfaces', 'structs', 'classes', 'methods',
+                 'n_of_comments', 'is_shared', 'is_test',
+                 'n_of_interfaces', 'n_of_concrete_data_structures', 'n_of_methods', 'n_of_tests')
+
     def __init__(self,
                  path: str,
                  framework_name: str,
@@ -17,7 +24,8 @@ class SwiftFile(object):
                  methods: List[str],
                  n_of_comments: int,
                  is_shared: bool,
-                 is_test: bool):
+                 is_test: bool,
+                 counts_only: bool = False):
         """
         Creates a SwiftFile instance that represents a parsed swift file.
         :param path: The path of the file being analyzed
@@ -31,18 +39,31 @@ class SwiftFile(object):
         :param n_of_comments: Total number of comments in the file
         :param is_shared: True if the file is shared with other frameworks
         :param is_test: True if the file is a test class
+        :param counts_only: True to keep only the number of interfaces, structs, classes and methods, without names
         """
         self.path = path
-        self.framework_name = framework_name
+        self.framework_name = sys.intern(framework_name)
         self.loc = loc
-        self.imports = imports
-        self.interfaces = interfaces
-        self.structs = structs
-        self.classes = classes
-        self.methods = methods
+        self.imports = [sys.intern(i) for i in imports]
         self.n_of_comments = n_of_comments
         self.is_shared = is_shared
         self.is_test = is_test
+        self.n_of_interfaces = len(interfaces)
+        self.n_of_concrete_data_structures = len(structs) + len(classes)
+        self.n_of_methods = len(methods)
+        self.n_of_tests = sum(1 for m in methods if m.startswith(ParsingHelpers.TEST_METHOD_PREFIX))
+        self.interfaces = [] if counts_only else interfaces
+        self.structs = [] if counts_only else structs
+        self.classes = [] if counts_only else classes
+        self.methods = [] if counts_only else methods
+
+    def __setstate__(self, state: Tuple[None, Dict]):
+        # Names shared by many files are interned again when transferred from the parsing processes
+        _, slots = state
+        for name, value in slots.items():
+            setattr(self, name, value)
+        self.framework_name = sys.intern(self.framework_name)
+        self.imports = [sys.intern(i) for i in self.imports]
 
     @property
     def tests(self) -> List[str]:
@@ -67,22 +88,95 @@ class ProjectPathsOverride(object):
         return ProjectPathsOverride(entries=JSONReader.read_json_file(path))
 
 
+class ProjectPathsOverrideResolver(object):
+    """
+    Index of the libraries and shared paths of a project paths override, keyed by path component.
+    """
+
+    # Path of the override file -> ((mtime, size), resolver) loaded by the current process
+    __loaded: Dict[str, Tuple[Tuple[int, int], 'ProjectPathsOverrideResolver']] = {}
+
+    def __init__(self, project_override: 'ProjectPathsOverride'):
+        self.__libraries = project_override.libraries
+        self.__shared = project_override.shared
+        # The first declaration of a path has the priority
+        self.__libraries_index = {}
+        for i, library in reversed(list(enumerate(project_override.libraries))):
+            self.__libraries_index[library['path']] = i
+        self.__shared_index = {}
+        for i, shared_path in reversed(list(enumerate(project_override.shared))):
+            self.__shared_index[shared_path['path']] = i
+        # Names of the libraries for each value of their test flag (as declared, not only True or False)
+        self.__libraries_names: Dict[Any, List[str]] = {}
+        for library in project_override.libraries:
+            self.__libraries_names.setdefault(library['is_test'], []).append(library['name'])
+
+    @staticmethod
+    def load(path: str) -> Optional['ProjectPathsOverrideResolver']:
+        """
+        Loads the override file, reusing the resolver already loaded if the file didn't change.
+        :param path: The path of the project paths override file
+        :return: The resolver, or None if the file doesn't exist
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        loaded = ProjectPathsOverrideResolver.__loaded.get(path)
+        if loaded is None or loaded[0] != stamp:
+            resolver = ProjectPathsOverrideResolver(ProjectPathsOverride.load_from_json(path))
+            loaded = (stamp, resolver)
+            ProjectPathsOverrideResolver.__loaded[path] = loaded
+        return loaded[1]
+
+    def resolve(self, file_parts: Tuple[str, ...]) -> Optional[Tuple[List[str], bool]]:
+        """
+        :param file_parts: The components of the path of the file
+        :return: The list of frameworks and the test flag of the file, None if not classified
+        """
+        # Analysis of custom libraries folder
+        libraries = [self.__libraries_index[p] for p in file_parts if p in self.__libraries_index]
+        if len(libraries) > 0:
+            library = self.__libraries[min(libraries)]
+            return [library['name']], library['is_test']
+        # Analysis of shared folder
+        shared_paths = [self.__shared_index[p] for p in file_parts if p in self.__shared_index]
+        if len(shared_paths) > 0:
+            is_test = self.__shared[min(shared_paths)]['is_test']
+            return self.__libraries_names.get(is_test, []), is_test
+        return None
+
+
 class SwiftFileParser(object):
-    def __init__(self, file: str, base_path: str, current_subdir: str, tests_default_paths: List[str]):
+    # (base path, subdir) -> path of the subdir relative to the base path, computed once per folder
+    __relative_subdirs: Dict[Tuple[str, str], str] = {}
+
+    def __init__(self,
+                 file: str,
+                 base_path: str,
+                 current_subdir: str,
+                 tests_default_paths: List[str],
+                 counts_only: bool = False):
         self.file = file
         self.base_path = base_path
         self.current_subdir = current_subdir
         self.tests_default_paths = tests_default_paths
-        self.imports = []
-        self.attributes_regex_map = {
-            ParsingHelpers.IMPORTS: [],
-            ParsingHelpers.PROTOCOLS: [],
-            ParsingHelpers.STRUCTS: [],
-            ParsingHelpers.CLASSES: [],
-            ParsingHelpers.FUNCS: [],
-        }
-
-    def parse(self) -> List['SwiftFile']:
+        self.counts_only = counts_only
+
+    def scan(self, data: Optional[bytes] = None) -> 'ScannedContent':
+        """
+        Scans the content of the .swift file.
+        :param data: The content of the file, when it is already read (e.g. to compute its hash)
+        :return: an instance of ScannedContent with the declarations found in the provided `file`
+        """
+        if data is not None:
+            # Same newlines translation of the file opened in text mode
+            return LineScanner.scan(io.StringIO(data.decode('utf-8'), newline=None))
+        with open(self.file, encoding='utf-8') as f:
+            return LineScanner.scan(f)
+
+    def parse(self, content: Optional['ScannedContent'] = None) -> List['SwiftFile']:
         """
         Parses the .swift file to inspect the code inside.
         Notes:
@@ -90,44 +184,11 @@ class SwiftFileParser(object):
           `default_framework_name` will be used. No inspection of the xcodeproj will be made.
         - The list of methods currently doesn't support computed vars
         - Inline comments in code (such as `struct Data: {} //dummy data`) are currently not supported
+        :param content: The result of a previous scan of the file (if available)
         :return: an instance of SwiftFile with the result of the parsing of the provided `file`
         """
-        n_of_comments = 0
-        loc = 0
-
-        commented_line = False
-        with open(self.file, encoding='utf-8') as f:
-            for line in f:
-                trimmed = line.strip()
-                if len(trimmed) == 0:
-                    continue
-
-                # Comments
-                if ParsingHelpers.check_existence(ParsingHelpers.SINGLE_COMMENT, trimmed):
-                    n_of_comments += 1
-                    continue
-
-                if ParsingHelpers.check_existence(ParsingHelpers.BEGIN_COMMENT, trimmed):
-                    commented_line = True
-                    n_of_comments += 1
-
-                if ParsingHelpers.check_existence(ParsingHelpers.END_COMMENT, trimmed):
-                    if not commented_line:
-                        n_of_comments += 1
-                    commented_line = False
-                    continue
-
-                if commented_line:
-                    n_of_comments += 1
-                    continue
-
-                loc += 1
-
-                for key, value in self.attributes_regex_map.items():
-                    extracted_value = ParsingHelpers.extract_substring_with_pattern(key, trimmed)
-                    if len(extracted_value) > 0:
-                        value.append(extracted_value)
-                        continue
+        if content is None:
+            content = self.scan()
 
         subdir = self.file.replace(self.base_path, '', 1)
         first_subpath = self.__extract_first_subpath(subdir)
@@ -136,39 +197,34 @@ class SwiftFileParser(object):
                                    self.__extract_attributes(first_subpath)
 
         is_shared_file = len(framework_names) > 1
+        path = self.__relative_path()
         return [SwiftFile(
-            path=Path(self.current_subdir.replace(f'{self.base_path}/', '')) / Path(self.file).name,
+            path=path,
             framework_name=f,
-            loc=loc,
-            imports=self.attributes_regex_map[ParsingHelpers.IMPORTS],
-            interfaces=self.attributes_regex_map[ParsingHelpers.PROTOCOLS],
-            structs=self.attributes_regex_map[ParsingHelpers.STRUCTS],
-            classes=self.attributes_regex_map[ParsingHelpers.CLASSES],
-            methods=self.attributes_regex_map[ParsingHelpers.FUNCS],
-            n_of_comments=n_of_comments,
+            loc=content.loc,
+            imports=content.imports,
+            interfaces=content.interfaces,
+            structs=content.structs,
+            classes=content.classes,
+            methods=content.methods,
+            n_of_comments=content.n_of_comments,
             is_shared=is_shared_file,
-            is_test=is_test
+            is_test=is_test,
+            counts_only=self.counts_only
         ) for f in framework_names]
 
     # Private helpers
 
     def __extract_overrides(self, first_subpath: str) -> Optional[Tuple[List[str], bool]]:
-        project_override_path = Path(self.base_path) / first_subpath / ParsingHelpers.FRAMEWORK_STRUCTURE_OVERRIDE_FILE
-        if not project_override_path.exists():
+        project_override_path = os.path.join(self.base_path, first_subpath,
+                                             ParsingHelpers.FRAMEWORK_STRUCTURE_OVERRIDE_FILE)
+        resolver = ProjectPathsOverrideResolver.load(project_override_path)
+        if resolver is None:
             return None
 
-        # Analysis of custom libraries folder
-        file_parts = Path(self.file).parts
-        project_override = ProjectPathsOverride.load_from_json(str(project_override_path))
-        for library in project_override.libraries:
-            if library['path'] in file_parts:
-                return [library['name']], library['is_test']
-        # Analysis of shared folder
-        for shared_path in project_override.shared:
-            if shared_path['path'] in file_parts:
-                is_test = shared_path['is_test']
-                libraries = [l['name'] for l in project_override.libraries if l['is_test'] == is_test]
-                return libraries, shared_path['is_test']
+        resolved = resolver.resolve(Path(self.file).parts)
+        if resolved is not None:
+            return list(resolved[0]), resolved[1]
 
         # No overrides (wrong configuration)
         Log.warn(f'{self.file} not classified in a folder with projects overrides (scm.json).')
@@ -176,7 +232,7 @@ class SwiftFileParser(object):
 
     def __extract_attributes(self, first_subpath: str) -> Tuple[List[str], bool]:
         # Test attribute
-        is_test = AnalyzerHelpers.is_path_in_list(self.current_subdir, self.tests_default_paths)
+        is_test = PathMatcher.for_patterns(self.tests_default_paths).matches(self.current_subdir)
 
         # Root folder files
         if first_subpath.endswith(AnalyzerHelpers.SWIFT_FILE_EXTENSION):
@@ -185,6 +241,15 @@ class SwiftFileParser(object):
             suffix = ParsingHelpers.DEFAULT_TEST_FRAMEWORK_SUFFIX if is_test else ''
             return [first_subpath + suffix], is_test
 
+    def __relative_path(self) -> str:
+        key = (self.base_path, self.current_subdir)
+        relative_subdir = SwiftFileParser.__relative_subdirs.get(key)
+        if relative_subdir is None:
+            relative_subdir = str(Path(self.current_subdir.replace(f'{self.base_path}/', '')))
+            SwiftFileParser.__relative_subdirs[key] = relative_subdir
+        file_name = os.path.basename(self.file)
+        return file_name if relative_subdir == '.' else f'{relative_subdir}/{file_name}'
+
     def __extract_first_subpath(self, subdir: str) -> str:
         subdirs = os.path.split(subdir)
         if len(subdirs[0]) > 1:
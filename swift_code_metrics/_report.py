@@ -1,13 +1,24 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 from ._helpers import ReportingHelpers
 from ._metrics import FrameworkData, Framework, Metrics
 from ._parser import SwiftFile
+from ._snapshot import FrameworkMetrics, MetricsSnapshot
 
 
 class ReportProcessor:
 
     @staticmethod
-    def generate_report(frameworks: List['Framework'], shared_files: Dict[str, 'SwiftFile']):
+    def generate_report(frameworks: List['Framework'],
+                        shared_files: Dict[str, 'SwiftFile'],
+                        snapshot: Optional['MetricsSnapshot'] = None):
+        """
+        :param frameworks: The frameworks of the project
+        :param shared_files: The files shared by more frameworks, keyed by path
+        :param snapshot: The metrics of the frameworks (computed if not provided)
+        :return: The report of the project
+        """
+        if snapshot is None:
+            snapshot = MetricsSnapshot.build(frameworks)
         report = Report()
 
         # Shared files
@@ -22,62 +33,49 @@ class ReportProcessor:
                 else:
                     report.non_test_framework_aggregate -= shared_file_data
 
-        # Frameworks
+        # Frameworks (the analyses are built when the report is read or written)
         for f in sorted(frameworks, key=lambda fr: fr.name, reverse=False):
-            analysis = ReportProcessor.__framework_analysis(f, frameworks)
+            metrics = snapshot[f.name]
+            report.append_framework(f, metrics)
             if f.is_test_framework:
-                report.tests_framework.append(analysis)
-                report.test_framework_aggregate.append_framework(f)
+                report.test_framework_aggregate.append_metrics(metrics)
             else:
-                report.non_test_framework.append(analysis)
-                report.non_test_framework_aggregate.append_framework(f)
-            report.total_aggregate.append_framework(f)
+                report.non_test_framework_aggregate.append_metrics(metrics)
+            report.total_aggregate.append_metrics(metrics)
 
         return report
 
     @staticmethod
-    def __framework_analysis(framework: 'Framework', frameworks: List['Framework']) -> Dict:
+    def framework_analysis(framework: 'Framework', metrics: 'FrameworkMetrics') -> Dict:
         """
         :param framework: The framework to analyze
+        :param metrics: The metrics of the framework
         :return: The architectural analysis of the framework
         """
-        framework_data = framework.data
-        loc = framework_data.loc
-        noc = framework_data.noc
-        poc = Metrics.percentage_of_comments(framework_data.noc,
-                                             framework_data.loc)
+        poc = metrics.poc
         analysis = Metrics.poc_analysis(poc)
-        n_a = framework_data.number_of_interfaces
-        n_c = framework_data.number_of_concrete_data_structures
-        nom = framework_data.number_of_methods
-        dependencies = Metrics.total_dependencies(framework)
-        n_of_tests = framework_data.number_of_tests
-        n_of_imports = framework.number_of_imports
 
         # Non-test framework analysis
         non_test_analysis = {}
         if not framework.is_test_framework:
-            non_test_analysis["fan_in"] = Metrics.fan_in(framework, frameworks)
-            non_test_analysis["fan_out"] = Metrics.fan_out(framework)
-            i = Metrics.instability(framework, frameworks)
-            a = Metrics.abstractness(framework)
-            non_test_analysis["i"] = ReportingHelpers.decimal_format(i)
-            non_test_analysis["a"] = ReportingHelpers.decimal_format(a)
-            non_test_analysis["d_3"] = ReportingHelpers.decimal_format(
-                Metrics.distance_main_sequence(framework, frameworks))
-            analysis += Metrics.ia_analysis(i, a)
+            non_test_analysis["fan_in"] = metrics.fan_in
+            non_test_analysis["fan_out"] = metrics.fan_out
+            non_test_analysis["i"] = ReportingHelpers.decimal_format(metrics.instability)
+            non_test_analysis["a"] = ReportingHelpers.decimal_format(metrics.abstractness)
+            non_test_analysis["d_3"] = ReportingHelpers.decimal_format(metrics.distance_main_sequence)
+            analysis += Metrics.ia_analysis(metrics.instability, metrics.abstractness)
 
         base_analysis = {
-            "loc": loc,
-            "noc": noc,
+            "loc": metrics.loc,
+            "noc": metrics.noc,
             "poc": ReportingHelpers.decimal_format(poc),
-            "n_a": n_a,
-            "n_c": n_c,
-            "nom": nom,
-            "not": n_of_tests,
-            "noi": n_of_imports,
+            "n_a": metrics.n_a,
+            "n_c": metrics.n_c,
+            "nom": metrics.nom,
+            "not": metrics.n_of_tests,
+            "noi": metrics.noi,
             "analysis": analysis,
-            "dependencies": dependencies,
+            "dependencies": list(metrics.dependencies),
             "submodules": framework.submodule.as_dict
         }
 
@@ -88,8 +86,8 @@ class ReportProcessor:
 
 class Report:
     def __init__(self):
-        self.non_test_framework = list()
-        self.tests_framework = list()
+        # (framework, metrics) of the non-test and test frameworks, in the order of the report
+        self.__frameworks: Dict[bool, List[Tuple['Framework', 'FrameworkMetrics']]] = {False: [], True: []}
         self.non_test_framework_aggregate = FrameworkData()
         self.test_framework_aggregate = FrameworkData()
         self.total_aggregate = FrameworkData()
@@ -101,6 +99,33 @@ class Report:
         self.shared_key = "shared"
         self.total_key = "total"
 
+    def append_framework(self, framework: 'Framework', metrics: 'FrameworkMetrics'):
+        self.__frameworks[framework.is_test_framework].append((framework, metrics))
+
+    def framework_metrics(self, is_test: bool = False) -> List[Tuple['Framework', 'FrameworkMetrics']]:
+        """
+        :param is_test: True for the test frameworks, False for the other frameworks
+        :return: The frameworks with their metrics, in the order of the report
+        """
+        return self.__frameworks[is_test]
+
+    def framework_analyses(self, is_test: bool = False) -> Iterator[Dict]:
+        """
+        Builds the analyses of the frameworks one at a time.
+        :param is_test: True for the test frameworks, False for the other frameworks
+        :return: iterator of the analyses of the frameworks
+        """
+        for framework, metrics in self.__frameworks[is_test]:
+            yield ReportProcessor.framework_analysis(framework, metrics)
+
+    @property
+    def non_test_framework(self) -> List[Dict]:
+        return list(self.framework_analyses(is_test=False))
+
+    @property
+    def tests_framework(self) -> List[Dict]:
+        return list(self.framework_analyses(is_test=True))
+
     @property
     def as_dict(self) -> Dict:
         return {
@@ -0,0 +1,86 @@
+import json
+import mmap
+import os
+from typing import Any, Dict, List, Optional
+
+
+class JSONReportReader:
+    """
+    Random access to the JSON report through its index (`output.index.json`): only the requested section or framework
+    is read from the memory mapped report and decoded.
+    """
+
+    REPORT_FILE_NAME = 'output.json'
+    INDEX_FILE_NAME = 'output.index.json'
+    # Bump when the format of the index changes
+    INDEX_VERSION = 1
+
+    def __init__(self, directory: str):
+        """
+        :param directory: The artifacts directory, containing the report and its index
+        """
+        with open(os.path.join(directory, JSONReportReader.INDEX_FILE_NAME), 'r') as fp:
+            index = json.load(fp)
+        if index.get('version') != JSONReportReader.INDEX_VERSION:
+            raise ValueError(f'Unsupported version of the report index: {index.get("version")}')
+        self.__sections: Dict[str, List[int]] = index['sections']
+        self.__frameworks: Dict[str, List[int]] = index['frameworks']
+
+        self.__fp = open(os.path.join(directory, JSONReportReader.REPORT_FILE_NAME), 'rb')
+        if os.fstat(self.__fp.fileno()).st_size != index['size']:
+            self.__fp.close()
+            raise ValueError('The report has been modified after the creation of its index')
+        self.__map: Optional[mmap.mmap] = None
+
+    def __enter__(self) -> 'JSONReportReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def framework_names(self) -> List[str]:
+        """
+        :return: The names of the frameworks of the report, in the order of the report
+        """
+        return list(self.__frameworks.keys())
+
+    @property
+    def section_names(self) -> List[str]:
+        """
+        :return: The top level keys of the report
+        """
+        return list(self.__sections.keys())
+
+    def framework(self, name: str) -> Dict:
+        """
+        :param name: The name of the framework
+        :return: The analysis of the framework (the value of its entry in the report)
+        """
+        span = self.__frameworks.get(name)
+        if span is None:
+            raise KeyError(name)
+        return self.__decode(span)[name]
+
+    def section(self, key: str) -> Any:
+        """
+        :param key: The top level key of the report (e.g. `aggregate` or `shared`)
+        :return: The value of the section
+        """
+        span = self.__sections.get(key)
+        if span is None:
+            raise KeyError(key)
+        return self.__decode(span)
+
+    def close(self):
+        if self.__map is not None:
+            self.__map.close()
+        self.__fp.close()
+
+    # Private
+
+    def __decode(self, span: List[int]) -> Any:
+        offset, length = span
+        if self.__map is None:
+            self.__map = mmap.mmap(self.__fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return json.loads(self.__map[offset:offset + length])
@@ -0,0 +1,306 @@
+import abc
+import gzip
+import io
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from ._metrics import FrameworkData, SyntheticData
+from ._report import Report
+from ._report_reader import JSONReportReader
+from ._snapshot import FrameworkMetrics
+
+
+class ReportWriter(abc.ABC):
+    """
+    Writes the report in the artifacts directory, in one of the `FORMATS`.
+    """
+
+    JSON = 'json'
+    SQLITE = 'sqlite'
+    FORMATS = [JSON, SQLITE]
+
+    @property
+    @abc.abstractmethod
+    def file_name(self) -> str:
+        pass
+
+    @abc.abstractmethod
+    def write(self, report: 'Report', directory: str) -> str:
+        """
+        :param report: The report to write
+        :param directory: The directory of the report (created if missing)
+        :return: The path of the written file
+        """
+
+    @staticmethod
+    def create(output_format: str,
+               compact_json: bool = False,
+               gzip_json: bool = False,
+               json_index: bool = False) -> 'ReportWriter':
+        """
+        :param output_format: One of `FORMATS`
+        :param compact_json: True to write the JSON report without indentation
+        :param gzip_json: True to compress the JSON report
+        :param json_index: True to write the byte offsets index of the JSON report
+        :return: The writer of the report in the provided format
+        """
+        if output_format == ReportWriter.SQLITE:
+            return SQLiteReportWriter()
+        return JSONReportWriter(compact=compact_json, compress=gzip_json, index=json_index)
+
+
+class JSONReportWriter(ReportWriter):
+    """
+    Writes the report section by section: the analysis of each framework is built, encoded and written before the
+    next one is built, so the memory used doesn't depend on the size of the report.
+    The output has the same schema (and, when indented, the same bytes) of `json.dump(report.as_dict, fp, indent=4)`.
+    """
+
+    FILE_NAME = 'output.json'
+    INDEX_FILE_NAME = JSONReportReader.INDEX_FILE_NAME
+    GZIP_EXTENSION = '.gz'
+    INDENT = 4
+
+    def __init__(self, compact: bool = False, compress: bool = False, index: bool = False):
+        """
+        :param compact: True to write the JSON without indentation and whitespaces
+        :param compress: True to write a gzip compressed file (`output.json.gz`)
+        :param index: True to write the byte offsets of the sections and of the frameworks of the report in
+        `output.index.json` (see `JSONReportReader`), not available for compressed reports
+        """
+        if index and compress:
+            raise ValueError('The index of the report requires an uncompressed report')
+        self.compact = compact
+        self.compress = compress
+        self.index = index
+        # Number of bytes written and spans of the indexed values
+        self.__offset = 0
+        self.__sections_spans: Dict[str, List[int]] = {}
+        self.__frameworks_spans: Dict[str, List[int]] = {}
+
+    @property
+    def file_name(self) -> str:
+        return JSONReportWriter.FILE_NAME + (JSONReportWriter.GZIP_EXTENSION if self.compress else '')
+
+    def write(self, report: 'Report', directory: str) -> str:
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        path = os.path.join(directory, self.file_name)
+        self.__offset = 0
+        self.__sections_spans = {}
+        self.__frameworks_spans = {}
+        with self.__open(path) as fp:
+            self.__write_object(fp, JSONReportWriter.__sections(report), level=0)
+        index_path = os.path.join(directory, JSONReportWriter.INDEX_FILE_NAME)
+        if not self.index:
+            # The index of a previous run would be stale
+            if os.path.exists(index_path):
+                os.remove(index_path)
+        else:
+            with open(index_path, 'w') as fp:
+                json.dump({
+                    'version': JSONReportReader.INDEX_VERSION,
+                    'size': self.__offset,
+                    'sections': self.__sections_spans,
+                    'frameworks': self.__frameworks_spans
+                }, fp)
+        return path
+
+    # Private
+
+    @staticmethod
+    def __sections(report: 'Report') -> Iterator[Tuple[str, Any]]:
+        """
+        :return: iterator of the (key, value) of the report, in the order of `Report.as_dict`.
+        The frameworks are iterators, encoded as arrays.
+        """
+        yield report.non_test_frameworks_key, report.framework_analyses(is_test=False)
+        yield report.tests_frameworks_key, report.framework_analyses(is_test=True)
+        yield report.shared_key, report.shared_code.as_dict
+        yield report.aggregate_key, {
+            report.non_test_frameworks_key: report.non_test_framework_aggregate.as_dict,
+            report.tests_frameworks_key: report.test_framework_aggregate.as_dict,
+            report.total_key: report.total_aggregate.as_dict
+        }
+
+    def __open(self, path: str) -> TextIO:
+        # The newlines are never translated (e.g. to '\r\n' on Windows), so the written text is counted exactly
+        if self.compress:
+            # Fixed modification time, so the same report is always compressed in the same bytes
+            return io.TextIOWrapper(gzip.GzipFile(path, mode='wb', mtime=0), encoding='utf-8', newline='\n')
+        return open(path, 'w', encoding='utf-8', newline='\n')
+
+    def __write_object(self, fp: TextIO, entries: Iterable[Tuple[str, Any]], level: int):
+        """
+        Writes the entries of the top level object, recording the span of each value.
+        """
+        key_separator = ':' if self.compact else ': '
+        is_empty = True
+        for key, value in entries:
+            self.__write(fp, '{' if is_empty else ',')
+            self.__write(fp, self.__newline(level + 1))
+            self.__write(fp, json.dumps(key) + key_separator)
+            start = self.__offset
+            if isinstance(value, Iterator):
+                self.__write_array(fp, value, level + 1)
+            else:
+                self.__write(fp, self.__encode(value, level + 1))
+            self.__sections_spans[key] = [start, self.__offset - start]
+            is_empty = False
+        self.__write(fp, '{}' if is_empty else self.__newline(level) + '}')
+
+    def __write_array(self, fp: TextIO, items: Iterator[Dict], level: int):
+        """
+        Writes the framework analyses (`{name: analysis}`), recording the span of each of them.
+        """
+        is_empty = True
+        for item in items:
+            self.__write(fp, '[' if is_empty else ',')
+            self.__write(fp, self.__newline(level + 1))
+            start = self.__offset
+            self.__write(fp, self.__encode(item, level + 1))
+            for name in item.keys():
+                self.__frameworks_spans[name] = [start, self.__offset - start]
+            is_empty = False
+        self.__write(fp, '[]' if is_empty else self.__newline(level) + ']')
+
+    def __write(self, fp: TextIO, text: str):
+        fp.write(text)
+        self.__offset += len(text.encode('utf-8'))
+
+    def __encode(self, value: Any, level: int) -> str:
+        """
+        :return: The JSON of the value, indented to be nested at the given level
+        """
+        if self.compact:
+            return json.dumps(value, separators=(',', ':'))
+        # The JSON strings never contain a raw newline, every newline is part of the indentation
+        return json.dumps(value, indent=JSONReportWriter.INDENT).replace('\n', self.__newline(level))
+
+    def __newline(self, level: int) -> str:
+        return '' if self.compact else '\n' + ' ' * (JSONReportWriter.INDENT * level)
+
+
+class SQLiteReportWriter(ReportWriter):
+    """
+    Writes the frameworks, submodules, files, dependencies and aggregates of the report in indexed tables of a SQLite
+    database, in a single transaction. The database is created again at every run.
+    The files are available only if the parsed files are kept in the model (not in streaming mode).
+    """
+
+    FILE_NAME = 'output.sqlite'
+
+    SCHEMA = """
+        CREATE TABLE frameworks (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            is_test INTEGER NOT NULL,
+            n_of_files INTEGER, loc INTEGER, noc INTEGER, poc REAL, n_a INTEGER, n_c INTEGER, nom INTEGER,
+            "not" INTEGER, noi INTEGER,
+            fan_in INTEGER, fan_out INTEGER, i REAL, a REAL, d_3 REAL
+        );
+        CREATE TABLE submodules (
+            id INTEGER PRIMARY KEY,
+            framework_id INTEGER NOT NULL REFERENCES frameworks (id),
+            parent_id INTEGER REFERENCES submodules (id),
+            name TEXT NOT NULL,
+            path TEXT NOT NULL,
+            n_of_files INTEGER, loc INTEGER, noc INTEGER, poc REAL, n_a INTEGER, n_c INTEGER, nom INTEGER,
+            "not" INTEGER
+        );
+        CREATE TABLE files (
+            id INTEGER PRIMARY KEY,
+            framework_id INTEGER NOT NULL REFERENCES frameworks (id),
+            submodule_id INTEGER NOT NULL REFERENCES submodules (id),
+            path TEXT NOT NULL,
+            loc INTEGER, noc INTEGER, poc REAL, n_a INTEGER, n_c INTEGER, nom INTEGER, "not" INTEGER, noi INTEGER,
+            is_test INTEGER NOT NULL,
+            is_shared INTEGER NOT NULL
+        );
+        CREATE TABLE dependencies (
+            framework_id INTEGER NOT NULL REFERENCES frameworks (id),
+            dependency TEXT NOT NULL,
+            n_of_imports INTEGER NOT NULL
+        );
+        CREATE TABLE aggregates (
+            name TEXT PRIMARY KEY,
+            loc INTEGER, noc INTEGER, poc REAL, n_a INTEGER, n_c INTEGER, nom INTEGER, "not" INTEGER, noi INTEGER
+        );
+        CREATE INDEX submodules_framework ON submodules (framework_id);
+        CREATE INDEX submodules_parent ON submodules (parent_id);
+        CREATE INDEX submodules_poc ON submodules (poc);
+        CREATE INDEX files_framework_loc ON files (framework_id, loc);
+        CREATE INDEX files_submodule ON files (submodule_id);
+        CREATE INDEX files_path ON files (path);
+        CREATE INDEX dependencies_framework ON dependencies (framework_id);
+        CREATE INDEX dependencies_dependency ON dependencies (dependency);
+    """
+
+    @property
+    def file_name(self) -> str:
+        return SQLiteReportWriter.FILE_NAME
+
+    def write(self, report: 'Report', directory: str) -> str:
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        path = os.path.join(directory, self.file_name)
+        if os.path.exists(path):
+            os.remove(path)
+
+        frameworks, submodules, files, dependencies = [], [], [], []
+        for is_test in [False, True]:
+            for framework, metrics in report.framework_metrics(is_test=is_test):
+                framework_id = len(frameworks) + 1
+                frameworks.append((framework_id,) + SQLiteReportWriter.__framework_row(metrics))
+                dependencies.extend((framework_id, imported_framework.name, n_of_imports)
+                                    for imported_framework, n_of_imports in framework.imports.items())
+                submodule_ids = {}
+                for submodule in framework.submodule.preorder():
+                    submodule_id = len(submodules) + 1
+                    submodule_ids[id(submodule)] = submodule_id
+                    parent_id = None if submodule.parent is None else submodule_ids[id(submodule.parent)]
+                    submodule_path = submodule.name if parent_id is None \
+                        else f'{submodules[parent_id - 1][4]}/{submodule.name}'
+                    submodules.append((submodule_id, framework_id, parent_id, submodule.name, submodule_path,
+                                       submodule.n_of_files) + SQLiteReportWriter.__data_row(submodule.data))
+                    for swift_file in submodule.files:
+                        data = FrameworkData.from_swift_file(swift_file=swift_file)
+                        files.append((len(files) + 1, framework_id, submodule_id, swift_file.path) +
+                                     SQLiteReportWriter.__data_row(data, data.n_o_i) +
+                                     (swift_file.is_test, swift_file.is_shared))
+
+        aggregates = [(name,) + SQLiteReportWriter.__data_row(data, data.n_o_i) for name, data in [
+            (report.non_test_frameworks_key, report.non_test_framework_aggregate),
+            (report.tests_frameworks_key, report.test_framework_aggregate),
+            (report.total_key, report.total_aggregate),
+            (report.shared_key, report.shared_code)
+        ]]
+
+        connection = sqlite3.connect(path)
+        try:
+            connection.executescript(SQLiteReportWriter.SCHEMA)
+            with connection:
+                connection.executemany(f'INSERT INTO frameworks VALUES ({", ".join("?" * 17)})', frameworks)
+                connection.executemany(f'INSERT INTO submodules VALUES ({", ".join("?" * 13)})', submodules)
+                connection.executemany(f'INSERT INTO files VALUES ({", ".join("?" * 14)})', files)
+                connection.executemany('INSERT INTO dependencies VALUES (?, ?, ?)', dependencies)
+                connection.executemany(f'INSERT INTO aggregates VALUES ({", ".join("?" * 9)})', aggregates)
+        finally:
+            connection.close()
+        return path
+
+    # Private
+
+    @staticmethod
+    def __framework_row(metrics: 'FrameworkMetrics') -> Tuple:
+        return (metrics.name, metrics.is_test_framework, metrics.n_of_files, metrics.loc, metrics.noc, metrics.poc,
+                metrics.n_a, metrics.n_c, metrics.nom, metrics.n_of_tests, metrics.noi,
+                metrics.fan_in, metrics.fan_out, metrics.instability, metrics.abstractness,
+                metrics.distance_main_sequence)
+
+    @staticmethod
+    def __data_row(data: 'SyntheticData', *extra: Optional[int]) -> Tuple:
+        return (data.loc, data.noc, data.poc, data.number_of_interfaces, data.number_of_concrete_data_structures,
+                data.number_of_methods, data.number_of_tests) + extra
@@ -0,0 +1,93 @@
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List
+from ._helpers import ParsingHelpers
+
+
+@dataclass
+class ScannedContent:
+    """
+    Raw content extracted from the lines of a swift file
+    """
+    loc: int = 0
+    n_of_comments: int = 0
+    imports: List[str] = field(default_factory=list)
+    interfaces: List[str] = field(default_factory=list)
+    structs: List[str] = field(default_factory=list)
+    classes: List[str] = field(default_factory=list)
+    methods: List[str] = field(default_factory=list)
+
+
+class LineScanner:
+    """
+    Classifies the lines of a swift file in a single pass.
+    Every declaration pattern requires its keyword followed by a space, so a single alternation of the keywords
+    identifies the candidate declaration kinds of a line: the (precompiled) pattern of a declaration is evaluated
+    only if its keyword is found in the line.
+    """
+
+    # Keyword -> (declaration pattern, attribute of ScannedContent)
+    DECLARATIONS = {
+        'import': (re.compile(ParsingHelpers.IMPORTS), 'imports'),
+        'protocol': (re.compile(ParsingHelpers.PROTOCOLS), 'interfaces'),
+        'struct': (re.compile(ParsingHelpers.STRUCTS), 'structs'),
+        'class': (re.compile(ParsingHelpers.CLASSES), 'classes'),
+        'func': (re.compile(ParsingHelpers.FUNCS), 'methods'),
+    }
+
+    KEYWORDS = re.compile(r'(' + '|'.join(DECLARATIONS.keys()) + r') ')
+
+    @staticmethod
+    def scan(lines: Iterable[str]) -> 'ScannedContent':
+        """
+        Scans the lines of a swift file.
+        The comments detection is equivalent to the `SINGLE_COMMENT`, `BEGIN_COMMENT` and `END_COMMENT` patterns.
+        :param lines: The lines of the file
+        :return: an instance of ScannedContent with the result of the scan
+        """
+        content = ScannedContent()
+        declarations = LineScanner.DECLARATIONS
+        find_keywords = LineScanner.KEYWORDS.findall
+        n_of_comments = 0
+        loc = 0
+
+        commented_line = False
+        for line in lines:
+            trimmed = line.strip()
+            if not trimmed:
+                continue
+
+            # Comments
+            if trimmed[0] == '/':
+                if trimmed.startswith('//'):
+                    n_of_comments += 1
+                    continue
+                commented_line = True
+                n_of_comments += 1
+
+            if trimmed.endswith('*/'):
+                if not commented_line:
+                    n_of_comments += 1
+                commented_line = False
+                continue
+
+            if commented_line:
+                n_of_comments += 1
+                continue
+
+            loc += 1
+
+            # Cheap pre-filter: most lines don't contain any declaration keyword
+            if not ('func ' in trimmed or 'class ' in trimmed or 'struct ' in trimmed
+                    or 'protocol ' in trimmed or 'import ' in trimmed):
+                continue
+
+            for keyword in set(find_keywords(trimmed)):
+                pattern, attribute = declarations[keyword]
+                match = pattern.search(trimmed)
+                if match is not None and match.group(1):
+                    getattr(content, attribute).append(match.group(1))
+
+        content.loc = loc
+        content.n_of_comments = n_of_comments
+        return content
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Optional, Tuple
+
+from ._dependency_index import DependencyIndex
+from ._metrics import Framework, Metrics
+
+
+@dataclass(frozen=True)
+class FrameworkMetrics:
+    """
+    Metrics of a framework, computed once at the end of the analysis
+    """
+    name: str
+    compact_name: str
+    is_test_framework: bool
+    n_of_files: int
+    loc: int
+    noc: int
+    n_a: int
+    n_c: int
+    nom: int
+    n_of_tests: int
+    noi: int
+    dependencies: Tuple[str, ...]
+    # (imported framework, number of imports), without Apple libraries
+    imports: Tuple[Tuple[str, int], ...]
+    # Folders of the sources, following the folders with more lines of code
+    source_folders: Tuple[str, ...]
+    # Architectural metrics (non-test frameworks only)
+    fan_in: Optional[int] = None
+    fan_out: Optional[int] = None
+    instability: Optional[float] = None
+    abstractness: Optional[float] = None
+    distance_main_sequence: Optional[float] = None
+
+    @property
+    def poc(self) -> float:
+        return Metrics.percentage_of_comments(self.noc, self.loc)
+
+    @property
+    def compact_name_description(self) -> str:
+        return f'{self.compact_name} = {self.name}'
+
+
+class MetricsSnapshot:
+    """
+    Read-only table of the metrics of every framework of the project, shared by the report and the graphs.
+    """
+
+    def __init__(self, frameworks: Tuple['FrameworkMetrics', ...]):
+        self.frameworks = frameworks
+        self.__by_name = MappingProxyType({f.name: f for f in frameworks})
+
+    @staticmethod
+    def build(frameworks: List['Framework']) -> 'MetricsSnapshot':
+        """
+        Computes the metrics of the frameworks.
+        :param frameworks: All the frameworks of the project
+        :return: The snapshot of the metrics
+        """
+        dependency_index = DependencyIndex.create(frameworks)
+        return MetricsSnapshot(tuple(MetricsSnapshot.__framework_metrics(f, dependency_index) for f in frameworks))
+
+    def __getitem__(self, name: str) -> 'FrameworkMetrics':
+        return self.__by_name[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__by_name
+
+    def filtered(self, is_test: bool = False) -> List['FrameworkMetrics']:
+        """
+        :param is_test: True for the test frameworks, False for the other frameworks
+        :return: The metrics of the frameworks, in the same order of the analyzed frameworks
+        """
+        return [f for f in self.frameworks if f.is_test_framework == is_test]
+
+    # Private
+
+    @staticmethod
+    def __framework_metrics(framework: 'Framework', dependency_index: 'DependencyIndex') -> 'FrameworkMetrics':
+        data = framework.data
+        architectural_metrics = {}
+        if not framework.is_test_framework:
+            instability = dependency_index.instability(framework)
+            abstractness = dependency_index.abstractness(framework)
+            architectural_metrics = {
+                "fan_in": dependency_index.fan_in(framework),
+                "fan_out": dependency_index.fan_out(framework),
+                "instability": instability,
+                "abstractness": abstractness,
+                "distance_main_sequence": abs(abstractness + instability - 1)
+            }
+        return FrameworkMetrics(
+            name=framework.name,
+            compact_name=framework.compact_name,
+            is_test_framework=framework.is_test_framework,
+            n_of_files=framework.number_of_files,
+            loc=data.loc,
+            noc=data.noc,
+            n_a=data.number_of_interfaces,
+            n_c=data.number_of_concrete_data_structures,
+            nom=data.number_of_methods,
+            n_of_tests=data.number_of_tests,
+            noi=framework.number_of_imports,
+            dependencies=tuple(Metrics.total_dependencies(framework)),
+            imports=tuple((f.name, n_of_imports) for f, n_of_imports in framework.imports.items()),
+            source_folders=MetricsSnapshot.__source_folders(framework),
+            **architectural_metrics
+        )
+
+    @staticmethod
+    def __source_folders(framework: 'Framework') -> Tuple[str, ...]:
+        folders = []
+        submodule = framework.submodule
+        while len(submodule.submodules) > 0:
+            submodule = max(submodule.submodules, key=lambda s: s.data.loc)
+            folders.append(submodule.name)
+        return tuple(folders)
@@ -0,0 +1,116 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Tuple
+
+from ._helpers import AnalyzerHelpers, PathMatcher
+
+
+class SwiftFilesWalker:
+    """
+    Enumerates the swift files of a directory with `os.scandir`.
+    Excluded and hidden directories are pruned before being listed, so none of their entries is ever read.
+    """
+
+    VCS_DIRECTORIES = frozenset(['.git', '.hg', '.svn', '.bzr'])
+
+    def __init__(self, exclude_paths: List[str], include_hidden: bool = False, threads: int = 1):
+        """
+        :param exclude_paths: List of path substrings (or globs) to exclude from the analysis
+        :param include_hidden: True to walk the hidden directories (version control directories are always skipped)
+        :param threads: Number of threads used to walk the top-level subdirectories concurrently
+        """
+        self.exclude_paths = exclude_paths
+        self.include_hidden = include_hidden
+        self.threads = max(1, threads)
+        self.__exclude_matcher = PathMatcher.for_patterns(exclude_paths)
+
+    def files(self, directory: str) -> List[Tuple[str, str]]:
+        """
+        Lists the swift files in the same order of a top-down walk of the directories in alphabetical order.
+        :param directory: The root directory
+        :return: List of (full path, subdir) of the swift files
+        """
+        if self.__is_excluded(directory):
+            return []
+        files, subdirs = self.__scan(directory)
+        if self.threads == 1 or len(subdirs) < 2:
+            for subdir in subdirs:
+                self.__walk(subdir, files)
+            return files
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            for subtree_files in executor.map(self.__walk_subtree, subdirs):
+                files.extend(subtree_files)
+        return files
+
+    def iter_files(self, directory: str) -> Iterator[Tuple[str, str]]:
+        """
+        Lazy version of `files`: only the subdirectories still to walk are kept in memory.
+        The subdirectories are always walked on the calling thread.
+        :param directory: The root directory
+        :return: iterator of (full path, subdir) of the swift files, in the same order of `files`
+        """
+        if self.__is_excluded(directory):
+            return
+        stack = [directory]
+        while len(stack) > 0:
+            files, subdirs = self.__scan(stack.pop())
+            yield from files
+            stack.extend(reversed(subdirs))
+
+    def includes(self, directory: str, subdir: str) -> bool:
+        """
+        :param directory: The root directory
+        :param subdir: A directory inside the root directory
+        :return: True if the swift files of `subdir` would be listed walking the root directory
+        """
+        if self.__is_excluded(subdir):
+            return False
+        relative_subdir = os.path.relpath(subdir, directory)
+        if relative_subdir == '.':
+            return True
+        return all(self.__is_visible(name) for name in relative_subdir.split(os.sep))
+
+    # Private
+
+    def __walk_subtree(self, directory: str) -> List[Tuple[str, str]]:
+        files = []
+        self.__walk(directory, files)
+        return files
+
+    def __walk(self, directory: str, files: List[Tuple[str, str]]):
+        directory_files, subdirs = self.__scan(directory)
+        files.extend(directory_files)
+        for subdir in subdirs:
+            self.__walk(subdir, files)
+
+    def __scan(self, directory: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """
+        :return: The swift files of the directory and the subdirectories to walk, both sorted by name
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Symbolic links to directories are not followed, as in `os.walk`
+                        if not entry.is_symlink() and self.__is_walkable(entry.name, entry.path):
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(AnalyzerHelpers.SWIFT_FILE_EXTENSION):
+                        files.append(entry.path)
+        except OSError:
+            return [], []
+        return [(f, directory) for f in sorted(files)], sorted(subdirs)
+
+    def __is_walkable(self, name: str, path: str) -> bool:
+        # Every path under an excluded directory is excluded as well
+        return self.__is_visible(name) and not self.__is_excluded(path)
+
+    def __is_visible(self, name: str) -> bool:
+        if name in SwiftFilesWalker.VCS_DIRECTORIES:
+            return False
+        return self.include_hidden or not name.startswith('.')
+
+    def __is_excluded(self, path: str) -> bool:
+        return self.__exclude_matcher.matches(path)
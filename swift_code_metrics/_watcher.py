@@ -0,0 +1,208 @@
+import abc
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from ._helpers import AnalyzerHelpers, ParsingHelpers, PathMatcher
+from ._walker import SwiftFilesWalker
+
+
+class FileWatcher(abc.ABC):
+    """
+    Watches the swift files (and the project paths overrides) of a directory.
+    """
+
+    # Quiet period used to coalesce a burst of changes in a single update
+    DEFAULT_DEBOUNCE = 0.3
+
+    def __init__(self, directory: str, exclude_paths: List[str], include_hidden: bool = False):
+        self.directory = directory
+        self.exclude_paths = exclude_paths
+        self.include_hidden = include_hidden
+        self._exclude_matcher = PathMatcher.for_patterns(exclude_paths)
+
+    @staticmethod
+    def create(directory: str, exclude_paths: List[str], include_hidden: bool = False) -> 'FileWatcher':
+        """
+        :return: A watcher based on inotify when available, polling the file system otherwise
+        """
+        if InotifyWatcher.is_available():
+            return InotifyWatcher(directory, exclude_paths, include_hidden)
+        return PollingWatcher(directory, exclude_paths, include_hidden)
+
+    def changes(self, debounce: float = DEFAULT_DEBOUNCE) -> Iterator[Set[str]]:
+        """
+        Blocks until a change is detected, then waits for a quiet period of `debounce` seconds.
+        :param debounce: The quiet period (in seconds)
+        :return: iterator of the sets of changed paths (files, or directories created or removed)
+        """
+        while True:
+            paths = self._read(timeout=None)
+            while len(paths) > 0:
+                more_paths = self._read(timeout=debounce)
+                if len(more_paths) == 0:
+                    yield paths
+                    break
+                paths |= more_paths
+
+    def close(self):
+        pass
+
+    @abc.abstractmethod
+    def _read(self, timeout: Optional[float]) -> Set[str]:
+        """
+        :param timeout: Maximum time to wait for changes (in seconds), None to wait indefinitely
+        :return: The changed paths
+        """
+
+    def _is_watched_dir(self, path: str) -> bool:
+        name = os.path.basename(path)
+        if name in SwiftFilesWalker.VCS_DIRECTORIES or (not self.include_hidden and name.startswith('.')):
+            return False
+        return not self._exclude_matcher.matches(path)
+
+    @staticmethod
+    def _is_watched_file(name: str) -> bool:
+        return name.endswith(AnalyzerHelpers.SWIFT_FILE_EXTENSION) or \
+            name == ParsingHelpers.FRAMEWORK_STRUCTURE_OVERRIDE_FILE
+
+
+class PollingWatcher(FileWatcher):
+    """
+    Detects the changes comparing the modification time and size of the files at every interval.
+    """
+
+    DEFAULT_INTERVAL = 1.0
+
+    def __init__(self,
+                 directory: str,
+                 exclude_paths: List[str],
+                 include_hidden: bool = False,
+                 interval: float = DEFAULT_INTERVAL):
+        super().__init__(directory, exclude_paths, include_hidden)
+        self.interval = interval
+        self.__snapshot = self.__take_snapshot()
+
+    def _read(self, timeout: Optional[float]) -> Set[str]:
+        while True:
+            time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+            snapshot = self.__take_snapshot()
+            paths = {p for p in snapshot.keys() | self.__snapshot.keys()
+                     if snapshot.get(p) != self.__snapshot.get(p)}
+            self.__snapshot = snapshot
+            if len(paths) > 0 or timeout is not None:
+                return paths
+
+    def __take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for subdir, dirs, files in os.walk(self.directory):
+            dirs[:] = [d for d in dirs if self._is_watched_dir(os.path.join(subdir, d))]
+            for file in files:
+                if FileWatcher._is_watched_file(file):
+                    path = os.path.join(subdir, file)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+class InotifyWatcher(FileWatcher):
+    """
+    Linux inotify watcher (through ctypes, no additional dependencies).
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct('iIII')
+
+    __libc = None
+
+    def __init__(self, directory: str, exclude_paths: List[str], include_hidden: bool = False):
+        super().__init__(directory, exclude_paths, include_hidden)
+        self.__fd = InotifyWatcher.__load_libc().inotify_init1(InotifyWatcher.IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.__watches: Dict[int, str] = {}
+        self.__add_watches(directory)
+
+    @staticmethod
+    def is_available() -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        try:
+            InotifyWatcher.__load_libc()
+            return True
+        except (OSError, AttributeError):
+            return False
+
+    def close(self):
+        os.close(self.__fd)
+
+    def _read(self, timeout: Optional[float]) -> Set[str]:
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if len(readable) == 0:
+            return set()
+
+        paths = set()
+        buffer = os.read(self.__fd, 64 * 1024)
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = InotifyWatcher.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += InotifyWatcher.EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b'\0').decode('utf-8', errors='surrogateescape')
+            offset += length
+
+            if mask & InotifyWatcher.IN_Q_OVERFLOW:
+                # Events lost: everything has to be analyzed again
+                paths.add(self.directory)
+                continue
+            if mask & InotifyWatcher.IN_IGNORED:
+                self.__watches.pop(wd, None)
+                continue
+            parent = self.__watches.get(wd)
+            if parent is None:
+                continue
+            path = os.path.join(parent, name)
+            if mask & InotifyWatcher.IN_ISDIR:
+                if self._is_watched_dir(path):
+                    if mask & (InotifyWatcher.IN_CREATE | InotifyWatcher.IN_MOVED_TO):
+                        self.__add_watches(path)
+                    paths.add(path)
+            elif FileWatcher._is_watched_file(name):
+                paths.add(path)
+        return paths
+
+    # Private
+
+    def __add_watches(self, directory: str):
+        for subdir, dirs, _ in os.walk(directory):
+            dirs[:] = [d for d in dirs if self._is_watched_dir(os.path.join(subdir, d))]
+            wd = InotifyWatcher.__libc.inotify_add_watch(self.__fd, os.fsencode(subdir), InotifyWatcher.WATCH_MASK)
+            if wd >= 0:
+                self.__watches[wd] = subdir
+
+    @staticmethod
+    def __load_libc():
+        if InotifyWatcher.__libc is None:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            InotifyWatcher.__libc = libc
+        return InotifyWatcher.__libc
@@ -1,11 +1,18 @@
 #!/usr/bin/python3
 
+import logging
 from argparse import ArgumentParser
+from typing import Dict, Optional
 
-from ._helpers import Log
+from ._helpers import AnalyzerHelpers, Log
 from ._analyzer import Inspector
+from ._cache import ParseCache
+from ._flat_export import FlatExport
+from ._graph_reduction import GraphReduction
+from ._report_writer import ReportWriter
 from .version import VERSION
 import sys
+import time
 
 
 def main():
@@ -49,6 +56,149 @@ def main():
         default=False,
         help='Generates the graphic reports and saves them in the artifacts path.'
     )
+    CLI.add_argument(
+        '--scatter-labels',
+        metavar='N',
+        type=int,
+        default=None,
+        help='Labels only the N frameworks farthest from the main sequence in its chart (default: all).'
+    )
+    CLI.add_argument(
+        '--graph-min-imports',
+        metavar='N',
+        type=int,
+        default=1,
+        help='Removes the dependencies with less than N imports from the dependency graphs.'
+    )
+    CLI.add_argument(
+        '--graph-cluster-depth',
+        metavar='N',
+        type=int,
+        default=None,
+        help='Groups the frameworks of the dependency graphs by the first N folders of their sources. Only the '
+             'frameworks declared in the same folder by a scm.json file are grouped.'
+    )
+    CLI.add_argument(
+        '--graph-collapse-cycles',
+        action='store_true',
+        help='Collapses the frameworks that depend on each other in single nodes of the dependency graphs.'
+    )
+    CLI.add_argument(
+        '--graph-transitive-reduction',
+        action='store_true',
+        help='Removes the dependencies implied by other paths from the dependency graphs.'
+    )
+    CLI.add_argument(
+        '--graph-max-nodes',
+        metavar='N',
+        type=int,
+        default=None,
+        help='Maximum number of nodes of the dependency graphs, the frameworks with more code and imports are kept.'
+    )
+    CLI.add_argument(
+        '--graph-max-edges',
+        metavar='N',
+        type=int,
+        default=None,
+        help='Maximum number of edges of the dependency graphs, the dependencies with more imports are kept.'
+    )
+    CLI.add_argument(
+        '--no-chart-cache',
+        action='store_true',
+        help='Renders all the charts, including the ones unchanged since the previous run.'
+    )
+    CLI.add_argument(
+        '--include-hidden',
+        action='store_true',
+        help='Analyzes the hidden folders as well (version control folders are always skipped).'
+    )
+    CLI.add_argument(
+        '--walk-threads',
+        metavar='N',
+        type=int,
+        default=1,
+        help='Number of threads used to list the top-level folders concurrently (e.g. on network file systems).'
+    )
+    CLI.add_argument(
+        '--jobs',
+        metavar='N',
+        type=int,
+        default=AnalyzerHelpers.usable_cpu_count(),
+        help='Number of processes used to parse the swift files (default: number of usable CPUs).'
+    )
+    CLI.add_argument(
+        '--counts-only',
+        action='store_true',
+        help='Keeps only the number of declarations of each file instead of their names, reducing the memory usage.'
+    )
+    CLI.add_argument(
+        '--stream',
+        action='store_true',
+        help='Folds the metrics of each file in its framework as soon as it is parsed, with a memory usage bound to '
+             'the number of folders and frameworks instead of files (not compatible with --model and --watch).'
+    )
+    CLI.add_argument(
+        '--output-format',
+        nargs='+',
+        choices=ReportWriter.FORMATS,
+        default=[ReportWriter.JSON],
+        help='Formats of the report: json (output.json) and/or sqlite (output.sqlite, with indexed tables of '
+             'frameworks, submodules, files, dependencies and aggregates).'
+    )
+    CLI.add_argument(
+        '--flat-export',
+        choices=FlatExport.FORMATS,
+        default=None,
+        help='Writes one record per file (files.<format>), while the files are analyzed, and one per submodule '
+             '(submodules.<format>) in the artifacts folder.'
+    )
+    CLI.add_argument(
+        '--compact-json',
+        action='store_true',
+        help='Writes the JSON report without indentation.'
+    )
+    CLI.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Compresses the JSON report with gzip (output.json.gz).'
+    )
+    CLI.add_argument(
+        '--json-index',
+        action='store_true',
+        help='Writes the byte offsets of each framework and section of the JSON report in output.index.json.'
+    )
+    CLI.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='Directory used to cache the parsed files between runs (only changed files will be parsed again).'
+    )
+    CLI.add_argument(
+        '--cache-size',
+        metavar='MB',
+        type=int,
+        default=ParseCache.DEFAULT_MAX_SIZE_MB,
+        help='Maximum size of the parsing cache in MB (least recently used entries are evicted).'
+    )
+    CLI.add_argument(
+        '--model',
+        metavar='PATH',
+        type=str,
+        default=None,
+        help='Path of the project model. It is saved after a full analysis and used as base by --since.'
+    )
+    CLI.add_argument(
+        '--since',
+        metavar='REV',
+        type=str,
+        default=None,
+        help='Parses only the files changed since the git revision REV, patching the model built from REV.'
+    )
+    CLI.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keeps watching the source for changes, updating the report when swift files are modified.'
+    )
     CLI.add_argument(
         '--version',
         action='version',
@@ -56,22 +206,76 @@ def main():
     )
 
     args = CLI.parse_args()
+    if args.since is not None and args.model is None:
+        CLI.error('--since requires the --model built from the base revision')
+    if args.stream and (args.model is not None or args.watch):
+        CLI.error('--stream can\'t keep the project model required by --model and --watch')
+    if args.json_index and args.gzip:
+        CLI.error('--json-index requires an uncompressed JSON report (without --gzip)')
+    if args.json_index and ReportWriter.JSON not in args.output_format:
+        CLI.error('--json-index requires the json output format')
     directory = args.source[0]
     exclude = args.exclude
     artifacts = args.artifacts[0]
     default_tests_paths = args.tests_paths
     should_generate_graphs = args.generate_graphs
+    jobs = args.jobs
+    Log.configure(logging.INFO)
 
     # Inspects the provided directory
-    analyzer = Inspector(directory, artifacts, default_tests_paths, exclude)
+    analyzer = Inspector(directory, artifacts, default_tests_paths, exclude,
+                         jobs=jobs,
+                         cache_dir=args.cache_dir,
+                         cache_size_mb=args.cache_size,
+                         model_path=args.model,
+                         since=args.since,
+                         keep_model=args.watch,
+                         include_hidden=args.include_hidden,
+                         walk_threads=args.walk_threads,
+                         counts_only=args.counts_only,
+                         stream=args.stream,
+                         compact_json=args.compact_json,
+                         gzip_json=args.gzip,
+                         output_formats=args.output_format,
+                         flat_export=args.flat_export,
+                         json_index=args.json_index)
+
+    graphs_options = {
+        'scatter_labels': args.scatter_labels,
+        'use_cache': not args.no_chart_cache,
+        'graph_reduction': _graph_reduction(args)
+    }
 
     if not analyzer.analyze():
         Log.warn('No valid swift files found in the project')
-        sys.exit(0)
+        if not args.watch:
+            sys.exit(0)
+    elif should_generate_graphs:
+        _render_graphs(analyzer, artifacts, graphs_options)
 
-    if not should_generate_graphs:
+    if args.watch:
+        _watch(analyzer, artifacts, should_generate_graphs, graphs_options)
+    elif not should_generate_graphs:
         sys.exit(0)
 
+
+def _graph_reduction(args) -> Optional['GraphReduction']:
+    """
+    :return: The simplifications of the dependency graph requested by the arguments, None to draw the whole graph
+    """
+    reduction = GraphReduction(min_imports=args.graph_min_imports,
+                               cluster_depth=args.graph_cluster_depth,
+                               collapse_cycles=args.graph_collapse_cycles,
+                               transitive_reduction=args.graph_transitive_reduction,
+                               max_nodes=args.graph_max_nodes,
+                               max_edges=args.graph_max_edges)
+    return None if reduction == GraphReduction() else reduction
+
+
+def _render_graphs(analyzer: 'Inspector', artifacts: str, options: Dict):
+    """
+    :param options: The options of the charts (`GraphsRender` fields)
+    """
     # Creates graphs
     from ._graphs_renderer import GraphsRender
     non_test_frameworks = analyzer.filtered_frameworks(is_test=False)
@@ -80,6 +284,27 @@ def main():
         artifacts_path=artifacts,
         test_frameworks=test_frameworks,
         non_test_frameworks=non_test_frameworks,
-        report=analyzer.report
+        report=analyzer.report,
+        snapshot=analyzer.snapshot,
+        jobs=analyzer.jobs,
+        **options
     )
     graphs_renderer.render_graphs()
+
+
+def _watch(analyzer: 'Inspector', artifacts: str, should_generate_graphs: bool, graphs_options: Dict):
+    from ._watcher import FileWatcher
+    watcher = FileWatcher.create(analyzer.directory, analyzer.exclude_paths, analyzer.include_hidden)
+    Log.info(f'Watching {analyzer.directory} for changes (press Ctrl+C to stop).')
+    try:
+        for paths in watcher.changes():
+            start = time.monotonic()
+            if not analyzer.update(paths):
+                continue
+            if should_generate_graphs:
+                _render_graphs(analyzer, artifacts, graphs_options)
+            Log.info(f'{len(paths)} changes analyzed in {time.monotonic() - start:.2f}s.')
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
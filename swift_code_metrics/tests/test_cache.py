@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from swift_code_metrics._cache import ParseCache
+from swift_code_metrics._parallel import ParallelParser
+from swift_code_metrics._parser import SwiftFileParser
+from swift_code_metrics._scanner import ScannedContent
+
+
+class ParseCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, 'cache')
+        self.swift_file = os.path.join(self.directory.name, 'File.swift')
+        self.__write('import Foundation\n')
+        self.content = ScannedContent(loc=1, imports=['Foundation'])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookup_missing_entry(self):
+        with ParseCache(self.cache_dir) as cache:
+            self.assertIsNone(cache.lookup(self.swift_file))
+            self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+    def test_lookup_stored_entry_across_runs(self):
+        with ParseCache(self.cache_dir) as cache:
+            cache.store(self.swift_file, self.content)
+        with ParseCache(self.cache_dir) as cache:
+            self.assertEqual(self.content, cache.lookup(self.swift_file))
+            self.assertEqual((1, 0), (cache.hits, cache.misses))
+
+    def test_lookup_modified_file(self):
+        with ParseCache(self.cache_dir) as cache:
+            cache.store(self.swift_file, self.content)
+            self.__write('import UIKit\n', mtime_offset=10)
+            self.assertIsNone(cache.lookup(self.swift_file))
+
+    def test_lookup_touched_file_same_content(self):
+        with ParseCache(self.cache_dir) as cache:
+            cache.store(self.swift_file, self.content)
+            self.__write('import Foundation\n', mtime_offset=10)
+            self.assertEqual(self.content, cache.lookup(self.swift_file))
+
+    def test_parsed_files_are_read_once(self):
+        self.__write('import Foundation\r\n// Comment\r\nclass A {}\r\n')
+        with ParseCache(self.cache_dir) as cache:
+            parser = ParallelParser(self.directory.name, [], cache=cache)
+            with mock.patch.object(ParseCache, '_ParseCache__file_digest', side_effect=AssertionError) as file_digest:
+                (_, content, _), = parser.parse([(self.swift_file, self.directory.name)])
+            file_digest.assert_not_called()
+            self.assertEqual(SwiftFileParser(self.swift_file, self.directory.name, self.directory.name, []).scan(),
+                             content)
+            # The stored hash is the hash of the file
+            self.__write('import Foundation\r\n// Comment\r\nclass A {}\r\n', mtime_offset=10)
+            self.assertEqual(content, cache.lookup(self.swift_file))
+
+    def test_file_changed_after_the_scan_is_not_reused(self):
+        with ParseCache(self.cache_dir) as cache:
+            parser = ParallelParser(self.directory.name, [], cache=cache)
+            store = cache.store
+
+            def store_after_change(*args):
+                # Same size, saved while the scanned content is stored
+                self.__write('import UIKit     \n', mtime_offset=10)
+                store(*args)
+
+            with mock.patch.object(cache, 'store', side_effect=store_after_change):
+                parser.parse([(self.swift_file, self.directory.name)]).__next__()
+            self.assertIsNone(cache.lookup(self.swift_file))
+
+    def test_fingerprint_change_invalidates_entries(self):
+        with ParseCache(self.cache_dir) as cache:
+            cache.store(self.swift_file, self.content)
+        with mock.patch.object(ParseCache, 'fingerprint', return_value='new-parser'):
+            with ParseCache(self.cache_dir) as cache:
+                self.assertIsNone(cache.lookup(self.swift_file))
+
+    def test_eviction_least_recently_used(self):
+        other_file = os.path.join(self.directory.name, 'Other.swift')
+        with open(other_file, 'w') as fp:
+            fp.write('import UIKit\n')
+        with ParseCache(self.cache_dir) as cache:
+            cache.store(other_file, self.content)
+        with ParseCache(self.cache_dir) as cache:
+            cache.store(self.swift_file, self.content)
+            cache.max_size = 200
+        with ParseCache(self.cache_dir) as cache:
+            self.assertIsNone(cache.lookup(other_file))
+            self.assertEqual(self.content, cache.lookup(self.swift_file))
+
+    # Private
+
+    def __write(self, text: str, mtime_offset: int = 0):
+        with open(self.swift_file, 'w') as fp:
+            fp.write(text)
+        if mtime_offset > 0:
+            stat = os.stat(self.swift_file)
+            os.utime(self.swift_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 10 ** 9))
+
+
+if __name__ == '__main__':
+    unittest.main()
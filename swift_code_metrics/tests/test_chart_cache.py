@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from swift_code_metrics._chart_cache import ChartCache
+from swift_code_metrics._chart_scheduler import ChartScheduler
+from swift_code_metrics._graph_helpers import ChartSpec, Graph
+
+
+class ChartCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.specs = [
+            ChartSpec(ChartSpec.BAR, 'Bar chart', {'data': ([1, 3, 2], ['A', 'B', 'C'])}),
+            ChartSpec(ChartSpec.PIE, 'Pie chart', {'sizes': [0.25, 0.75],
+                                                   'labels': ['A', 'B'],
+                                                   'legend': ['A = Alpha', 'B = Beta']})
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def render(self, specs):
+        cache = ChartCache(self.directory.name)
+        scheduler = ChartScheduler(self.directory.name, cache=cache)
+        for spec in specs:
+            scheduler.submit(spec)
+        with mock.patch.object(Graph, 'render', autospec=True, side_effect=Graph.render) as render:
+            paths = scheduler.run()
+        return paths, cache, [call[0][1].title for call in render.call_args_list]
+
+    def test_digest(self):
+        same_spec = ChartSpec(ChartSpec.BAR, 'Bar chart', {'data': ([1, 3, 2], ['A', 'B', 'C'])})
+        changed_spec = ChartSpec(ChartSpec.BAR, 'Bar chart', {'data': ([1, 3, 4], ['A', 'B', 'C'])})
+        self.assertEqual(ChartCache.digest(self.specs[0]), ChartCache.digest(same_spec))
+        self.assertNotEqual(ChartCache.digest(self.specs[0]), ChartCache.digest(changed_spec))
+        self.assertNotEqual(ChartCache.digest(self.specs[0]),
+                            ChartCache.digest(ChartSpec(ChartSpec.BAR, 'Other chart', self.specs[0].arguments)))
+
+    def test_unchanged_charts_are_reused(self):
+        paths, cache, rendered = self.render(self.specs)
+        self.assertEqual(['Bar chart', 'Pie chart'], rendered)
+        self.assertEqual((0, 2), (cache.reused, cache.rendered))
+        for path in paths:
+            self.assertTrue(os.path.exists(path + ChartCache.HASH_EXTENSION))
+
+        reused_paths, cache, rendered = self.render(self.specs)
+        self.assertEqual(paths, reused_paths)
+        self.assertEqual([], rendered)
+        self.assertEqual((2, 0), (cache.reused, cache.rendered))
+
+    def test_changed_charts_are_rendered(self):
+        self.render(self.specs)
+        changed_spec = ChartSpec(ChartSpec.PIE, 'Pie chart', {**self.specs[1].arguments, 'sizes': [0.5, 0.5]})
+        _, cache, rendered = self.render([self.specs[0], changed_spec])
+        self.assertEqual(['Pie chart'], rendered)
+        self.assertEqual((1, 1), (cache.reused, cache.rendered))
+
+    def test_missing_chart_is_rendered(self):
+        paths, _, _ = self.render(self.specs)
+        os.remove(paths[0])
+        _, _, rendered = self.render(self.specs)
+        self.assertEqual(['Bar chart'], rendered)
+
+    def test_stale_hash_is_removed(self):
+        paths, _, _ = self.render(self.specs)
+        changed_spec = ChartSpec(ChartSpec.BAR, 'Bar chart', {'data': ([2], ['A'])})
+        self.assertIsNone(ChartCache(self.directory.name).lookup(changed_spec))
+        self.assertFalse(os.path.exists(paths[0] + ChartCache.HASH_EXTENSION))
+        self.assertIsNone(ChartCache(self.directory.name).lookup(self.specs[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
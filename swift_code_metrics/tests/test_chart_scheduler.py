@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+import matplotlib.pyplot as plt
+from swift_code_metrics._chart_scheduler import ChartScheduler
+from swift_code_metrics._graph_helpers import ChartSpec, Graph
+
+
+class ChartSchedulerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.min_charts_per_worker = ChartScheduler.MIN_CHARTS_PER_WORKER
+        ChartScheduler.MIN_CHARTS_PER_WORKER = 1
+        self.specs = [
+            ChartSpec(ChartSpec.BAR, 'Bar chart', {'data': ([1, 3, 2], ['A', 'B', 'C'])}),
+            ChartSpec(ChartSpec.PIE, 'Pie chart', {'sizes': [0.25, 0.75],
+                                                   'labels': ['A', 'B'],
+                                                   'legend': ['A = Alpha', 'B = Beta']}),
+            ChartSpec(ChartSpec.SCATTER, 'Scattered chart', {'x_label': 'I',
+                                                             'y_label': 'A',
+                                                             'data': ([0.1, 0.8], [0.5, 0.2], ['A', 'B']),
+                                                             'bands': [([1, 0], 'g')]})
+        ]
+
+    def tearDown(self):
+        ChartScheduler.MIN_CHARTS_PER_WORKER = self.min_charts_per_worker
+        self.directory.cleanup()
+
+    def render(self, jobs: int):
+        scheduler = ChartScheduler(self.directory.name, jobs=jobs)
+        for spec in self.specs:
+            scheduler.submit(spec)
+        return scheduler.run()
+
+    def test_serial_render(self):
+        paths = self.render(jobs=1)
+        self.assertEqual([os.path.join(self.directory.name, name)
+                          for name in ['bar_chart.pdf', 'pie_chart.pdf', 'scattered_chart.pdf']], paths)
+        for path in paths:
+            self.assertGreater(os.path.getsize(path), 0)
+
+    def test_parallel_render_matches_serial_render(self):
+        self.assertEqual(self.render(jobs=1), self.render(jobs=3))
+
+    def test_graphs_rendered_in_parallel(self):
+        ChartScheduler.MIN_CHARTS_PER_WORKER = self.min_charts_per_worker
+        nodes = [('A', 3), ('B', 1), ('C', 2)]
+        edges = [('A', 'B', 3, 2, 'forestgreen'), ('A', 'C', 1, 1, 'orangered'), ('B', 'C', 2, 1, 'orangered')]
+        layout = Graph.directed_graph_layout(nodes, edges)
+        scheduler = ChartScheduler(self.directory.name, jobs=4)
+        for title in ['Internal graph', 'External graph', 'Graph']:
+            scheduler.submit(ChartSpec(ChartSpec.DIRECTED_GRAPH, title, {'list_of_nodes': nodes,
+                                                                         'list_of_edges': edges},
+                                       layout=layout))
+        with mock.patch('swift_code_metrics._chart_scheduler.ProcessPoolExecutor',
+                        side_effect=ProcessPoolExecutor) as executor:
+            paths = scheduler.run()
+        self.assertEqual(3, executor.call_args[1]['max_workers'])
+        self.assertEqual(3, len([path for path in paths if os.path.getsize(path) > 0]))
+
+    def test_figures_are_released(self):
+        self.render(jobs=1)
+        self.assertEqual([], plt.get_fignums())
+
+    def test_run_clears_the_scheduled_charts(self):
+        scheduler = ChartScheduler(self.directory.name)
+        scheduler.submit(self.specs[0])
+        self.assertEqual(1, len(scheduler.run()))
+        self.assertEqual([], scheduler.run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from swift_code_metrics._dependency_index import DependencyIndex
+from swift_code_metrics._metrics import Framework, Metrics
+from swift_code_metrics.tests.test_metrics import example_swiftfile, example_file2
+
+
+class DependencyIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.foundation_kit = Framework('FoundationKit')
+        self.design_kit = Framework('DesignKit')
+        self.app_layer = Framework('ApplicationLayer')
+        self.test_design_kit = Framework(name='DesignKitTests', is_test_framework=True)
+        self.not_linked_framework = Framework('External')
+        self.frameworks = [
+            self.foundation_kit,
+            self.design_kit,
+            self.app_layer,
+            self.test_design_kit,
+            self.not_linked_framework
+        ]
+        self.foundation_kit.submodule.files = [example_swiftfile]
+        self.design_kit.submodule.files = [example_file2]
+        self.app_layer.submodule.files = [example_swiftfile, example_file2]
+
+        self.app_layer.append_import(self.design_kit)
+        self.app_layer.append_import(self.design_kit)
+        self.app_layer.append_import(self.foundation_kit)
+        self.app_layer.append_import(Framework('UIKit'))
+        self.design_kit.append_import(self.foundation_kit)
+        self.design_kit.append_import(self.design_kit)
+        self.test_design_kit.append_import(self.design_kit)
+        self.index = DependencyIndex(self.frameworks)
+
+    def test_dependents(self):
+        self.assertEqual({self.app_layer: 2, self.design_kit: 1, self.test_design_kit: 1},
+                         self.index.dependents(self.design_kit))
+        self.assertEqual({}, self.index.dependents(self.app_layer))
+
+    def test_dependencies(self):
+        self.assertEqual({self.design_kit: 2, self.foundation_kit: 1}, self.index.dependencies(self.app_layer))
+
+    def test_same_values_of_metrics(self):
+        for framework in self.frameworks:
+            self.assertEqual(Metrics.fan_in(framework, self.frameworks), self.index.fan_in(framework))
+            self.assertEqual(Metrics.fan_out(framework), self.index.fan_out(framework))
+            self.assertEqual(Metrics.instability(framework, self.frameworks), self.index.instability(framework))
+            self.assertEqual(Metrics.abstractness(framework), self.index.abstractness(framework))
+            self.assertEqual(Metrics.distance_main_sequence(framework, self.frameworks),
+                             self.index.distance_main_sequence(framework))
+
+    def test_fan_in_excludes_test_frameworks_and_self_imports(self):
+        self.assertEqual(2, self.index.fan_in(self.design_kit))
+        self.assertEqual(2, self.index.fan_in(self.foundation_kit))
+
+
+if __name__ == '__main__':
+    unittest.main()
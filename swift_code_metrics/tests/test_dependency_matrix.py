@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._dependency_index import DependencyIndex
+from swift_code_metrics._dependency_matrix import MatrixDependencyIndex
+from swift_code_metrics._metrics import Framework, Metrics
+from swift_code_metrics._snapshot import MetricsSnapshot
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class MatrixDependencyIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        with tempfile.TemporaryDirectory() as artifacts:
+            inspector = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [])
+            self.assertTrue(inspector.analyze())
+        self.frameworks = inspector.frameworks
+        self.index = MatrixDependencyIndex(self.frameworks)
+
+    def test_matches_scalar_metrics(self):
+        for framework in self.frameworks:
+            self.assertEqual(Metrics.fan_in(framework, self.frameworks), self.index.fan_in(framework))
+            self.assertEqual(Metrics.fan_out(framework), self.index.fan_out(framework))
+            self.assertAlmostEqual(Metrics.instability(framework, self.frameworks),
+                                   self.index.instability(framework), delta=1e-9)
+            self.assertAlmostEqual(Metrics.abstractness(framework), self.index.abstractness(framework), delta=1e-9)
+            self.assertAlmostEqual(Metrics.distance_main_sequence(framework, self.frameworks),
+                                   self.index.distance_main_sequence(framework), delta=1e-9)
+
+    def test_external_frameworks(self):
+        external_framework = Framework('External')
+        self.assertEqual(0, self.index.fan_in(external_framework))
+        self.assertEqual(0, self.index.instability(external_framework))
+
+    def test_reverse_adjacency_not_built(self):
+        scalar_index = DependencyIndex(self.frameworks)
+        imported_frameworks = {i for f in self.frameworks for i in f.imports}
+        for framework in set(self.frameworks) | imported_frameworks | {Framework('External')}:
+            self.assertEqual(scalar_index.fan_in(framework), self.index.fan_in(framework))
+            self.assertAlmostEqual(scalar_index.distance_main_sequence(framework),
+                                   self.index.distance_main_sequence(framework), delta=1e-9)
+        self.assertIsNone(self.index._DependencyIndex__dependents)
+        self.assertIsNotNone(scalar_index._DependencyIndex__dependents)
+
+    def test_snapshot_matches_scalar_snapshot(self):
+        scalar_snapshot = MetricsSnapshot.build(self.frameworks)
+        matrix_threshold = DependencyIndex.MATRIX_THRESHOLD
+        DependencyIndex.MATRIX_THRESHOLD = 0
+        try:
+            self.assertIsInstance(DependencyIndex.create(self.frameworks), MatrixDependencyIndex)
+            self.assertEqual(scalar_snapshot.frameworks, MetricsSnapshot.build(self.frameworks).frameworks)
+        finally:
+            DependencyIndex.MATRIX_THRESHOLD = matrix_threshold
+
+    def test_create_below_threshold(self):
+        self.assertNotIsInstance(DependencyIndex.create(self.frameworks), MatrixDependencyIndex)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._flat_export import FlatExport
+from swift_code_metrics._report_writer import ReportWriter, SQLiteReportWriter
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class FlatExportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.artifacts = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def analyze(self, export_format: str, **kwargs) -> 'Inspector':
+        inspector = Inspector(EXAMPLE_PROJECT, self.artifacts, ['Test', 'Tests'], [], flat_export=export_format,
+                              **kwargs)
+        self.assertTrue(inspector.analyze())
+        return inspector
+
+    def read_ndjson(self, name: str):
+        with open(os.path.join(self.artifacts, f'{name}.ndjson'), 'r') as fp:
+            return [json.loads(line) for line in fp]
+
+    def test_ndjson_files(self):
+        inspector = self.analyze(FlatExport.NDJSON)
+        records = self.read_ndjson(FlatExport.FILES_NAME)
+        self.assertEqual(sum(f.number_of_files for f in inspector.frameworks), len(records))
+        self.assertEqual(sum(f.data.loc for f in inspector.frameworks), sum(r['loc'] for r in records))
+        self.assertEqual({
+            'path': 'BusinessLogic/BusinessLogic/AwesomeFeature.swift',
+            'framework': 'BusinessLogic',
+            'loc': 51,
+            'noc': 7,
+            'n_a': 0,
+            'n_c': 3,
+            'nom': 3,
+            'not': 0,
+            'imports': ['UIKit', 'FoundationFramework', 'SecretLib'],
+            'is_test': False,
+            'is_shared': False
+        }, records[0])
+
+    def test_ndjson_submodules(self):
+        inspector = self.analyze(FlatExport.NDJSON)
+        records = self.read_ndjson(FlatExport.SUBMODULES_NAME)
+        submodules = [(f, s) for f in inspector.frameworks for s in f.submodule.preorder()]
+        self.assertEqual([s.path.replace(' > ', '/') for _, s in submodules], [r['path'] for r in records])
+        self.assertEqual([f.name for f, _ in submodules], [r['framework'] for r in records])
+        self.assertEqual([s.data.as_dict for _, s in submodules],
+                         [{k: r[k] for k in ['loc', 'noc', 'n_a', 'n_c', 'nom', 'not', 'poc']} for r in records])
+        for record in records:
+            if record['parent'] is None:
+                self.assertEqual(0, record['depth'])
+            else:
+                self.assertEqual(f"{record['parent']}/{record['name']}", record['path'])
+
+    def test_submodule_paths_match_the_sqlite_report(self):
+        self.analyze(FlatExport.NDJSON, output_formats=[ReportWriter.SQLITE])
+        connection = sqlite3.connect(os.path.join(self.artifacts, SQLiteReportWriter.FILE_NAME))
+        try:
+            sqlite_paths = [row[0] for row in connection.execute('SELECT path FROM submodules')]
+        finally:
+            connection.close()
+        self.assertEqual(sorted(sqlite_paths), sorted(r['path'] for r in self.read_ndjson(FlatExport.SUBMODULES_NAME)))
+
+    def test_stream_exports_the_same_records(self):
+        self.analyze(FlatExport.NDJSON)
+        files, submodules = self.read_ndjson(FlatExport.FILES_NAME), self.read_ndjson(FlatExport.SUBMODULES_NAME)
+        self.analyze(FlatExport.NDJSON, stream=True)
+        self.assertEqual(files, self.read_ndjson(FlatExport.FILES_NAME))
+        self.assertEqual(submodules, self.read_ndjson(FlatExport.SUBMODULES_NAME))
+
+    def test_csv_matches_ndjson(self):
+        self.analyze(FlatExport.NDJSON)
+        records = self.read_ndjson(FlatExport.FILES_NAME)
+        self.analyze(FlatExport.CSV)
+        with open(os.path.join(self.artifacts, 'files.csv'), 'r', newline='') as fp:
+            rows = list(csv.DictReader(fp))
+        self.assertEqual(FlatExport.FILE_FIELDS, list(rows[0].keys()))
+        self.assertEqual([r['path'] for r in records], [r['path'] for r in rows])
+        self.assertEqual([' '.join(r['imports']) for r in records], [r['imports'] for r in rows])
+        self.assertEqual([str(r['loc']) for r in records], [r['loc'] for r in rows])
+        self.assertTrue(os.path.exists(os.path.join(self.artifacts, 'submodules.csv')))
+
+    def test_csv_non_ascii_names(self):
+        inspector = self.analyze(FlatExport.CSV)
+        swift_file = next(f for s in inspector.frameworks[0].submodule.preorder() for f in s.files)
+        swift_file.path = 'Módulo/Überprüfung.swift'
+        export = FlatExport(os.path.join(self.artifacts, 'non_ascii'), FlatExport.CSV)
+        export.append_file(swift_file)
+        export.close([])
+        with open(export.files_path, 'r', encoding='utf-8', newline='') as fp:
+            self.assertEqual('Módulo/Überprüfung.swift', list(csv.DictReader(fp))[0]['path'])
+
+    def test_export_closed_when_the_analysis_is_interrupted(self):
+        with mock.patch.object(FlatExport, 'append_file', side_effect=RuntimeError('Interrupted')), \
+                mock.patch.object(FlatExport, 'abort', autospec=True, side_effect=FlatExport.abort) as abort:
+            with self.assertRaises(RuntimeError):
+                self.analyze(FlatExport.CSV)
+        abort.assert_called_once()
+
+    def test_files_are_readable_before_the_end_of_the_analysis(self):
+        inspector = self.analyze(FlatExport.NDJSON)
+        flush_interval = FlatExport.FLUSH_INTERVAL
+        FlatExport.FLUSH_INTERVAL = 2
+        try:
+            export = FlatExport(os.path.join(self.artifacts, 'partial'), FlatExport.NDJSON)
+            swift_files = [f for framework in inspector.frameworks for s in framework.submodule.preorder()
+                           for f in s.files]
+            for swift_file in swift_files[:3]:
+                export.append_file(swift_file)
+            with open(export.files_path, 'r') as fp:
+                self.assertEqual(2, len(fp.readlines()))
+            export.close(inspector.frameworks)
+            with open(export.files_path, 'r') as fp:
+                self.assertEqual(3, len(fp.readlines()))
+        finally:
+            FlatExport.FLUSH_INTERVAL = flush_interval
+
+
+if __name__ == '__main__':
+    unittest.main()
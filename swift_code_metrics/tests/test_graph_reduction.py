@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from unittest import mock
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._graph_reduction import GraphReduction
+from swift_code_metrics._helpers import Log
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class GraphReductionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes = [('App', 100), ('Feature', 50), ('Core', 30), ('Utils', 10)]
+        self.edges = [('App', 'Feature', 5, 'green'),
+                      ('App', 'Core', 1, 'green'),
+                      ('Feature', 'Core', 3, 'green'),
+                      ('Core', 'Utils', 2, 'green'),
+                      ('Utils', 'Core', 1, 'green'),
+                      ('Feature', 'Alamofire', 4, 'red')]
+
+    def test_default_reduction_keeps_the_graph(self):
+        self.assertEqual((self.nodes, self.edges), GraphReduction().reduce(self.nodes, self.edges, []))
+
+    def test_min_imports(self):
+        _, edges = GraphReduction(min_imports=3).reduce(self.nodes, self.edges, [])
+        self.assertEqual([('App', 'Feature', 5, 'green'),
+                          ('Feature', 'Core', 3, 'green'),
+                          ('Feature', 'Alamofire', 4, 'red')], edges)
+
+    def test_collapse_cycles(self):
+        nodes, edges = GraphReduction(collapse_cycles=True).reduce(self.nodes, self.edges, [])
+        self.assertEqual([('App', 100), ('Feature', 50), ('Core + Utils', 40)], nodes)
+        self.assertEqual([('App', 'Feature', 5, 'green'),
+                          ('App', 'Core + Utils', 1, 'green'),
+                          ('Feature', 'Core + Utils', 3, 'green'),
+                          ('Feature', 'Alamofire', 4, 'red')], edges)
+
+    def test_collapse_long_cycle(self):
+        nodes = [(name, 1) for name in 'ABCDE']
+        edges = [(a, b, 1, 'green') for a, b in zip('ABCDE', 'BCDEA')]
+        nodes, edges = GraphReduction(collapse_cycles=True).reduce(nodes, edges, [])
+        self.assertEqual([('A + B + C + 2 more', 5)], nodes)
+        self.assertEqual([], edges)
+
+    def test_transitive_reduction(self):
+        _, edges = GraphReduction(transitive_reduction=True).reduce(self.nodes, self.edges, [])
+        # App -> Core is implied by App -> Feature -> Core, the cycle between Core and Utils is kept
+        self.assertEqual([('App', 'Feature', 5, 'green'),
+                          ('Feature', 'Core', 3, 'green'),
+                          ('Core', 'Utils', 2, 'green'),
+                          ('Utils', 'Core', 1, 'green'),
+                          ('Feature', 'Alamofire', 4, 'red')], edges)
+
+    def test_transitive_reduction_through_a_cycle(self):
+        nodes = [(name, 1) for name in 'ABCD']
+        edges = [('A', 'B', 1, 'green'), ('B', 'C', 1, 'green'), ('C', 'B', 1, 'green'),
+                 ('C', 'D', 1, 'green'), ('A', 'D', 1, 'green')]
+        _, reduced_edges = GraphReduction(transitive_reduction=True).reduce(nodes, edges, [])
+        self.assertEqual(edges[:4], reduced_edges)
+
+    def test_budget(self):
+        nodes, edges = GraphReduction(max_nodes=3).reduce(self.nodes, self.edges, [])
+        self.assertEqual([('App', 100), ('Feature', 50), ('Core', 30)], nodes)
+        self.assertEqual([('App', 'Feature', 5, 'green'),
+                          ('App', 'Core', 1, 'green'),
+                          ('Feature', 'Core', 3, 'green')], edges)
+
+        _, edges = GraphReduction(max_edges=2).reduce(self.nodes, self.edges, [])
+        self.assertEqual([('App', 'Feature', 5, 'green'), ('Feature', 'Alamofire', 4, 'red')], edges)
+
+    def test_cluster_by_folder(self):
+        with tempfile.TemporaryDirectory() as artifacts:
+            inspector = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [])
+            self.assertTrue(inspector.analyze())
+        frameworks = [inspector.snapshot[f.name] for f in inspector.filtered_frameworks(is_test=False)]
+        self.assertEqual(['BusinessLogic', 'Foundation', 'Foundation', 'SwiftCodeMetricsExample'],
+                         [GraphReduction.framework_folder(f, 1) for f in frameworks])
+        self.assertEqual(['BusinessLogic/BusinessLogic', 'Foundation/FoundationFramework', 'Foundation/SecretLib',
+                          'SwiftCodeMetricsExample'],
+                         [GraphReduction.framework_folder(f, 2) for f in frameworks])
+
+        nodes = [(f.name, f.loc) for f in frameworks]
+        edges = [('BusinessLogic', 'FoundationFramework', 1, 'green'),
+                 ('BusinessLogic', 'SecretLib', 1, 'green'),
+                 ('SecretLib', 'FoundationFramework', 1, 'green')]
+        with mock.patch.object(Log, 'warn') as warn:
+            reduced_nodes, reduced_edges = GraphReduction(cluster_depth=1).reduce(nodes, edges, frameworks)
+        warn.assert_not_called()
+        self.assertEqual(['BusinessLogic', 'Foundation/', 'SwiftCodeMetricsExample'], [n[0] for n in reduced_nodes])
+        self.assertEqual([('BusinessLogic', 'Foundation/', 2, 'green')], reduced_edges)
+
+        # Only the frameworks inferred from the top-level folders
+        top_level_nodes = [n for n in nodes if n[0] in ('BusinessLogic', 'SwiftCodeMetricsExample')]
+        with mock.patch.object(Log, 'warn') as warn:
+            self.assertEqual((top_level_nodes, []),
+                             GraphReduction(cluster_depth=1).reduce(top_level_nodes, [], frameworks))
+        warn.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+import pygraphviz as pgv
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._graph_helpers import ChartSpec, Graph
+from swift_code_metrics._graph_reduction import GraphReduction
+from swift_code_metrics._graphs_presenter import GraphPresenter
+from swift_code_metrics._metrics import Framework
+from swift_code_metrics._snapshot import MetricsSnapshot
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class FakeFramework:
+
+    def __init__(self, name: str, instability: float, abstractness: float):
+        self.name = name
+        self.instability = instability
+        self.abstractness = abstractness
+
+
+class ScatteredPlotTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.presenter = GraphPresenter(self.directory.name)
+        self.frameworks = [FakeFramework('OnTheSequence', 0.5, 0.5),
+                           FakeFramework('ZoneOfPain', 0.1, 0.1),
+                           FakeFramework('ZoneOfUselessness', 0.9, 0.8),
+                           FakeFramework('Close', 0.4, 0.5)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def scheduled_labels(self, max_labels=None):
+        with mock.patch.object(self.presenter.scheduler, 'submit') as submit:
+            self.presenter.distance_from_main_sequence_plot(self.frameworks,
+                                                            lambda fm: fm.instability,
+                                                            lambda fm: fm.abstractness,
+                                                            max_labels=max_labels)
+        spec = submit.call_args[0][0]
+        self.assertEqual(ChartSpec.SCATTER, spec.kind)
+        self.assertEqual(4, len(spec.arguments['data'][0]))
+        return spec.arguments['data'][2]
+
+    def test_all_frameworks_labelled_by_default(self):
+        self.assertEqual(['OnTheSequence', 'ZoneOfPain', 'ZoneOfUselessness', 'Close'], self.scheduled_labels())
+        self.assertEqual(['OnTheSequence', 'ZoneOfPain', 'ZoneOfUselessness', 'Close'], self.scheduled_labels(10))
+
+    def test_only_farthest_frameworks_labelled(self):
+        self.assertEqual(['', 'ZoneOfPain', 'ZoneOfUselessness', ''], self.scheduled_labels(max_labels=2))
+        self.assertEqual(['', '', '', ''], self.scheduled_labels(max_labels=0))
+
+    def test_large_scattered_plot(self):
+        random.seed(0)
+        n = Graph.SCATTER_DENSITY_THRESHOLD * 5
+        x = [random.random() for _ in range(n)]
+        y = [random.random() for _ in range(n)]
+        labels = [f'F{i}' if i < 20 else '' for i in range(n)]
+        path = Graph(self.directory.name).scattered_plot('Large chart', 'I', 'A', (x, y, labels), [([1, 0], 'g')])
+        self.assertGreater(os.path.getsize(path), 0)
+
+
+class DependencyGraphTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        inspector = Inspector(EXAMPLE_PROJECT, self.directory.name, ['Test', 'Tests'], [])
+        self.assertTrue(inspector.analyze())
+        self.frameworks = inspector.filtered_frameworks(is_test=False)
+        self.metrics = [inspector.snapshot[f.name] for f in self.frameworks]
+        self.aggregate = inspector.report.non_test_framework_aggregate
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def render(self):
+        presenter = GraphPresenter(self.directory.name)
+        with mock.patch.object(Graph, 'directed_graph_layout', side_effect=Graph.directed_graph_layout) as layout:
+            presenter.dependency_graph(self.metrics, self.aggregate.loc, self.aggregate.n_o_i)
+            paths = presenter.render_charts()
+        return paths, layout.call_count
+
+    def test_single_layout(self):
+        paths, n_of_layouts = self.render()
+        self.assertEqual(1, n_of_layouts)
+        self.assertEqual(['internal_dependencies_graph', 'external_dependencies_graph', 'dependencies_graph'],
+                         [os.path.splitext(os.path.basename(path))[0] for path in paths])
+
+        # Cached graphs
+        paths, n_of_layouts = self.render()
+        self.assertEqual(([], 0), (paths, n_of_layouts))
+
+    def test_views_rendered_again_when_the_layout_changes(self):
+        self.render()
+        # Only the internal dependencies change
+        app = next(f for f in self.frameworks if f.name == 'SwiftCodeMetricsExample')
+        app.append_import(next(f for f in self.frameworks if f.name == 'FoundationFramework'))
+        snapshot = MetricsSnapshot.build(self.frameworks)
+        self.metrics = [snapshot[f.name] for f in self.frameworks]
+        paths, n_of_layouts = self.render()
+        self.assertEqual(1, n_of_layouts)
+        self.assertEqual(['internal_dependencies_graph', 'external_dependencies_graph', 'dependencies_graph'],
+                         [os.path.splitext(os.path.basename(path))[0] for path in paths])
+
+    def test_live_frameworks_not_used(self):
+        presenter = GraphPresenter(self.directory.name)
+        untouchable = mock.PropertyMock(side_effect=AssertionError('Live framework used'))
+        with mock.patch.object(Framework, 'data', new_callable=lambda: untouchable), \
+                mock.patch.object(Framework, 'imports', new_callable=lambda: untouchable), \
+                mock.patch.object(presenter.scheduler, 'submit') as submit:
+            presenter.dependency_graph(self.metrics, self.aggregate.loc, self.aggregate.n_o_i,
+                                       reduction=GraphReduction(cluster_depth=1))
+        untouchable.assert_not_called()
+        self.assertEqual(3, submit.call_count)
+
+    def test_views_drawn_with_the_layout_positions(self):
+        nodes = [('A', 3), ('B', 1), ('C', 2)]
+        internal_edges = [('A', 'B', 3, 2, 'forestgreen')]
+        external_edges = [('A', 'C', 1, 1, 'orangered'), ('B', 'C', 2, 1, 'orangered')]
+        layout = Graph.directed_graph_layout(nodes, internal_edges + external_edges)
+        self.assertEqual({'A', 'B', 'C'}, set(layout['nodes'].keys()))
+        self.assertEqual({('A', 'B'), ('A', 'C'), ('B', 'C')}, set(layout['edges'].keys()))
+
+        with mock.patch.object(pgv.AGraph, 'draw', autospec=True) as draw:
+            Graph(self.directory.name).directed_graph('Internal', nodes, internal_edges, layout=layout)
+        dir_graph = draw.call_args[0][0]
+        self.assertEqual(layout['nodes'], {str(node): node.attr['pos'] for node in dir_graph.nodes()})
+        self.assertEqual([('A', 'B')], dir_graph.edges())
+        self.assertEqual(layout['edges'][('A', 'B')]['pos'], dir_graph.get_edge('A', 'B').attr['pos'])
+
+
+if __name__ == '__main__':
+    unittest.main()
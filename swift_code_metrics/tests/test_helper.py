@@ -1,4 +1,7 @@
+import io
+import logging
 import unittest
+from unittest import mock
 from swift_code_metrics import _helpers
 
 
@@ -165,5 +168,60 @@ class HelpersTests(unittest.TestCase):
         self.assertEqual(3, _helpers.ParsingHelpers.reduce_dictionary({"one": 1, "two": 2}))
 
 
+class LogTests(unittest.TestCase):
+
+    def test_configure_only_the_package_logger(self):
+        root_logger = logging.getLogger()
+        root_level, root_handlers = root_logger.level, list(root_logger.handlers)
+        _helpers.Log.configure(logging.INFO)
+        _helpers.Log.configure(logging.INFO)
+        self.assertEqual((root_level, root_handlers), (root_logger.level, root_logger.handlers))
+        self.assertEqual(1, len(logging.getLogger('swift_code_metrics').handlers))
+
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            _helpers.Log.info('Package message')
+            logging.getLogger('matplotlib.font_manager').info('Library message')
+        self.assertEqual('Package message\n', stderr.getvalue())
+
+
+class PathMatcherTests(unittest.TestCase):
+
+    def test_matches_substrings(self):
+        matcher = _helpers.PathMatcher(['Tests', 'Pods'])
+        for path in ['Project/Tests', 'Project/Pods/Alamofire', 'UITests/Helpers', 'Project/Sources/Tests.swift']:
+            self.assertEqual(_helpers.AnalyzerHelpers.is_path_in_list(path, ['Tests', 'Pods']), matcher.matches(path))
+        self.assertTrue(matcher.matches('Project/Tests'))
+        self.assertFalse(matcher.matches('Project/Sources'))
+
+    def test_matches_special_characters_literally(self):
+        matcher = _helpers.PathMatcher(['App (Old).build', 'a+b'])
+        self.assertTrue(matcher.matches('Build/App (Old).build/x'))
+        self.assertTrue(matcher.matches('Sources/a+b'))
+        self.assertFalse(matcher.matches('Build/App Old.build'))
+
+    def test_matches_globs(self):
+        self.assertTrue(_helpers.PathMatcher(['Pods/*/Tests']).matches('Project/Pods/Alamofire/Tests/Unit'))
+        self.assertFalse(_helpers.PathMatcher(['Pods/*/Tests']).matches('Project/Pods/Alamofire/Source/Tests'))
+        self.assertTrue(_helpers.PathMatcher(['Pods/**/Tests']).matches('Project/Pods/Alamofire/Source/Tests'))
+        self.assertTrue(_helpers.PathMatcher(['Module?']).matches('Project/Module1'))
+        self.assertTrue(_helpers.PathMatcher(['[AB]pp']).matches('Project/App'))
+        self.assertFalse(_helpers.PathMatcher(['[!AB]pp']).matches('Project/App'))
+
+    def test_matches_no_patterns(self):
+        self.assertFalse(_helpers.PathMatcher([]).matches('Project/Tests'))
+
+    def test_for_patterns_shares_matchers(self):
+        matcher = _helpers.PathMatcher.for_patterns(['Test', 'Tests'])
+        self.assertIs(matcher, _helpers.PathMatcher.for_patterns(['Test', 'Tests']))
+        self.assertIsNot(matcher, _helpers.PathMatcher.for_patterns(['Tests']))
+
+    def test_memo_is_bounded(self):
+        with mock.patch.object(_helpers.PathMatcher, 'MEMO_SIZE', 2):
+            matcher = _helpers.PathMatcher(['Tests'])
+        paths = [f'Project/Module{i}/Tests' for i in range(5)] + ['Project/Sources']
+        self.assertEqual([True] * 5 + [False], [matcher.matches(path) for path in paths])
+        self.assertEqual(2, matcher._PathMatcher__memoized_match.cache_info().currsize)
+
+
 if __name__ == '__main__':
     unittest.main()
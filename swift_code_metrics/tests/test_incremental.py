@@ -0,0 +1,109 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._incremental import GitRepository, ProjectModel
+from swift_code_metrics._parser import SwiftFileParser
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class IncrementalAnalysisTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, 'Project')
+        self.artifacts = os.path.join(self.directory.name, 'report')
+        self.model_path = os.path.join(self.directory.name, 'model.json')
+        shutil.copytree(EXAMPLE_PROJECT, self.source)
+        self.__git('init', '-q')
+        self.__commit('Base')
+        self.base_revision = GitRepository(self.source).resolve('HEAD')
+
+        base = self.__inspector(model_path=self.model_path)
+        self.assertTrue(base.analyze())
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_model_saved_with_base_revision(self):
+        model = ProjectModel.load(self.model_path)
+        self.assertEqual(self.base_revision, model.revision)
+        self.assertEqual(11, len(model.files))
+
+    def test_changed_files(self):
+        self.__apply_changes()
+        updated, deleted = GitRepository(self.source).changed_files(self.base_revision)
+        self.assertEqual({'BusinessLogic/BusinessLogic/AwesomeFeature.swift',
+                          'BusinessLogic/BusinessLogic/NewFeature.swift',
+                          'Foundation/FoundationFramework/Networking/Networking.swift'}, updated)
+        self.assertEqual({'Foundation/FoundationFramework/Networking.swift',
+                          'SwiftCodeMetricsExample/ViewController.swift'}, deleted)
+
+    def test_since_matches_full_analysis(self):
+        self.__apply_changes()
+        self.__commit('Changes')
+
+        incremental = self.__inspector(model_path=self.model_path, since=self.base_revision)
+        full = self.__inspector()
+        self.assertTrue(incremental.analyze())
+        self.assertTrue(full.analyze())
+        self.assertEqual(full.report.as_dict, incremental.report.as_dict)
+
+    def test_since_parses_only_changed_files(self):
+        self.__apply_changes()
+        self.__commit('Changes')
+
+        with mock.patch.object(SwiftFileParser, 'scan', autospec=True, side_effect=SwiftFileParser.scan) as scan:
+            self.assertTrue(self.__inspector(model_path=self.model_path, since=self.base_revision).analyze())
+        self.assertEqual(3, scan.call_count)
+
+    def test_since_uncommitted_changes_matches_full_analysis(self):
+        self.__apply_changes()
+
+        incremental = self.__inspector(model_path=self.model_path, since=self.base_revision)
+        full = self.__inspector()
+        self.assertTrue(incremental.analyze())
+        self.assertTrue(full.analyze())
+        self.assertEqual(full.report.as_dict, incremental.report.as_dict)
+
+    def test_since_model_of_other_revision_runs_full_analysis(self):
+        self.__apply_changes()
+        self.__commit('Changes')
+
+        incremental = self.__inspector(model_path=self.model_path, since='HEAD')
+        full = self.__inspector()
+        self.assertTrue(incremental.analyze())
+        self.assertTrue(full.analyze())
+        self.assertEqual(full.report.as_dict, incremental.report.as_dict)
+
+    # Private
+
+    def __apply_changes(self):
+        feature_path = os.path.join(self.source, 'BusinessLogic', 'BusinessLogic')
+        with open(os.path.join(feature_path, 'AwesomeFeature.swift'), 'a') as fp:
+            fp.write('\nimport SecretLib\n\nprotocol AddedProtocol {}\n')
+        with open(os.path.join(feature_path, 'NewFeature.swift'), 'w') as fp:
+            fp.write('import FoundationFramework\n\nclass NewFeature {\n    func run() {}\n}\n')
+        os.remove(os.path.join(self.source, 'SwiftCodeMetricsExample', 'ViewController.swift'))
+        networking_path = os.path.join(self.source, 'Foundation', 'FoundationFramework')
+        os.makedirs(os.path.join(networking_path, 'Networking'))
+        self.__git('mv', os.path.join(networking_path, 'Networking.swift'),
+                   os.path.join(networking_path, 'Networking', 'Networking.swift'))
+
+    def __inspector(self, **kwargs) -> 'Inspector':
+        return Inspector(self.source, self.artifacts, ['Test', 'Tests'], [], **kwargs)
+
+    def __commit(self, message: str):
+        self.__git('add', '-A')
+        self.__git('-c', 'user.name=scm', '-c', 'user.email=scm@example.com', 'commit', '-q', '-m', message)
+
+    def __git(self, *args):
+        subprocess.run(['git', '-C', self.source] + list(args), check=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
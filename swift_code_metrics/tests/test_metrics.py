@@ -64,6 +64,12 @@ class FrameworkTests(unittest.TestCase):
                             self.frameworks[2]: 1}
         self.assertEqual(expected_imports, self.framework.imports)
 
+    def test_imports_updated_by_append_import(self):
+        self.assertEqual(1, self.framework.imports[self.frameworks[0]])
+        self.framework.append_import(self.frameworks[0])
+        self.framework.append_import(Framework('Foundation'))
+        self.assertEqual({self.frameworks[0]: 2, self.frameworks[2]: 1}, self.framework.imports)
+
     def test_number_of_imports(self):
         self.assertEqual(2, self.framework.number_of_imports)
 
@@ -191,6 +197,15 @@ class MetricsTests(unittest.TestCase):
         self.assertEqual(expected_app_layer_internal_deps,
                          Metrics.internal_dependencies(self.app_layer, self.frameworks))
 
+    def test_dependencies_with_framework_names(self):
+        self.design_kit.append_import(self.foundation_kit)
+        names = Metrics.framework_names(self.frameworks)
+        for framework in self.frameworks:
+            self.assertEqual(Metrics.internal_dependencies(framework, self.frameworks),
+                             Metrics.internal_dependencies(framework, self.frameworks, names))
+            self.assertEqual(Metrics.external_dependencies(framework, self.frameworks),
+                             Metrics.external_dependencies(framework, self.frameworks, names))
+
     def test_total_dependencies(self):
         for sf in self.__dummy_external_frameworks:
             self.foundation_kit.append_import(sf)
@@ -400,6 +415,26 @@ class SubModuleTests(unittest.TestCase):
         self.assertEqual(self.additional_submodule, self.additional_module.next)
         self.assertEqual(self.submodule, self.additional_submodule.next)
 
+    def test_preorder(self):
+        self.submodule.submodules.append(self.additional_module)
+        self.assertEqual([self.submodule, self.helper, self.additional_module, self.additional_submodule],
+                         list(self.submodule.preorder()))
+        self.assertEqual([self.additional_module, self.additional_submodule],
+                         list(self.additional_module.preorder()))
+
+    def test_preorder_same_order_of_next(self):
+        self.submodule.submodules.append(self.additional_module)
+        visited = [self.submodule.next]
+        while visited[-1] is not self.submodule:
+            visited.append(visited[-1].next)
+        self.assertEqual(visited[:-1], list(self.submodule.preorder())[1:])
+
+    def test_child(self):
+        self.assertIs(self.helper, self.submodule.child('Helper'))
+        self.assertIsNone(self.submodule.child('AdditionalModule'))
+        self.submodule.submodules.append(self.additional_module)
+        self.assertIs(self.additional_module, self.submodule.child('AdditionalModule'))
+
     def test_data(self):
         data = SyntheticData(
             loc=2,
@@ -411,6 +446,39 @@ class SubModuleTests(unittest.TestCase):
         )
         self.assertEqual(data, self.submodule.data)
 
+    def test_append_file_updates_ancestors(self):
+        self.submodule.submodules.append(self.additional_module)
+        self.assertEqual(4, self.submodule.n_of_files)
+        loc = self.submodule.data.loc
+        self.additional_submodule.append_file(example_swiftfile)
+        self.assertEqual(5, self.submodule.n_of_files)
+        self.assertEqual(3, self.additional_module.n_of_files)
+        self.assertEqual(loc + example_swiftfile.loc, self.submodule.data.loc)
+
+    def test_data_cached(self):
+        self.assertIs(self.submodule.data, self.submodule.data)
+
+    def test_add_submodule_updates_ancestors(self):
+        self.assertEqual(2, self.submodule.n_of_files)
+        self.helper.add_submodule(self.additional_module)
+        self.assertEqual(4, self.submodule.n_of_files)
+        self.assertIs(self.additional_module, self.helper.child('AdditionalModule'))
+
+    def test_append_files_to_stale_descendants(self):
+        self.submodule.add_submodule(self.additional_module)
+        loc = self.submodule.data.loc
+        self.additional_submodule.append_file(example_swiftfile)
+        self.additional_submodule.append_file(example_swiftfile)
+        self.assertEqual(6, self.submodule.n_of_files)
+        self.assertEqual(loc + 2 * example_swiftfile.loc, self.submodule.data.loc)
+
+    def test_files_not_copied(self):
+        files = []
+        submodule = SubModule(name='Module', files=files, submodules=[], parent=None)
+        files.append(example_swiftfile)
+        self.assertIs(files, submodule.files)
+        self.assertEqual(1, submodule.n_of_files)
+
     def test_empty_data(self):
         data = SyntheticData(
             loc=0,
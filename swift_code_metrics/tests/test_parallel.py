@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._parallel import ParallelParser
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class ParallelParserTests(unittest.TestCase):
+
+    def setUp(self):
+        self.min_files_per_worker = ParallelParser.MIN_FILES_PER_WORKER
+        ParallelParser.MIN_FILES_PER_WORKER = 1
+        self.files = []
+        for subdir, _, files in os.walk(EXAMPLE_PROJECT):
+            for file in files:
+                if file.endswith('.swift'):
+                    self.files.append((os.path.join(subdir, file), subdir))
+
+    def tearDown(self):
+        ParallelParser.MIN_FILES_PER_WORKER = self.min_files_per_worker
+
+    def test_parse_parallel_preserves_files_order(self):
+        parser = ParallelParser(base_path=EXAMPLE_PROJECT, tests_default_paths=['Test', 'Tests'], jobs=3)
+        parsed_paths = [path for path, _, _ in parser.parse(self.files)]
+        self.assertEqual([path for path, _ in self.files], parsed_paths)
+
+    def test_parse_parallel_matches_serial_results(self):
+        serial = ParallelParser(base_path=EXAMPLE_PROJECT, tests_default_paths=['Test', 'Tests'], jobs=1)
+        parallel = ParallelParser(base_path=EXAMPLE_PROJECT, tests_default_paths=['Test', 'Tests'], jobs=3)
+
+        def describe(results):
+            return [(path, [(f.framework_name, f.loc, f.n_of_comments, f.imports, f.methods, f.is_test)
+                            for f in swift_files])
+                    for path, _, swift_files in results]
+
+        self.assertEqual(describe(serial.parse(self.files)), describe(parallel.parse(self.files)))
+
+    def test_stream_preserves_files_order(self):
+        parser = ParallelParser(base_path=EXAMPLE_PROJECT, tests_default_paths=['Test', 'Tests'], jobs=3)
+        parsed_paths = [path for path, _, _ in parser.stream(iter(self.files), batch_size=4)]
+        self.assertEqual([path for path, _ in self.files], parsed_paths)
+
+    def test_inspector_parallel_report_matches_serial_report(self):
+        with tempfile.TemporaryDirectory() as artifacts:
+            serial = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=1)
+            parallel = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=3)
+            self.assertTrue(serial.analyze())
+            self.assertTrue(parallel.analyze())
+            self.assertEqual(serial.report.as_dict, parallel.report.as_dict)
+
+    def test_inspector_counts_only_report_matches_serial_report(self):
+        with tempfile.TemporaryDirectory() as artifacts:
+            serial = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=1)
+            counts_only = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=3, counts_only=True)
+            self.assertTrue(serial.analyze())
+            self.assertTrue(counts_only.analyze())
+            self.assertEqual(serial.report.as_dict, counts_only.report.as_dict)
+
+    def test_inspector_stream_report_matches_serial_report(self):
+        with tempfile.TemporaryDirectory() as artifacts:
+            serial = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=1)
+            stream = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=3, stream=True)
+            self.assertTrue(serial.analyze())
+            self.assertTrue(stream.analyze())
+            self.assertEqual(serial.report.as_dict, stream.report.as_dict)
+            self.assertTrue(all(len(s.files) == 0 for f in stream.frameworks for s in f.submodule.preorder()))
+
+    def test_inspector_cached_report_matches_serial_report(self):
+        with tempfile.TemporaryDirectory() as artifacts:
+            cache_dir = os.path.join(artifacts, 'cache')
+            serial = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=1)
+            cold = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=3, cache_dir=cache_dir)
+            warm = Inspector(EXAMPLE_PROJECT, artifacts, ['Test', 'Tests'], [], jobs=3, cache_dir=cache_dir)
+            for inspector in [serial, cold, warm]:
+                self.assertTrue(inspector.analyze())
+            self.assertEqual(serial.report.as_dict, cold.report.as_dict)
+            self.assertEqual(serial.report.as_dict, warm.report.as_dict)
+
+    def test_size_aware_chunks_schedule_big_files_alone(self):
+        with tempfile.TemporaryDirectory() as directory:
+            tasks = []
+            for i, size in enumerate([10, 1000, 10, 10, 10]):
+                path = os.path.join(directory, f'File{i}.swift')
+                with open(path, 'w') as fp:
+                    fp.write('a' * size)
+                tasks.append((i, path, directory))
+
+            chunks = ParallelParser._ParallelParser__size_aware_chunks(tasks, 4)
+
+        self.assertEqual([[1]], [[t[0] for t in chunk] for chunk in chunks][:1])
+        self.assertEqual([0, 1, 2, 3, 4], sorted(t[0] for chunk in chunks for t in chunk))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,10 @@
+import json
+import os
+import pickle
+import tempfile
 import unittest
-from swift_code_metrics._parser import SwiftFileParser, ProjectPathsOverride
+from unittest import mock
+from swift_code_metrics._parser import SwiftFileParser, ProjectPathsOverride, ProjectPathsOverrideResolver
 from json import JSONDecodeError
 
 
@@ -68,6 +73,42 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(['test_example_assertion',
                           'testAnotherExample'], self.example_test_file.tests)
 
+    # Compact representation
+
+    def test_swiftfile_counts(self):
+        self.assertEqual((2, 6, 4, 0), (self.example_parsed_file.n_of_interfaces,
+                                        self.example_parsed_file.n_of_concrete_data_structures,
+                                        self.example_parsed_file.n_of_methods,
+                                        self.example_parsed_file.n_of_tests))
+        self.assertEqual(2, self.example_test_file.n_of_tests)
+
+    def test_swiftparser_parse_counts_only(self):
+        counts_only_file = SwiftFileParser(
+            file="swift_code_metrics/tests/test_resources/ExampleTest.swift",
+            base_path="swift_code_metrics/tests",
+            current_subdir="swift_code_metrics",
+            tests_default_paths="Test",
+            counts_only=True
+        ).parse()[0]
+        self.assertEqual([], counts_only_file.methods)
+        self.assertEqual(self.example_test_file.imports, counts_only_file.imports)
+        self.assertEqual((self.example_test_file.n_of_interfaces,
+                          self.example_test_file.n_of_concrete_data_structures,
+                          self.example_test_file.n_of_methods,
+                          self.example_test_file.n_of_tests),
+                         (counts_only_file.n_of_interfaces,
+                          counts_only_file.n_of_concrete_data_structures,
+                          counts_only_file.n_of_methods,
+                          counts_only_file.n_of_tests))
+
+    def test_swiftfile_pickle_interns_names(self):
+        copy = pickle.loads(pickle.dumps(self.example_parsed_file))
+        self.assertFalse(hasattr(copy, '__dict__'))
+        self.assertIs(self.example_parsed_file.framework_name, copy.framework_name)
+        self.assertIs(self.example_parsed_file.imports[0], copy.imports[0])
+        self.assertEqual(self.example_parsed_file.methods, copy.methods)
+        self.assertEqual(self.example_parsed_file.n_of_methods, copy.n_of_methods)
+
 
 class ProjectPathsOverrideTests(unittest.TestCase):
 
@@ -109,5 +150,54 @@ class ProjectPathsOverrideTests(unittest.TestCase):
         self.assertIsNotNone(cm)
 
 
+class ProjectPathsOverrideResolverTests(unittest.TestCase):
+
+    def setUp(self):
+        self.path = "swift_code_metrics/tests/test_resources/scm_overrides/valid_scm_override.json"
+        self.resolver = ProjectPathsOverrideResolver.load(self.path)
+
+    def test_resolve_library(self):
+        self.assertEqual((['SecretLib'], False),
+                         self.resolver.resolve(('Foundation', 'SecretLib', 'Lib.swift')))
+
+    def test_resolve_library_declaration_order(self):
+        self.assertEqual((['FoundationFramework'], False),
+                         self.resolver.resolve(('SecretLib', 'FoundationFramework', 'Lib.swift')))
+
+    def test_resolve_shared(self):
+        self.assertEqual((['FoundationFramework', 'SecretLib'], False),
+                         self.resolver.resolve(('Foundation', 'Shared', 'Helpers.swift')))
+
+    def test_resolve_shared_without_test_flag(self):
+        resolver = ProjectPathsOverrideResolver(ProjectPathsOverride(entries={
+            "libraries": [{"name": "Lib", "path": "Lib", "is_test": False}],
+            "shared": [{"path": "Shared", "is_test": None}]
+        }))
+        self.assertEqual(([], None), resolver.resolve(('Shared', 'Helpers.swift')))
+
+    def test_resolve_not_classified(self):
+        self.assertIsNone(self.resolver.resolve(('Foundation', 'Other', 'File.swift')))
+
+    def test_load_missing_file(self):
+        self.assertIsNone(ProjectPathsOverrideResolver.load('swift_code_metrics/tests/test_resources/scm.json'))
+
+    def test_load_once(self):
+        with mock.patch.object(ProjectPathsOverride, 'load_from_json') as load_from_json:
+            self.assertIs(self.resolver, ProjectPathsOverrideResolver.load(self.path))
+            load_from_json.assert_not_called()
+
+    def test_load_changed_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'scm.json')
+            with open(path, 'w') as fp:
+                json.dump({"libraries": [{"name": "Lib", "path": "Lib", "is_test": False}], "shared": []}, fp)
+            self.assertEqual((['Lib'], False), ProjectPathsOverrideResolver.load(path).resolve(('Lib', 'a.swift')))
+
+            with open(path, 'w') as fp:
+                json.dump({"libraries": [{"name": "NewLib", "path": "Lib", "is_test": True}], "shared": []}, fp)
+            os.utime(path, ns=(0, 10 ** 9))
+            self.assertEqual((['NewLib'], True), ProjectPathsOverrideResolver.load(path).resolve(('Lib', 'a.swift')))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._report_reader import JSONReportReader
+from swift_code_metrics._report_writer import JSONReportWriter
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class JSONReportReaderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.artifacts = self.directory.name
+        inspector = Inspector(EXAMPLE_PROJECT, self.artifacts, ['Test', 'Tests'], [], json_index=True)
+        self.assertTrue(inspector.analyze())
+        self.inspector = inspector
+        self.report = inspector.report
+        self.expected_dict = self.report.as_dict
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_reader_matches_report(self):
+        with JSONReportReader(self.artifacts) as reader:
+            expected_frameworks = {}
+            for key in ['non-test-frameworks', 'tests-frameworks']:
+                for analysis in self.expected_dict[key]:
+                    expected_frameworks.update(analysis)
+            self.assertEqual(list(expected_frameworks.keys()), reader.framework_names)
+            for name, analysis in expected_frameworks.items():
+                self.assertEqual(analysis, reader.framework(name))
+            self.assertEqual(list(self.expected_dict.keys()), reader.section_names)
+            for key, value in self.expected_dict.items():
+                self.assertEqual(value, reader.section(key))
+
+    def test_indented_report(self):
+        self.assert_reader_matches_report()
+
+    def test_compact_report(self):
+        JSONReportWriter(compact=True, index=True).write(self.report, self.artifacts)
+        self.assert_reader_matches_report()
+
+    def test_non_ascii_names(self):
+        self.inspector.frameworks[0].name = 'LógicaDeNegócio'
+        self.expected_dict = self.report.as_dict
+        path = JSONReportWriter(index=True).write(self.report, self.artifacts)
+        with open(path, 'rb') as fp:
+            self.assertNotIn(b'\r', fp.read())
+        self.assert_reader_matches_report()
+
+    def test_unknown_framework(self):
+        with JSONReportReader(self.artifacts) as reader:
+            with self.assertRaises(KeyError):
+                reader.framework('Unknown')
+
+    def test_stale_index(self):
+        with open(os.path.join(self.artifacts, 'output.json'), 'a') as fp:
+            fp.write('\n')
+        with self.assertRaises(ValueError):
+            JSONReportReader(self.artifacts)
+
+    def test_index_removed_without_index_option(self):
+        JSONReportWriter().write(self.report, self.artifacts)
+        self.assertFalse(os.path.exists(os.path.join(self.artifacts, JSONReportReader.INDEX_FILE_NAME)))
+
+    def test_index_requires_uncompressed_report(self):
+        with self.assertRaises(ValueError):
+            JSONReportWriter(compress=True, index=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._helpers import JSONReader
+from swift_code_metrics._report import Report
+from swift_code_metrics._report_writer import JSONReportWriter, ReportWriter, SQLiteReportWriter
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class JSONReportWriterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.artifacts = self.directory.name
+        inspector = Inspector(EXAMPLE_PROJECT, self.artifacts, ['Test', 'Tests'], [])
+        self.assertTrue(inspector.analyze())
+        self.report = inspector.report
+        self.expected_dict = self.report.as_dict
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_indented_output_matches_json_dump(self):
+        path = JSONReportWriter().write(self.report, os.path.join(self.artifacts, 'indented'))
+        with open(path, 'r') as fp:
+            self.assertEqual(json.dumps(self.expected_dict, indent=4), fp.read())
+
+    def test_compact_output(self):
+        path = JSONReportWriter(compact=True).write(self.report, os.path.join(self.artifacts, 'compact'))
+        with open(path, 'r') as fp:
+            self.assertEqual(json.dumps(self.expected_dict, separators=(',', ':')), fp.read())
+
+    def test_gzip_output(self):
+        path = JSONReportWriter(compact=True, compress=True).write(self.report, os.path.join(self.artifacts, 'gzip'))
+        self.assertEqual('output.json.gz', os.path.basename(path))
+        self.assertEqual(self.expected_dict, JSONReader.read_json_file(path))
+
+    def test_empty_report(self):
+        report = Report()
+        for compact in [False, True]:
+            path = JSONReportWriter(compact=compact).write(report, os.path.join(self.artifacts, str(compact)))
+            with open(path, 'r') as fp:
+                self.assertEqual(json.dumps(report.as_dict, indent=None if compact else 4,
+                                            separators=(',', ':') if compact else None), fp.read())
+
+    def test_write_does_not_build_the_whole_report(self):
+        with mock.patch.object(Report, 'as_dict', new_callable=mock.PropertyMock) as as_dict:
+            path = JSONReportWriter().write(self.report, os.path.join(self.artifacts, 'streamed'))
+        as_dict.assert_not_called()
+        self.assertEqual(self.expected_dict, JSONReader.read_json_file(path))
+
+
+class SQLiteReportWriterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.artifacts = self.directory.name
+        self.inspector = Inspector(EXAMPLE_PROJECT, self.artifacts, ['Test', 'Tests'], [],
+                                   output_formats=[ReportWriter.JSON, ReportWriter.SQLITE])
+        self.assertTrue(self.inspector.analyze())
+        self.expected_dict = self.inspector.report.as_dict
+        self.connection = sqlite3.connect(os.path.join(self.artifacts, SQLiteReportWriter.FILE_NAME))
+
+    def tearDown(self):
+        self.connection.close()
+        self.directory.cleanup()
+
+    def test_create(self):
+        self.assertIsInstance(ReportWriter.create(ReportWriter.SQLITE), SQLiteReportWriter)
+        self.assertIsInstance(ReportWriter.create(ReportWriter.JSON), JSONReportWriter)
+        self.assertTrue(os.path.exists(os.path.join(self.artifacts, JSONReportWriter.FILE_NAME)))
+
+    def test_writer_without_write_is_not_created(self):
+        class IncompleteWriter(ReportWriter):
+            @property
+            def file_name(self) -> str:
+                return 'output.txt'
+
+        with self.assertRaises(TypeError):
+            IncompleteWriter()
+
+    def test_frameworks(self):
+        rows = self.connection.execute('SELECT name, is_test, loc, noc, "not", noi, fan_in, fan_out, i, a, d_3 '
+                                       'FROM frameworks ORDER BY id').fetchall()
+        expected_rows = []
+        for key, is_test in [('non-test-frameworks', 0), ('tests-frameworks', 1)]:
+            for analysis in self.expected_dict[key]:
+                name, values = next(iter(analysis.items()))
+                expected_rows.append((name, is_test, values['loc'], values['noc'], values['not'], values['noi'],
+                                      values.get('fan_in'), values.get('fan_out'), values.get('i'), values.get('a'),
+                                      values.get('d_3')))
+        self.assertEqual(expected_rows, [row[:8] + tuple(None if v is None else round(v, 3) for v in row[8:])
+                                         for row in rows])
+
+    def test_submodules(self):
+        for framework in self.inspector.frameworks:
+            framework_id, = self.connection.execute('SELECT id FROM frameworks WHERE name = ?',
+                                                    (framework.name,)).fetchone()
+            root = self.connection.execute('SELECT id, n_of_files, loc FROM submodules '
+                                           'WHERE framework_id = ? AND parent_id IS NULL', (framework_id,)).fetchall()
+            self.assertEqual([framework.number_of_files, framework.data.loc], list(root[0][1:]))
+            n_of_submodules, = self.connection.execute('SELECT COUNT(*) FROM submodules WHERE framework_id = ?',
+                                                       (framework_id,)).fetchone()
+            self.assertEqual(len(list(framework.submodule.preorder())), n_of_submodules)
+
+    def test_files(self):
+        n_of_files, loc = self.connection.execute('SELECT COUNT(*), SUM(loc) FROM files').fetchone()
+        self.assertEqual(sum(f.number_of_files for f in self.inspector.frameworks), n_of_files)
+        self.assertEqual(sum(f.data.loc for f in self.inspector.frameworks), loc)
+        top_file = self.connection.execute('SELECT files.path, files.loc FROM files '
+                                           'JOIN frameworks ON frameworks.id = files.framework_id '
+                                           'WHERE frameworks.name = ? ORDER BY files.loc DESC LIMIT 1',
+                                           ('BusinessLogic',)).fetchone()
+        self.assertEqual(('BusinessLogic/BusinessLogic/AwesomeFeature.swift', 51), top_file)
+
+    def test_dependencies_and_aggregates(self):
+        dependencies = self.connection.execute('SELECT frameworks.name, dependency, n_of_imports '
+                                               'FROM dependencies JOIN frameworks '
+                                               'ON frameworks.id = dependencies.framework_id').fetchall()
+        self.assertEqual(sorted(d for f in self.inspector.frameworks for d in
+                                [(f.name, i.name, n) for i, n in f.imports.items()]), sorted(dependencies))
+        aggregates = {row[0]: row[1:] for row in self.connection.execute(
+            'SELECT name, loc, noc, n_a, n_c, nom, "not", noi FROM aggregates')}
+        expected_aggregates = {**self.expected_dict['aggregate'], 'shared': self.expected_dict['shared']}
+        for name, values in expected_aggregates.items():
+            self.assertEqual(tuple(values[k] for k in ['loc', 'noc', 'n_a', 'n_c', 'nom', 'not', 'noi']),
+                             aggregates[name])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from swift_code_metrics._scanner import LineScanner
+
+
+class LineScannerTests(unittest.TestCase):
+
+    def setUp(self):
+        with open("swift_code_metrics/tests/test_resources/ExampleFile.swift", encoding='utf-8') as f:
+            self.example_content = LineScanner.scan(f)
+
+    def test_scan_example_file_counts(self):
+        self.assertEqual(25, self.example_content.loc)
+        self.assertEqual(21, self.example_content.n_of_comments)
+
+    def test_scan_example_file_declarations(self):
+        self.assertEqual(['Foundation', 'AmazingFramework', 'Helper', 'TestedLibrary'], self.example_content.imports)
+        self.assertEqual(['SimpleProtocol', 'UnusedClassProtocol'], self.example_content.interfaces)
+        self.assertEqual(['GenericStruct<T>', 'InternalStruct'], self.example_content.structs)
+        self.assertEqual(['methodOne', 'methodTwo', 'privateFunction', 'aStaticMethod'], self.example_content.methods)
+
+    def test_scan_multiple_declarations_same_line(self):
+        content = LineScanner.scan(['class func make() -> Bool {'])
+        self.assertEqual(['func'], content.classes)
+        self.assertEqual(['make'], content.methods)
+
+    def test_scan_lines_without_keywords(self):
+        content = LineScanner.scan(['let value = 1', '', 'print(value)'])
+        self.assertEqual(2, content.loc)
+        self.assertEqual([], content.imports + content.interfaces + content.structs + content.classes
+                         + content.methods)
+
+    def test_scan_comments(self):
+        content = LineScanner.scan(['// single', '/* begin', 'middle', 'end */', '/* inline */', 'let a = 1'])
+        self.assertEqual(5, content.n_of_comments)
+        self.assertEqual(1, content.loc)
+
+
+if __name__ == '__main__':
+    unittest.main()
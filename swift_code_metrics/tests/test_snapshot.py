@@ -0,0 +1,60 @@
+import unittest
+from dataclasses import FrozenInstanceError
+from swift_code_metrics._metrics import Framework, Metrics
+from swift_code_metrics._snapshot import MetricsSnapshot
+from swift_code_metrics.tests.test_metrics import example_swiftfile, example_file2
+
+
+class MetricsSnapshotTests(unittest.TestCase):
+
+    def setUp(self):
+        self.foundation_kit = Framework('FoundationKit')
+        self.app_layer = Framework('ApplicationLayer')
+        self.app_layer_tests = Framework('ApplicationLayerTests', is_test_framework=True)
+        self.frameworks = [self.foundation_kit, self.app_layer, self.app_layer_tests]
+        self.foundation_kit.submodule.files = [example_swiftfile]
+        self.app_layer.submodule.files = [example_swiftfile, example_file2]
+        self.app_layer_tests.submodule.files = [example_file2]
+        self.app_layer.append_import(self.foundation_kit)
+        self.app_layer.append_import(Framework('UIKit'))
+        self.app_layer_tests.append_import(self.app_layer)
+        self.snapshot = MetricsSnapshot.build(self.frameworks)
+
+    def test_framework_metrics(self):
+        metrics = self.snapshot['ApplicationLayer']
+        data = self.app_layer.data
+        self.assertEqual(('ApplicationLayer', 'AL', 2), (metrics.name, metrics.compact_name, metrics.n_of_files))
+        self.assertEqual((data.loc, data.noc, data.number_of_interfaces, data.number_of_concrete_data_structures,
+                          data.number_of_methods, data.number_of_tests),
+                         (metrics.loc, metrics.noc, metrics.n_a, metrics.n_c, metrics.nom, metrics.n_of_tests))
+        self.assertEqual(1, metrics.noi)
+        self.assertEqual(('FoundationKit(1)',), metrics.dependencies)
+        self.assertEqual(data.poc, metrics.poc)
+
+    def test_architectural_metrics(self):
+        for framework in [self.foundation_kit, self.app_layer]:
+            metrics = self.snapshot[framework.name]
+            self.assertEqual(Metrics.fan_in(framework, self.frameworks), metrics.fan_in)
+            self.assertEqual(Metrics.fan_out(framework), metrics.fan_out)
+            self.assertEqual(Metrics.instability(framework, self.frameworks), metrics.instability)
+            self.assertEqual(Metrics.abstractness(framework), metrics.abstractness)
+            self.assertEqual(Metrics.distance_main_sequence(framework, self.frameworks),
+                             metrics.distance_main_sequence)
+
+    def test_test_frameworks_without_architectural_metrics(self):
+        metrics = self.snapshot['ApplicationLayerTests']
+        self.assertIsNone(metrics.fan_in)
+        self.assertIsNone(metrics.instability)
+
+    def test_filtered(self):
+        self.assertEqual(['FoundationKit', 'ApplicationLayer'], [f.name for f in self.snapshot.filtered(False)])
+        self.assertEqual(['ApplicationLayerTests'], [f.name for f in self.snapshot.filtered(True)])
+
+    def test_read_only(self):
+        with self.assertRaises(FrozenInstanceError):
+            self.snapshot['FoundationKit'].loc = 0
+        self.assertNotIn('UIKit', self.snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
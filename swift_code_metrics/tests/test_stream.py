@@ -0,0 +1,64 @@
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._parser import SwiftFileParser
+from swift_code_metrics._scanner import ScannedContent
+from swift_code_metrics._walker import SwiftFilesWalker
+
+N_OF_FILES = 500000
+N_OF_TRACED_FILES = 10000
+FRAMEWORKS = 20
+FOLDERS_PER_FRAMEWORK = 50
+# Memory allocated while walking the last files and still alive when the walk is completed (the files of the batch
+# still to parse), independent of the number of traced files. Keeping the parsed files would retain more than 10 MB.
+MAX_RETAINED_MEMORY = 1024 * 1024
+
+
+class StreamTests(unittest.TestCase):
+    """
+    Streaming analysis of a synthetic tree of 500k files (the file system and the scanner are replaced by a
+    generator of paths and a constant content).
+    """
+
+    def setUp(self):
+        self.content = ScannedContent(loc=10,
+                                      n_of_comments=2,
+                                      imports=['Foundation', 'Framework1'],
+                                      interfaces=['Protocol'],
+                                      structs=['Struct'],
+                                      classes=['Class'],
+                                      methods=['method', 'testMethod'])
+        self.retained_memory = None
+
+    def test_stream_memory_does_not_grow_with_the_number_of_files(self):
+        def iter_files(walker, directory):
+            for i in range(N_OF_FILES):
+                if i == N_OF_FILES - N_OF_TRACED_FILES:
+                    tracemalloc.start()
+                subdir = f'{directory}/Framework{i % FRAMEWORKS}/Folder{(i // FRAMEWORKS) % FOLDERS_PER_FRAMEWORK}'
+                yield f'{subdir}/File{i}.swift', subdir
+            self.retained_memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        with mock.patch.object(SwiftFilesWalker, 'iter_files', iter_files), \
+                mock.patch.object(SwiftFileParser, 'scan', lambda parser: self.content), \
+                tempfile.TemporaryDirectory() as artifacts:
+            inspector = Inspector('/virtual/Project', artifacts, ['Test', 'Tests'], [], jobs=1, stream=True)
+            self.assertTrue(inspector.analyze())
+
+        self.assertLess(self.retained_memory, MAX_RETAINED_MEMORY)
+        self.assertEqual(FRAMEWORKS, len(inspector.frameworks))
+        self.assertEqual(N_OF_FILES, sum(f.number_of_files for f in inspector.frameworks))
+        for framework in inspector.frameworks:
+            submodules = list(framework.submodule.preorder())
+            # Root, framework folder and its subfolders
+            self.assertEqual(2 + FOLDERS_PER_FRAMEWORK, len(submodules))
+            self.assertTrue(all(len(s.files) == 0 for s in submodules))
+        self.assertEqual(N_OF_FILES * 10, inspector.report.total_aggregate.loc)
+        self.assertEqual(N_OF_FILES * 2, inspector.report.total_aggregate.number_of_methods)
+
+
+if __name__ == '__main__':
+    unittest.main()
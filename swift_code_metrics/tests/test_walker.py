@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from swift_code_metrics._walker import SwiftFilesWalker
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class SwiftFilesWalkerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        for path in ['App/AppDelegate.swift',
+                     'App/Views/View.swift',
+                     'App/README.md',
+                     'Pods/Alamofire/Session.swift',
+                     '.build/checkouts/Package.swift',
+                     '.git/hooks/Hook.swift',
+                     'Root.swift']:
+            full_path = os.path.join(self.root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as fp:
+                fp.write('import Foundation\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_files_walk_order(self):
+        self.assertEqual([(os.path.join(self.root, 'Root.swift'), self.root),
+                          (os.path.join(self.root, 'App', 'AppDelegate.swift'), os.path.join(self.root, 'App')),
+                          (os.path.join(self.root, 'App', 'Views', 'View.swift'),
+                           os.path.join(self.root, 'App', 'Views')),
+                          (os.path.join(self.root, 'Pods', 'Alamofire', 'Session.swift'),
+                           os.path.join(self.root, 'Pods', 'Alamofire'))],
+                         SwiftFilesWalker([]).files(self.root))
+
+    def test_files_matches_os_walk(self):
+        expected_files = []
+        for subdir, dirs, files in os.walk(EXAMPLE_PROJECT):
+            dirs.sort()
+            expected_files.extend((os.path.join(subdir, f), subdir) for f in sorted(files) if f.endswith('.swift'))
+        self.assertEqual(expected_files, SwiftFilesWalker([]).files(EXAMPLE_PROJECT))
+
+    def test_excluded_directories_are_not_listed(self):
+        with mock.patch('os.scandir', wraps=os.scandir) as scandir:
+            files = SwiftFilesWalker(['Pods']).files(self.root)
+        listed_directories = [c.args[0] for c in scandir.call_args_list]
+        self.assertNotIn(os.path.join(self.root, 'Pods'), listed_directories)
+        self.assertNotIn(os.path.join(self.root, '.build'), listed_directories)
+        self.assertNotIn(os.path.join(self.root, 'Pods', 'Session.swift'), [f for f, _ in files])
+        self.assertEqual(3, len(files))
+
+    def test_include_hidden_directories(self):
+        files = [f for f, _ in SwiftFilesWalker([], include_hidden=True).files(self.root)]
+        self.assertIn(os.path.join(self.root, '.build', 'checkouts', 'Package.swift'), files)
+        self.assertNotIn(os.path.join(self.root, '.git', 'hooks', 'Hook.swift'), files)
+
+    def test_concurrent_walk_matches_serial_walk(self):
+        self.assertEqual(SwiftFilesWalker([]).files(self.root), SwiftFilesWalker([], threads=4).files(self.root))
+
+    def test_iter_files_matches_files(self):
+        for walker in [SwiftFilesWalker([]), SwiftFilesWalker(['Pods'])]:
+            self.assertEqual(walker.files(self.root), list(walker.iter_files(self.root)))
+        walker = SwiftFilesWalker([])
+        self.assertEqual(walker.files(EXAMPLE_PROJECT), list(walker.iter_files(EXAMPLE_PROJECT)))
+
+    def test_symbolic_links_to_directories_are_not_followed(self):
+        os.symlink(os.path.join(self.root, 'App'), os.path.join(self.root, 'Link'))
+        files = [f for f, _ in SwiftFilesWalker([]).files(self.root)]
+        self.assertNotIn(os.path.join(self.root, 'Link', 'AppDelegate.swift'), files)
+
+    def test_includes(self):
+        walker = SwiftFilesWalker(['Pods'])
+        self.assertTrue(walker.includes(self.root, self.root))
+        self.assertTrue(walker.includes(self.root, os.path.join(self.root, 'App', 'Views')))
+        self.assertFalse(walker.includes(self.root, os.path.join(self.root, 'Pods', 'Alamofire')))
+        self.assertFalse(walker.includes(self.root, os.path.join(self.root, '.build', 'checkouts')))
+
+
+if __name__ == '__main__':
+    unittest.main()
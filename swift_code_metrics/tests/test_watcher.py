@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from swift_code_metrics._analyzer import Inspector
+from swift_code_metrics._watcher import FileWatcher, InotifyWatcher, PollingWatcher
+
+EXAMPLE_PROJECT = "swift_code_metrics/tests/test_resources/ExampleProject/SwiftCodeMetricsExample"
+
+
+class WatcherTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = self.directory.name
+        os.makedirs(os.path.join(self.source, 'Module'))
+        self.swift_file = os.path.join(self.source, 'Module', 'File.swift')
+        with open(self.swift_file, 'w') as fp:
+            fp.write('import Foundation\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_polling_watcher_detects_changes(self):
+        watcher = PollingWatcher(self.source, [], interval=0.01)
+        new_file = os.path.join(self.source, 'Module', 'New.swift')
+        with open(new_file, 'w') as fp:
+            fp.write('class New {}\n')
+        with open(os.path.join(self.source, 'Module', 'README.md'), 'w') as fp:
+            fp.write('Not watched\n')
+        os.remove(self.swift_file)
+
+        self.assertEqual({new_file, self.swift_file}, watcher._read(timeout=0.01))
+
+    @unittest.skipUnless(InotifyWatcher.is_available(), 'inotify not available')
+    def test_inotify_watcher_detects_changes(self):
+        watcher = InotifyWatcher(self.source, [])
+        try:
+            new_directory = os.path.join(self.source, 'Other')
+            os.makedirs(new_directory)
+            with open(self.swift_file, 'a') as fp:
+                fp.write('class Changed {}\n')
+
+            self.assertEqual({new_directory, self.swift_file}, watcher._read(timeout=1))
+
+            new_file = os.path.join(new_directory, 'New.swift')
+            with open(new_file, 'w') as fp:
+                fp.write('class New {}\n')
+            self.assertEqual({new_file}, watcher._read(timeout=1))
+        finally:
+            watcher.close()
+
+    def test_changes_debounced(self):
+        watcher = PollingWatcher(self.source, [], interval=0.01)
+
+        def burst_of_saves():
+            for i in range(5):
+                with open(self.swift_file, 'a') as fp:
+                    fp.write(f'class Class{i} {{}}\n')
+                time.sleep(0.02)
+
+        thread = threading.Thread(target=burst_of_saves)
+        thread.start()
+        changes = next(watcher.changes(debounce=0.2))
+        thread.join()
+
+        self.assertEqual({self.swift_file}, changes)
+
+    def test_create_watcher(self):
+        watcher = FileWatcher.create(self.source, [])
+        try:
+            self.assertIsInstance(watcher, InotifyWatcher if InotifyWatcher.is_available() else PollingWatcher)
+        finally:
+            watcher.close()
+
+    def test_watcher_without_read_is_not_created(self):
+        class IncompleteWatcher(FileWatcher):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteWatcher(self.source, [])
+
+
+class InspectorUpdateTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, 'Project')
+        self.artifacts = os.path.join(self.directory.name, 'report')
+        shutil.copytree(EXAMPLE_PROJECT, self.source)
+        self.inspector = Inspector(self.source, self.artifacts, ['Test', 'Tests'], [], keep_model=True)
+        self.assertTrue(self.inspector.analyze())
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_update_matches_full_analysis(self):
+        feature_path = os.path.join(self.source, 'BusinessLogic', 'BusinessLogic')
+        modified_file = os.path.join(feature_path, 'AwesomeFeature.swift')
+        with open(modified_file, 'a') as fp:
+            fp.write('\nimport SecretLib\n\nprotocol AddedProtocol {}\n')
+        new_directory = os.path.join(feature_path, 'Feature')
+        os.makedirs(new_directory)
+        with open(os.path.join(new_directory, 'NewFeature.swift'), 'w') as fp:
+            fp.write('import FoundationFramework\n\nclass NewFeature {\n    func run() {}\n}\n')
+        deleted_directory = os.path.join(self.source, 'SwiftCodeMetricsExample')
+        shutil.rmtree(deleted_directory)
+
+        self.assertTrue(self.inspector.update({modified_file, new_directory, deleted_directory}))
+
+        full = Inspector(self.source, self.artifacts, ['Test', 'Tests'], [])
+        self.assertTrue(full.analyze())
+        self.assertEqual(full.report.as_dict, self.inspector.report.as_dict)
+
+
+if __name__ == '__main__':
+    unittest.main()